@@ -1,23 +1,138 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Query, Request, UploadFile, File, Form, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+import anyio
+import asyncio
+import json
+import math
 import os
+import uuid
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from app.services.audio_service import AudioService
+from app.services.audio_processing import AudioStats
+from app.services.audio_operations import OPERATIONS, process_file, save_transcript, transcribe_file, translate_file
+from app.services.live_transcription import LiveTranscriptionSession, parse_sample_rate
+from app.services.job_service import Job, JobManager, QueueFullError
+from app.services.rate_limiter import ProviderRateLimitError
+from app.services.llm_service import LLMService
+from app.services.deck_service import DeckGenerator
+from app.services.pipeline import StageTimeoutError
+from app.services.cache_service import create_deck_memo
+from app.services.renderer import DeckRenderer, create_renderer
+from app.services.uploads import AudioUpload, upload_too_large
+from app.services.transcript_store import TranscriptStore, create_transcript_store
 from app.models.schemas import (
     AudioTranscriptionResponse,
     AudioTranslationResponse,
     AudioProcessingResponse,
-    HealthResponse
+    CacheStatsResponse,
+    DeckRegenerateRequest,
+    DeckResponse,
+    HealthResponse,
+    JobResponse,
+    TranscriptListResponse,
+    TranscriptRecord
 )
 from app.core.config import settings
+from app.core.metrics import stage
+from app.core.responses import file_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Initialize audio service
-audio_service = AudioService()
+# Services are built by init_services(), called from the app lifespan, so
+# importing the API touches no audio device, provider SDK or cache directory
+audio_service: Optional[AudioService] = None
+transcript_store: Optional[TranscriptStore] = None
+job_manager: Optional[JobManager] = None
+renderer: Optional[DeckRenderer] = None
+deck_generator: Optional[DeckGenerator] = None
+
+
+def init_services() -> None:
+    """Build the audio service, job queue and deck pipeline (once per process)."""
+    global audio_service, transcript_store, job_manager, renderer, deck_generator
+    if audio_service is not None:
+        return
+    
+    audio_service = AudioService()
+    
+    # Every transcription/translation result is saved for /transcripts
+    transcript_store = create_transcript_store()
+    
+    # Background job queue (started/stopped by the app lifespan)
+    job_manager = JobManager(audio_service, transcript_store)
+    
+    # Slide deck pipeline (design.md)
+    renderer = create_renderer()
+    deck_generator = DeckGenerator(audio_service, LLMService(), renderer, create_deck_memo())
+
+
+async def close_services() -> None:
+    """Close provider connections and worker processes (app shutdown)."""
+    global audio_service, transcript_store, job_manager, renderer, deck_generator
+    if audio_service is None:
+        return
+    
+    await deck_generator.llm.aclose()
+    renderer.close()
+    await audio_service.aclose()
+    if transcript_store is not None:
+        transcript_store.close()
+    audio_service = transcript_store = job_manager = renderer = deck_generator = None
+
+AUDIO_EXTENSIONS = ['.wav', '.mp3', '.m4a', '.webm', '.ogg', '.flac']
+
+
+def validate_audio_file(file: UploadFile) -> None:
+    """Reject uploads that are neither audio/* nor have an audio extension."""
+    if file.content_type and file.content_type.startswith('audio/'):
+        return
+    if not file.filename or not any(file.filename.lower().endswith(ext) for ext in AUDIO_EXTENSIONS):
+        raise HTTPException(status_code=400, detail="File must be an audio file")
+
+
+async def save_upload(file: UploadFile, filename: str) -> int:
+    """
+    Stream an uploaded file to disk in fixed-size chunks.
+    
+    The size limit is enforced as chunks are written, so memory use stays at
+    one chunk per request and an oversized upload is rejected with 413 as soon
+    as it crosses ``settings.max_file_size``.
+    
+    Args:
+        file: Uploaded file
+        filename: Destination path
+        
+    Returns:
+        Number of bytes written
+    """
+    if file.size is not None and file.size > settings.max_file_size:
+        raise upload_too_large()
+    
+    size = 0
+    try:
+        async with await anyio.open_file(filename, "wb") as buffer:
+            while chunk := await file.read(settings.upload_chunk_size):
+                size += len(chunk)
+                if size > settings.max_file_size:
+                    raise upload_too_large()
+                await buffer.write(chunk)
+    except BaseException:
+        # Don't leave partial uploads behind
+        if os.path.exists(filename):
+            os.remove(filename)
+        raise
+    
+    return size
+
+
+def rate_limit_exception(error: ProviderRateLimitError) -> HTTPException:
+    """429 for a provider rate limit that outlasted our retries."""
+    retry_after = max(math.ceil(error.retry_after or settings.retry_max_delay), 1)
+    return HTTPException(status_code=429, detail=str(error), headers={"Retry-After": str(retry_after)})
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -30,17 +145,33 @@ async def health_check():
     )
 
 
+@router.get("/cache/stats", response_model=CacheStatsResponse)
+async def cache_stats():
+    """Result cache hit/miss counters."""
+    if audio_service.cache is None:
+        return CacheStatsResponse(enabled=False)
+    return CacheStatsResponse(enabled=True, **audio_service.cache.stats())
+
+
 @router.post("/record", response_model=AudioTranscriptionResponse)
 async def record_audio():
     """Record audio from microphone."""
     try:
-        filename, duration = audio_service.record_audio()
-        transcription = audio_service.transcribe_audio(filename)
+        with stage("record"):
+            filename, duration = await run_in_threadpool(audio_service.record_audio)
+        stats = AudioStats()
+        with stage("api_call"):
+            transcription = await audio_service.transcribe_audio_async(filename, stats)
         
-        return AudioTranscriptionResponse(
+        response = AudioTranscriptionResponse(
             transcription=transcription,
-            duration=duration
+            duration=duration,
+            trimmed_seconds=stats.trimmed_seconds
         )
+        await save_transcript(transcript_store, "record", os.path.basename(filename), response)
+        return response
+    except ProviderRateLimitError as e:
+        raise rate_limit_exception(e)
     except Exception as e:
         logger.error(f"Error recording audio: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to record audio: {str(e)}")
@@ -54,32 +185,24 @@ async def transcribe_audio(file: UploadFile = File(...)):
         logger.info(f"Transcribe request: filename={file.filename}, content_type={file.content_type}, size={file.size}")
         
         # Validate file type - be more lenient with content type checking
-        if file.content_type and not file.content_type.startswith('audio/'):
-            # Check file extension as fallback
-            if not file.filename or not any(file.filename.lower().endswith(ext) for ext in ['.wav', '.mp3', '.m4a', '.webm', '.ogg', '.flac']):
-                raise HTTPException(status_code=400, detail="File must be an audio file")
-        elif not file.content_type:
-            # If no content type, check file extension
-            if not file.filename or not any(file.filename.lower().endswith(ext) for ext in ['.wav', '.mp3', '.m4a', '.webm', '.ogg', '.flac']):
-                raise HTTPException(status_code=400, detail="File must be an audio file")
-        
-        # Ensure uploads directory exists
-        os.makedirs(settings.upload_dir, exist_ok=True)
-        
-        # Save uploaded file to uploads directory
-        filename = os.path.join(settings.upload_dir, f"temp_{file.filename}")
-        with open(filename, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        validate_audio_file(file)
         
-        # Transcribe audio
-        transcription = audio_service.transcribe_audio(filename)
-        
-        # Clean up temp file
-        os.remove(filename)
+        # Keep the upload in memory (spooled to a unique temp file only if large)
+        with stage("upload_read"):
+            upload = await AudioUpload.receive(file)
         
-        return AudioTranscriptionResponse(transcription=transcription)
+        # Transcribe audio
+        try:
+            with stage("api_call"):
+                return await transcribe_file(audio_service, upload.source, upload.name, transcript_store)
+        finally:
+            with stage("cleanup"):
+                upload.close()
         
+    except HTTPException:
+        raise
+    except ProviderRateLimitError as e:
+        raise rate_limit_exception(e)
     except Exception as e:
         logger.error(f"Error transcribing audio: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to transcribe audio: {str(e)}")
@@ -90,32 +213,24 @@ async def translate_audio(file: UploadFile = File(...)):
     """Translate uploaded audio file to English."""
     try:
         # Validate file type - be more lenient with content type checking
-        if file.content_type and not file.content_type.startswith('audio/'):
-            # Check file extension as fallback
-            if not file.filename or not any(file.filename.lower().endswith(ext) for ext in ['.wav', '.mp3', '.m4a', '.webm', '.ogg', '.flac']):
-                raise HTTPException(status_code=400, detail="File must be an audio file")
-        elif not file.content_type:
-            # If no content type, check file extension
-            if not file.filename or not any(file.filename.lower().endswith(ext) for ext in ['.wav', '.mp3', '.m4a', '.webm', '.ogg', '.flac']):
-                raise HTTPException(status_code=400, detail="File must be an audio file")
-        
-        # Ensure uploads directory exists
-        os.makedirs(settings.upload_dir, exist_ok=True)
-        
-        # Save uploaded file to uploads directory
-        filename = os.path.join(settings.upload_dir, f"temp_{file.filename}")
-        with open(filename, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        validate_audio_file(file)
         
-        # Translate audio
-        translation = audio_service.translate_audio(filename)
-        
-        # Clean up temp file
-        os.remove(filename)
+        # Keep the upload in memory (spooled to a unique temp file only if large)
+        with stage("upload_read"):
+            upload = await AudioUpload.receive(file)
         
-        return AudioTranslationResponse(translation=translation)
+        # Translate audio
+        try:
+            with stage("api_call"):
+                return await translate_file(audio_service, upload.source, upload.name, transcript_store)
+        finally:
+            with stage("cleanup"):
+                upload.close()
         
+    except HTTPException:
+        raise
+    except ProviderRateLimitError as e:
+        raise rate_limit_exception(e)
     except Exception as e:
         logger.error(f"Error translating audio: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to translate audio: {str(e)}")
@@ -128,101 +243,468 @@ async def process_audio(file: UploadFile = File(...)):
         # Debug logging
         logger.info(f"Received file: filename={file.filename}, content_type={file.content_type}")
         
-        # Simple validation - just check file extension
-        if not file.filename or not any(file.filename.lower().endswith(ext) for ext in ['.wav', '.mp3', '.m4a', '.webm', '.ogg', '.flac']):
-            raise HTTPException(status_code=400, detail="File must be an audio file")
+        validate_audio_file(file)
         
-        # Ensure uploads directory exists
-        os.makedirs(settings.upload_dir, exist_ok=True)
+        # Keep the upload in memory (spooled to a unique temp file only if large)
+        with stage("upload_read"):
+            upload = await AudioUpload.receive(file)
         
-        # Save uploaded file to uploads directory
-        filename = os.path.join(settings.upload_dir, f"temp_{file.filename}")
-        with open(filename, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        # Transcribe and translate concurrently; keep whichever succeeds
+        try:
+            with stage("api_call"):
+                return await process_file(audio_service, upload.source, upload.name, transcript_store)
+        finally:
+            with stage("cleanup"):
+                upload.close()
         
-        # Process audio
-        transcription = audio_service.transcribe_audio(filename)
-        translation = audio_service.translate_audio(filename)
+    except HTTPException:
+        raise
+    except ProviderRateLimitError as e:
+        raise rate_limit_exception(e)
+    except Exception as e:
+        logger.error(f"Error processing audio: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to process audio: {str(e)}")
+
+
+@router.post("/generate-deck", response_model=DeckResponse)
+async def generate_deck(file: UploadFile = File(...), translate: bool = Form(False)):
+    """
+    Generate a slide deck (HTML plus structured slides) from a spoken prompt.
+    
+    Runs the design.md pipeline with independent stages and per-slide work
+    in parallel. Set ``translate`` to build the deck from an English
+    translation of the recording.
+    """
+    try:
+        validate_audio_file(file)
         
-        # Clean up temp file
-        os.remove(filename)
+        with stage("upload_read"):
+            upload = await AudioUpload.receive(file)
         
-        return AudioProcessingResponse(
-            transcription=transcription,
-            translation=translation,
-            filename=file.filename
+        try:
+            with stage("api_call"):
+                return await deck_generator.generate(upload.source, translate, upload.name)
+        finally:
+            with stage("cleanup"):
+                upload.close()
+        
+    except HTTPException:
+        raise
+    except ProviderRateLimitError as e:
+        raise rate_limit_exception(e)
+    except StageTimeoutError as e:
+        logger.error(f"Deck generation timed out: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error generating deck: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to generate deck: {str(e)}")
+
+
+@router.post("/regenerate-deck", response_model=DeckResponse)
+async def regenerate_deck(request: DeckRegenerateRequest):
+    """
+    Rebuild a deck after editing its outline (slide titles and bullets).
+    
+    Model outputs are memoized on their inputs, so only the edited slides
+    are expanded, formatted and annotated again.
+    """
+    try:
+        if not request.slides:
+            raise HTTPException(status_code=400, detail="Deck has no slides")
+        
+        with stage("api_call"):
+            return await deck_generator.regenerate(request)
+        
+    except HTTPException:
+        raise
+    except ProviderRateLimitError as e:
+        raise rate_limit_exception(e)
+    except StageTimeoutError as e:
+        logger.error(f"Deck regeneration timed out: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error regenerating deck: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to regenerate deck: {str(e)}")
+
+
+@router.post("/render-deck")
+async def render_deck(deck: DeckResponse):
+    """
+    Render a deck as an HTML presentation, streamed slide by slide.
+    
+    Press "n" in the page to show the speaker notes.
+    """
+    return StreamingResponse(renderer.stream_html(deck), media_type="text/html; charset=utf-8")
+
+
+@router.post("/render-deck/pdf")
+async def render_deck_pdf(deck: DeckResponse, notes: bool = False):
+    """
+    Render a deck as a PDF, one page per slide.
+    
+    Set ``notes`` to add a speaker notes page after each slide.
+    """
+    try:
+        if not deck.slides:
+            raise HTTPException(status_code=400, detail="Deck has no slides")
+        
+        with stage("render"):
+            pdf = await renderer.render_pdf(deck, notes)
+        
+        filename = "".join(c if c.isalnum() else "_" for c in deck.title)[:60] or "deck"
+        return Response(
+            content=pdf,
+            media_type="application/pdf",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.pdf"'}
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error processing audio: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to process audio: {str(e)}")
+        logger.error(f"Error rendering PDF: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to render PDF: {str(e)}")
 
 
-@router.post("/stream-transcribe", response_model=AudioTranscriptionResponse)
+def sse_event(event: str, data: dict) -> str:
+    """Format a Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/stream-transcribe", response_class=StreamingResponse)
 async def stream_transcribe_audio(file: UploadFile = File(...)):
-    """Stream transcribe uploaded audio file."""
+    """
+    Stream transcribe uploaded audio file as Server-Sent Events.
+    
+    Emits a ``delta`` event for each piece of text as the provider returns it,
+    then a ``done`` event carrying the full transcription (or an ``error``
+    event if the provider call fails part way).
+    """
     try:
         # Validate file type - be more lenient with content type checking
-        if file.content_type and not file.content_type.startswith('audio/'):
-            # Check file extension as fallback
-            if not file.filename or not any(file.filename.lower().endswith(ext) for ext in ['.wav', '.mp3', '.m4a', '.webm', '.ogg', '.flac']):
-                raise HTTPException(status_code=400, detail="File must be an audio file")
-        elif not file.content_type:
-            # If no content type, check file extension
-            if not file.filename or not any(file.filename.lower().endswith(ext) for ext in ['.wav', '.mp3', '.m4a', '.webm', '.ogg', '.flac']):
-                raise HTTPException(status_code=400, detail="File must be an audio file")
-        
-        # Ensure uploads directory exists
-        os.makedirs(settings.upload_dir, exist_ok=True)
+        validate_audio_file(file)
         
-        # Save uploaded file to uploads directory
-        filename = os.path.join(settings.upload_dir, f"temp_{file.filename}")
-        with open(filename, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        # Keep the upload in memory (spooled to a unique temp file only if large)
+        with stage("upload_read"):
+            upload = await AudioUpload.receive(file)
         
-        # Stream transcribe audio
-        transcription = audio_service.stream_transcribe_audio(filename)
+        async def events():
+            transcription = ""
+            stats = AudioStats()
+            try:
+                with stage("api_call"):
+                    async for delta in audio_service.iter_stream_transcribe_audio_async(upload.source, stats, upload.name):
+                        transcription += delta
+                        yield sse_event("delta", {"delta": delta})
+                response = AudioTranscriptionResponse(
+                    transcription=transcription,
+                    duration=stats.duration,
+                    trimmed_seconds=stats.trimmed_seconds
+                )
+                await save_transcript(transcript_store, "stream", upload.name, response)
+                yield sse_event("done", response.model_dump())
+            except Exception as e:
+                logger.error(f"Error stream transcribing audio: {e}")
+                yield sse_event("error", {"detail": f"Failed to stream transcribe audio: {str(e)}"})
+            finally:
+                with stage("cleanup"):
+                    upload.close()
         
-        # Clean up temp file
-        os.remove(filename)
-        
-        return AudioTranscriptionResponse(transcription=transcription)
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error stream transcribing audio: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to stream transcribe audio: {str(e)}")
 
 
+async def run_batch(files: List[UploadFile], operation: str):
+    """
+    Run one operation over many uploads, yielding NDJSON lines as each finishes.
+    
+    Files are read when their turn comes, processed with at most
+    ``settings.batch_parallelism`` running at once, and reported in
+    completion order with their index in the request. A failure only
+    affects its own line.
+    """
+    semaphore = asyncio.Semaphore(max(settings.batch_parallelism, 1))
+    
+    async def run_one(index: int, file: UploadFile) -> dict:
+        line = {"index": index, "filename": file.filename}
+        try:
+            validate_audio_file(file)
+            async with semaphore:
+                with stage("upload_read"):
+                    upload = await AudioUpload.receive(file)
+                try:
+                    with stage("api_call"):
+                        response = await OPERATIONS[operation](audio_service, upload.source, upload.name, transcript_store)
+                finally:
+                    with stage("cleanup"):
+                        upload.close()
+            line["result"] = response.model_dump()
+        except HTTPException as e:
+            line["error"] = e.detail
+        except Exception as e:
+            logger.error(f"Error in batch {operation} for {file.filename}: {e}")
+            line["error"] = str(e)
+        return line
+    
+    tasks = [asyncio.create_task(run_one(i, file)) for i, file in enumerate(files)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield json.dumps(await next_done) + "\n"
+    finally:
+        # Client went away: don't keep spending provider calls
+        for task in tasks:
+            task.cancel()
+
+
+def batch_response(files: List[UploadFile], operation: str) -> StreamingResponse:
+    """Validate a batch request and stream its results as NDJSON."""
+    if not files:
+        raise HTTPException(status_code=400, detail="No files uploaded")
+    if len(files) > settings.max_batch_files:
+        raise HTTPException(status_code=413, detail=f"At most {settings.max_batch_files} files per batch")
+    return StreamingResponse(run_batch(files, operation), media_type="application/x-ndjson")
+
+
+@router.post("/batch/transcribe", response_class=StreamingResponse)
+async def batch_transcribe(files: List[UploadFile] = File(...)):
+    """
+    Transcribe many uploaded files in one request.
+    
+    Streams one JSON line per file as it completes:
+    ``{"index", "filename", "result"}`` or ``{"index", "filename", "error"}``.
+    """
+    return batch_response(files, "transcribe")
+
+
+@router.post("/batch/process", response_class=StreamingResponse)
+async def batch_process(files: List[UploadFile] = File(...)):
+    """
+    Transcribe and translate many uploaded files in one request.
+    
+    Streams one JSON line per file as it completes, like ``/batch/transcribe``.
+    """
+    return batch_response(files, "process")
+
+
+def job_response(job: Job) -> JobResponse:
+    """Build the API view of a job."""
+    return JobResponse(
+        job_id=job.id,
+        status=job.status,
+        operation=job.operation,
+        filename=job.display_name,
+        result=job.result,
+        error=job.error,
+        created_at=job.created_at,
+        completed_at=job.completed_at,
+        queue_depth=job_manager.queue_depth
+    )
+
+
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def submit_job(file: UploadFile = File(...), operation: str = Form("process")):
+    """
+    Queue an audio operation and return immediately.
+    
+    ``operation`` is one of ``transcribe``, ``translate`` or ``process``.
+    Poll ``GET /jobs/{job_id}`` for the result.
+    """
+    try:
+        validate_audio_file(file)
+        if operation not in ("transcribe", "translate", "process"):
+            raise HTTPException(status_code=400, detail=f"Unknown operation: {operation}")
+        
+        # Jobs outlive the request, so each gets its own file
+        job_dir = os.path.join(settings.upload_dir, "jobs")
+        os.makedirs(job_dir, exist_ok=True)
+        filename = os.path.join(job_dir, f"{uuid.uuid4().hex}_{os.path.basename(file.filename or 'audio')}")
+        with stage("temp_write"):
+            await save_upload(file, filename)
+        
+        try:
+            job = job_manager.submit(operation, filename, file.filename)
+        except QueueFullError as e:
+            os.remove(filename)
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+        
+        return job_response(job)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error submitting job: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to submit job: {str(e)}")
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """Get the status and, once finished, the result of a job."""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_response(job)
+
+
+def require_transcript_store() -> TranscriptStore:
+    """The transcript store, or 404 when it is disabled."""
+    if transcript_store is None:
+        raise HTTPException(status_code=404, detail="Transcript store is disabled")
+    return transcript_store
+
+
+@router.get("/transcripts", response_model=TranscriptListResponse)
+async def list_transcripts(limit: int = Query(20, ge=1, le=100), offset: int = Query(0, ge=0)):
+    """List saved transcripts, newest first."""
+    store = require_transcript_store()
+    items, total = await anyio.to_thread.run_sync(store.list, limit, offset)
+    return TranscriptListResponse(
+        items=[TranscriptRecord(**item) for item in items], total=total, limit=limit, offset=offset
+    )
+
+
+@router.get("/transcripts/search", response_model=TranscriptListResponse)
+async def search_transcripts(
+    q: str = Query(..., min_length=1, max_length=500),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0)
+):
+    """
+    Full-text search over saved transcripts, translations and filenames.
+    
+    Every word of ``q`` must match (as a prefix, so "meet" finds
+    "meeting"); results are ranked by relevance and carry a ``snippet``
+    with the matches wrapped in ``**``.
+    """
+    store = require_transcript_store()
+    items, total = await anyio.to_thread.run_sync(store.search, q, limit, offset)
+    return TranscriptListResponse(
+        items=[TranscriptRecord(**item) for item in items], total=total, limit=limit, offset=offset
+    )
+
+
+@router.get("/transcripts/{transcript_id}", response_model=TranscriptRecord)
+async def get_transcript(transcript_id: int):
+    """Get one saved transcript."""
+    store = require_transcript_store()
+    item = await anyio.to_thread.run_sync(store.get, transcript_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail="Transcript not found")
+    return TranscriptRecord(**item)
+
+
+@router.websocket("/ws/transcribe")
+async def live_transcribe(websocket: WebSocket):
+    """
+    Live microphone transcription over WebSocket.
+    
+    Protocol:
+        - client may first send ``{"sample_rate": 16000}`` as text (8000 to
+          48000 Hz); any other value gets ``{"type": "error", ...}`` and the
+          socket is closed
+        - client sends 16-bit little-endian mono PCM as binary messages
+        - server sends ``{"type": "partial", "text": ...}`` as windows complete
+        - client sends ``{"type": "stop"}``; server replies with
+          ``{"type": "final", "text": ...}`` and closes
+    """
+    await websocket.accept()
+    
+    async def send_partial(text: str):
+        await websocket.send_json({"type": "partial", "text": text})
+    
+    session = LiveTranscriptionSession(audio_service.transcribe_samples_async, send_partial)
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            
+            if message.get("bytes"):
+                session.feed(message["bytes"])
+                continue
+            
+            control = json.loads(message.get("text") or "{}")
+            if "sample_rate" in control and not session.committed and not len(session.buffer):
+                try:
+                    sample_rate = parse_sample_rate(control["sample_rate"])
+                except ValueError as e:
+                    await websocket.send_json({"type": "error", "detail": str(e)})
+                    await websocket.close(code=1003)
+                    return
+                session = LiveTranscriptionSession(audio_service.transcribe_samples_async, send_partial, sample_rate)
+            if control.get("type") == "stop":
+                text = await session.finish()
+                await websocket.send_json({"type": "final", "text": text})
+                await websocket.close()
+                return
+    except WebSocketDisconnect:
+        logger.info("Live transcription client disconnected")
+        session.cancel()
+    except Exception as e:
+        logger.error(f"Error in live transcription: {e}")
+        session.cancel()
+        await websocket.send_json({"type": "error", "detail": f"Live transcription failed: {str(e)}"})
+        await websocket.close(code=1011)
+
+
+def recording_path(filename: str) -> str:
+    """
+    Resolve a recording name to its file in the upload directory.
+    
+    Only the base name is used, so a request cannot reach outside the
+    directory where ``/record`` saves.
+    
+    Raises:
+        HTTPException: 404 if there is no such file
+    """
+    path = os.path.join(settings.upload_dir, os.path.basename(filename))
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Audio file not found")
+    return path
+
+
 @router.get("/play/{filename}")
 async def play_audio(filename: str):
     """Play audio file."""
     try:
-        if not os.path.exists(filename):
-            raise HTTPException(status_code=404, detail="Audio file not found")
+        path = recording_path(filename)
         
-        audio_service.play_audio(filename)
+        await run_in_threadpool(audio_service.play_audio, path)
         return {"message": "Audio playback completed"}
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error playing audio: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to play audio: {str(e)}")
 
 
-@router.get("/download/{filename}")
-async def download_audio(filename: str):
-    """Download audio file."""
+@router.api_route("/download/{filename}", methods=["GET", "HEAD"])
+async def download_audio(filename: str, request: Request, inline: bool = False):
+    """
+    Download audio file.
+    
+    Supports ``Range`` requests (206), so players can seek without fetching
+    the whole file, and conditional requests: every response carries a
+    strong ``ETag`` and ``Last-Modified``, and a matching ``If-None-Match``
+    or ``If-Modified-Since`` gets an empty 304. Pass ``inline=true`` to
+    play the file in the browser instead of saving it.
+    """
     try:
-        if not os.path.exists(filename):
-            raise HTTPException(status_code=404, detail="Audio file not found")
+        path = recording_path(filename)
         
-        return FileResponse(
-            path=filename,
-            media_type="audio/wav",
-            filename=filename
-        )
+        return file_response(request.headers, path, filename=None if inline else os.path.basename(path))
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error downloading audio: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to download audio: {str(e)}")
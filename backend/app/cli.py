@@ -33,7 +33,9 @@ def main():
     
     # Transcribe audio
     print("\n--- Streaming Transcription ---")
-    audio_service.stream_transcribe_audio(filename)
+    for delta in audio_service.iter_stream_transcribe_audio(filename):
+        print(delta, end="", flush=True)
+    print()
 
     print("\n--- Transcription ---")
     print(f"Transcription: {audio_service.transcribe_audio(filename)}")
@@ -11,7 +11,7 @@ class Settings(BaseSettings):
     debug: bool = False
     
     # OpenAI Settings
-    openai_api_key: str
+    openai_api_key: Optional[str] = None  # only checked by provider calls, so the app boots without it
     openai_model_transcribe: str = "whisper-1"
     openai_model_stream: str = "gpt-4o-mini-transcribe"
     
@@ -20,9 +20,110 @@ class Settings(BaseSettings):
     audio_channels: int = 1
     audio_filename: str = "recording.wav"
     
+    # Upload Normalization Settings (Whisper works on 16 kHz mono)
+    normalize_audio: bool = True
+    normalize_sample_rate: int = 16000
+    normalize_format: str = "flac"  # "flac" or "wav"
+    
+    # Voice Activity Detection Settings (silence trimmed before upload)
+    vad_enabled: bool = True
+    vad_dynamic_range_db: float = 35.0  # frames within this of the clip's loud frames are speech
+    vad_noise_margin_db: float = 10.0  # ... or this far above the clip's noise floor
+    vad_zcr_threshold: float = 0.25  # zero-crossing rate marking unvoiced speech
+    vad_padding_ms: int = 200  # audio kept around detected speech
+    vad_max_silence_ms: int = 500  # longer pauses are shortened to this
+    vad_min_trim_seconds: float = 1.0  # trims this long are sent even if the re-encoded file is larger
+    
     # File Settings
     upload_dir: str = "uploads"
     max_file_size: int = 25 * 1024 * 1024  # 25MB
+    upload_chunk_size: int = 1024 * 1024  # 1MB read/write buffer per upload
+    upload_spool_max_bytes: int = 8 * 1024 * 1024  # larger uploads are spooled to a temp file
+    
+    # Result Cache Settings
+    cache_enabled: bool = True
+    cache_max_entries: int = 256  # in-memory LRU tier
+    cache_ttl_seconds: int = 7 * 24 * 3600  # 0 disables expiry
+    cache_disk_dir: Optional[str] = None  # set to enable the on-disk tier
+    cache_disk_max_bytes: int = 100 * 1024 * 1024  # 100MB
+    
+    # Long Audio Settings
+    chunk_threshold_bytes: int = 24 * 1024 * 1024  # files above this are split
+    chunk_max_bytes: int = 24 * 1024 * 1024  # provider limit is 25MB
+    chunk_max_seconds: float = 600.0  # longer audio is split too
+    chunk_search_seconds: float = 30.0  # window before each cut searched for silence
+    chunk_workers: int = 4
+    silence_frame_ms: int = 30
+    
+    # Live Transcription Settings (WebSocket, 16-bit mono PCM)
+    live_sample_rate: int = 16000
+    live_window_seconds: float = 15.0  # audio committed per transcription window
+    live_step_seconds: float = 2.0  # how often the partial transcript is refreshed
+    live_buffer_seconds: float = 30.0  # ring buffer capacity
+    
+    # Background Job Settings
+    job_workers: int = 4  # concurrent jobs
+    job_queue_size: int = 100  # submissions beyond this get a 503
+    job_result_ttl_seconds: int = 3600  # 0 keeps finished jobs forever
+    
+    # Batch Settings
+    batch_parallelism: int = 4  # files processed at once per batch request
+    max_batch_files: int = 20
+    
+    # Provider Rate Limit Settings (0 disables a limit)
+    rate_limit_requests_per_minute: int = 0  # opt in: set to the provider's quota
+    rate_limit_audio_seconds_per_minute: int = 0
+    retry_max_attempts: int = 5  # including the first attempt
+    retry_base_delay: float = 1.0  # seconds, doubled per attempt with full jitter
+    retry_max_delay: float = 30.0  # a longer Retry-After fails fast with a 429
+    
+    # Transcription Backend Settings
+    transcription_backend: str = "openai"  # "openai", "local" (in-process Whisper) or "auto"
+    local_model_path: str = "small"  # converted faster-whisper model directory, or a model size
+    local_compute_type: str = "int8"  # CTranslate2 quantization
+    local_cpu_threads: int = 0  # 0 uses CTranslate2's default
+    local_workers: int = 1  # batches decoded in parallel
+    local_language: Optional[str] = None  # None detects the language per clip
+    local_beam_size: int = 1
+    local_batch_size: int = 8  # concurrent short clips decoded in one pass
+    local_batch_window_ms: int = 20  # how long a clip waits for others to batch with
+    local_max_seconds: float = 30.0  # "auto": longer clips go to OpenAI
+    
+    # Deck Generation Settings
+    openai_model_chat: str = "gpt-4o-mini"
+    chat_rate_limit_requests_per_minute: int = 0  # chat model quota, separate from the audio API's; 0 disables
+    deck_min_slides: int = 5
+    deck_max_slides: int = 12
+    deck_slide_parallelism: int = 8  # per-slide LLM calls in flight per stage
+    deck_transcribe_timeout_seconds: float = 300.0
+    deck_stage_timeout_seconds: float = 60.0  # each text stage
+    deck_memo_enabled: bool = True  # reuse stage outputs whose inputs are unchanged
+    deck_memo_max_entries: int = 2048  # in-memory LRU tier
+    deck_memo_ttl_seconds: int = 30 * 24 * 3600  # 0 disables expiry
+    deck_memo_dir: Optional[str] = "deck_cache"  # on-disk tier, kept across restarts
+    deck_memo_max_bytes: int = 50 * 1024 * 1024  # 50MB
+    
+    # Rendering Settings
+    render_cache_entries: int = 4096  # rendered slide fragments/PDF pages, 0 disables
+    render_pdf_workers: int = 0  # PDF layout processes, 0 for one per CPU
+    render_pdf_parallel_min_pages: int = 8  # fewer uncached pages are laid out in-process
+    
+    # Transcript Store Settings (SQLite with a full-text index)
+    transcript_store_enabled: bool = True  # keep every result for /transcripts
+    transcript_db_path: str = "transcripts.db"
+    
+    # Metrics Settings (Prometheus, served at /metrics)
+    metrics_enabled: bool = True
+    
+    # Provider HTTP Connection Pool Settings
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 60.0  # seconds an idle connection stays open
+    http2: bool = True  # needs the h2 package; falls back to HTTP/1.1 without it
+    http_connect_timeout: float = 5.0
+    http_read_timeout: float = 120.0  # long uploads wait this long for the response
+    http_write_timeout: float = 60.0
+    http_pool_timeout: float = 10.0  # wait for a free connection
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,108 @@
+"""
+Prometheus metrics for the API.
+
+Request-level metrics (latency, in-flight requests, bytes in/out, body
+receive time) are recorded by ``MetricsMiddleware``; routes time their own
+stages with ``stage()`` and provider calls are timed by the rate limiter.
+Cache, retry and job queue counters are read from the services at scrape
+time by ``ServiceCollector``, so they cost nothing per request.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from starlette.types import Scope
+
+# ASGI scope of the request being handled, set by MetricsMiddleware
+current_scope: ContextVar[Optional[Scope]] = ContextVar("current_scope", default=None)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+REQUEST_SECONDS = Histogram(
+    "voice_api_request_seconds",
+    "Time to handle a request, including the response body",
+    ["route", "method", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+STAGE_SECONDS = Histogram(
+    "voice_api_stage_seconds",
+    "Time spent in each stage of a request",
+    ["route", "stage"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "voice_api_requests_in_flight",
+    "Requests currently being handled",
+)
+REQUEST_BYTES = Counter(
+    "voice_api_request_bytes",
+    "Request body bytes received",
+    ["route"],
+)
+RESPONSE_BYTES = Counter(
+    "voice_api_response_bytes",
+    "Response body bytes sent",
+    ["route"],
+)
+PROVIDER_CALL_SECONDS = Histogram(
+    "voice_api_provider_call_seconds",
+    "Time for a single provider API attempt",
+    ["outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+PROVIDER_CALLS_IN_FLIGHT = Gauge(
+    "voice_api_provider_calls_in_flight",
+    "Provider API calls currently waiting on a response",
+)
+
+
+def route_label(scope: Optional[Scope]) -> str:
+    """Route template of a request once routing has matched it."""
+    if scope is None:
+        return "none"
+    return getattr(scope.get("route"), "path", None) or "unmatched"
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Time a stage of the current request.
+
+    Args:
+        name: Stage name, e.g. "temp_write", "api_call" or "cleanup"
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.labels(route_label(current_scope.get()), name).observe(time.perf_counter() - start)
+
+
+class ServiceCollector:
+    """Expose the audio service's cache/retry counters and the job queue depth."""
+
+    def __init__(self, audio_service, job_manager):
+        self.audio_service = audio_service
+        self.job_manager = job_manager
+
+    def collect(self):
+        cache = self.audio_service.cache
+        if cache is not None:
+            stats = cache.stats()
+            hits = CounterMetricFamily("voice_api_cache_hits", "Result cache hits", labels=["tier"])
+            hits.add_metric(["memory"], stats["memory_hits"])
+            hits.add_metric(["disk"], stats["disk_hits"])
+            yield hits
+            yield CounterMetricFamily("voice_api_cache_misses", "Result cache misses", value=stats["misses"])
+            yield GaugeMetricFamily("voice_api_cache_entries", "Entries in the in-memory cache tier", value=stats["memory_entries"])
+            yield GaugeMetricFamily("voice_api_cache_disk_bytes", "Bytes in the on-disk cache tier", value=stats["disk_bytes"])
+
+        retries = self.audio_service.backend.retry_stats()
+        if retries:
+            yield CounterMetricFamily("voice_api_provider_retries", "Provider calls retried", value=retries["retries"])
+            yield CounterMetricFamily("voice_api_provider_rate_limited", "Provider 429 responses", value=retries["rate_limited"])
+
+        yield GaugeMetricFamily("voice_api_job_queue_depth", "Jobs waiting for a worker", value=self.job_manager.queue_depth)
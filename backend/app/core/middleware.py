@@ -0,0 +1,143 @@
+import time
+import logging
+from typing import Dict, Optional, Tuple
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    REQUEST_BYTES, REQUEST_SECONDS, REQUESTS_IN_FLIGHT, RESPONSE_BYTES, STAGE_SECONDS,
+    current_scope, route_label
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MaxBodySizeMiddleware:
+    """
+    Reject request bodies larger than ``max_body_size`` with a 413.
+
+    The limit is checked against ``Content-Length`` up front and against the
+    number of bytes actually received while the body streams in, so an
+    oversized upload is cut off as soon as it crosses the limit instead of
+    being buffered in full before the route runs. ``path_limits`` maps path
+    prefixes to their own limits (e.g. batch uploads carrying many files).
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int, path_limits: Optional[Dict[str, int]] = None):
+        self.app = app
+        self.max_body_size = max_body_size
+        self.path_limits = path_limits or {}
+
+    def _limit_for(self, path: str) -> int:
+        for prefix, limit in self.path_limits.items():
+            if path.startswith(prefix):
+                return limit
+        return self.max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        max_body_size = self._limit_for(scope.get("path", ""))
+        response = JSONResponse(
+            status_code=413,
+            content={"error": "Request entity too large",
+                     "detail": f"Upload exceeds {max_body_size} bytes"}
+        )
+
+        headers = dict(scope.get("headers") or [])
+        content_length = headers.get(b"content-length")
+        if content_length and content_length.isdigit() and int(content_length) > max_body_size:
+            await response(scope, receive, send)
+            return
+
+        received = 0
+        rejected = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_body_size:
+                    logger.warning(f"Rejecting request body over {max_body_size} bytes: {scope.get('path')}")
+                    rejected = True
+                    await response(scope, receive, send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            # Once the 413 is out, drop whatever the app tries to send
+            if not rejected:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not rejected:
+                raise
+
+
+class MetricsMiddleware:
+    """
+    Record per-route request metrics for Prometheus.
+
+    Requests are labelled with their route template (e.g.
+    ``/api/v1/jobs/{job_id}``) once routing has matched them, so label
+    cardinality stays bounded. Besides overall latency it tracks requests in
+    flight, body bytes in and out, and the ``body_receive`` stage: time from
+    the first to the last body chunk. The request scope is exposed through
+    ``current_scope`` so routes can time their own stages with
+    ``app.core.metrics.stage``.
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: Tuple[str, ...] = ()):
+        self.app = app
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope.get("path") in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        token = current_scope.set(scope)
+        status = 500
+        bytes_in = bytes_out = 0
+        body_started = body_seconds = None
+        start = time.perf_counter()
+
+        async def measured_receive() -> Message:
+            nonlocal bytes_in, body_started, body_seconds
+            message = await receive()
+            if message["type"] == "http.request":
+                if body_started is None:
+                    body_started = time.perf_counter()
+                bytes_in += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    body_seconds = time.perf_counter() - body_started
+            return message
+
+        async def measured_send(message: Message) -> None:
+            nonlocal status, bytes_out
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                bytes_out += len(message.get("body", b""))
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, measured_receive, measured_send)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            current_scope.reset(token)
+            route = route_label(scope)
+            REQUEST_SECONDS.labels(route, scope["method"], str(status)).observe(time.perf_counter() - start)
+            REQUEST_BYTES.labels(route).inc(bytes_in)
+            RESPONSE_BYTES.labels(route).inc(bytes_out)
+            if body_seconds is not None:
+                STAGE_SECONDS.labels(route, "body_receive").observe(body_seconds)
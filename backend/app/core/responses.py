@@ -0,0 +1,209 @@
+import os
+import mimetypes
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+AUDIO_MEDIA_TYPES = {
+    ".wav": "audio/wav",
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".webm": "audio/webm",
+    ".ogg": "audio/ogg",
+    ".flac": "audio/flac",
+}
+
+
+def media_type_for(path: str) -> str:
+    """Content type from the file extension, with the audio formats we accept first."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in AUDIO_MEDIA_TYPES:
+        return AUDIO_MEDIA_TYPES[extension]
+    return mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+
+def file_etag(stat_result: os.stat_result) -> str:
+    """Strong validator: changes whenever the file is replaced or rewritten."""
+    return f'"{stat_result.st_ino:x}-{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison against an If-None-Match list."""
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def is_not_modified(headers: Headers, etag: str, mtime: float) -> bool:
+    """
+    Whether a conditional GET can be answered with 304.
+
+    If-None-Match takes precedence; If-Modified-Since is only used without it.
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range ``Range`` header.
+
+    Args:
+        header: Header value, e.g. ``bytes=0-1023``, ``bytes=1024-`` or ``bytes=-500``
+        size: File size in bytes
+
+    Returns:
+        Inclusive (start, end), or None to send the whole file (unknown
+        unit, malformed or multiple ranges)
+
+    Raises:
+        ValueError: If the range cannot be satisfied (416)
+    """
+    unit, _, ranges = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+
+    first, _, last = ranges.strip().partition("-")
+    if not (first or last).isdigit() or (last and not last.isdigit()):
+        return None
+
+    if first == "":
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise ValueError(f"Suffix range {header} not satisfiable for {size} bytes")
+        return max(size - suffix, 0), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError(f"Range {header} not satisfiable for {size} bytes")
+    return start, min(end, size - 1)
+
+
+class FileRangeResponse(Response):
+    """
+    Sends a byte range of a file (the whole file by default).
+
+    Uses the ASGI zero-copy extension (``sendfile`` in the server) when the
+    server offers it, or ``pathsend`` for whole files; otherwise the range is
+    streamed in ``chunk_size`` reads in a worker thread.
+    """
+
+    chunk_size = 256 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        start: int,
+        end: int,
+        size: int,
+        status_code: int = 200,
+        headers: Optional[dict] = None,
+        media_type: Optional[str] = None,
+    ):
+        self.path = path
+        self.start = start
+        self.count = max(end - start + 1, 0)
+        self.size = size
+        headers = dict(headers or {})
+        headers["content-length"] = str(self.count)
+        if status_code == 206:
+            headers["content-range"] = f"bytes {start}-{end}/{size}"
+        super().__init__(status_code=status_code, headers=headers, media_type=media_type)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope.get("method") == "HEAD" or self.count == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        extensions = scope.get("extensions") or {}
+        if "http.response.zerocopy" in extensions:
+            with open(self.path, "rb") as file:
+                await send({
+                    "type": "http.response.zerocopy",
+                    "file": file,
+                    "offset": self.start,
+                    "count": self.count,
+                    "more_body": False,
+                })
+            return
+        if "http.response.pathsend" in extensions and self.count == self.size:
+            await send({"type": "http.response.pathsend", "path": os.path.abspath(self.path)})
+            return
+
+        async with await anyio.open_file(self.path, "rb") as file:
+            await file.seek(self.start)
+            remaining = self.count
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        if remaining > 0:
+            # File shrank underneath us; end the body rather than hang the client
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def file_response(headers: Headers, path: str, filename: Optional[str] = None) -> Response:
+    """
+    Serve a file with validators, conditional requests and byte ranges.
+
+    Every response carries a strong ``ETag``, ``Last-Modified`` and
+    ``Accept-Ranges: bytes``. A matching ``If-None-Match`` (or
+    ``If-Modified-Since``) gets an empty 304, a single ``Range`` gets a 206
+    with just those bytes (honouring ``If-Range``), and an unsatisfiable
+    range gets a 416.
+
+    Args:
+        headers: Request headers
+        path: File to send
+        filename: Download name for ``Content-Disposition``, if any
+
+    Returns:
+        The response
+    """
+    stat_result = os.stat(path)
+    size = stat_result.st_size
+    etag = file_etag(stat_result)
+    last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+    response_headers = {
+        "etag": etag,
+        "last-modified": last_modified,
+        "accept-ranges": "bytes",
+        # Revalidate on every use: replays cost a 304 instead of the whole file
+        "cache-control": "no-cache",
+    }
+    if filename:
+        response_headers["content-disposition"] = f"attachment; filename*=utf-8''{quote(filename)}"
+
+    if is_not_modified(headers, etag, stat_result.st_mtime):
+        return Response(status_code=304, headers=response_headers)
+
+    media_type = media_type_for(path)
+    range_header = headers.get("range")
+    if_range = headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() in (etag, last_modified)):
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            return Response(status_code=416, headers={**response_headers, "content-range": f"bytes */{size}"})
+        if byte_range is not None:
+            start, end = byte_range
+            return FileRangeResponse(path, start, end, size, 206, response_headers, media_type)
+
+    return FileRangeResponse(path, 0, size - 1, size, 200, response_headers, media_type)
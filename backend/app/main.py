@@ -1,10 +1,15 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from contextlib import asynccontextmanager
 import logging
 import uvicorn
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
 
 from app.core.config import settings
+from app.core.metrics import ServiceCollector
+from app.core.middleware import MaxBodySizeMiddleware, MetricsMiddleware
+from app.api import routes
 from app.api.routes import router
 
 # Configure logging
@@ -17,12 +22,28 @@ logging.basicConfig(
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("openai").setLevel(logging.WARNING)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the services and start background workers; stop them and close provider connections on shutdown."""
+    routes.init_services()
+    collector = ServiceCollector(routes.audio_service, routes.job_manager)
+    if settings.metrics_enabled:
+        REGISTRY.register(collector)
+    await routes.job_manager.start()
+    yield
+    await routes.job_manager.stop()
+    if settings.metrics_enabled:
+        REGISTRY.unregister(collector)
+    await routes.close_services()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="A voice-to-slide generator API that can record, transcribe, and translate audio",
-    debug=settings.debug
+    debug=settings.debug,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -34,6 +55,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Cut off oversized uploads while the body is still streaming in
+# (allow some headroom for multipart boundaries and headers)
+app.add_middleware(
+    MaxBodySizeMiddleware,
+    max_body_size=settings.max_file_size + 64 * 1024,
+    path_limits={
+        "/api/v1/batch/": settings.max_batch_files * (settings.max_file_size + 64 * 1024),
+    },
+)
+
+# Outermost, so rejected uploads are counted too
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware, exclude_paths=("/metrics",))
+
 # Include API routes
 app.include_router(router, prefix="/api/v1")
 
@@ -48,6 +83,13 @@ async def global_exception_handler(request, exc):
     )
 
 
+if settings.metrics_enabled:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics."""
+        return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 
 class AudioTranscriptionResponse(BaseModel):
@@ -7,20 +7,32 @@ class AudioTranscriptionResponse(BaseModel):
     transcription: str
     duration: Optional[float] = None
     language: Optional[str] = None
+    trimmed_seconds: Optional[float] = None  # silence removed before the API call
+    transcript_id: Optional[int] = None  # id in the transcript store, if saved
 
 
 class AudioTranslationResponse(BaseModel):
     """Response model for audio translation."""
     translation: str
     original_language: Optional[str] = None
+    duration: Optional[float] = None
+    trimmed_seconds: Optional[float] = None  # silence removed before the API call
+    transcript_id: Optional[int] = None  # id in the transcript store, if saved
 
 
 class AudioProcessingResponse(BaseModel):
-    """Response model for complete audio processing."""
-    transcription: str
-    translation: str
+    """Response model for complete audio processing.
+    
+    If only one of transcription/translation fails, the other is still
+    returned and the failure is reported in ``errors``.
+    """
+    transcription: str = ""
+    translation: str = ""
     duration: Optional[float] = None
+    trimmed_seconds: Optional[float] = None  # silence removed before the API call
     filename: str
+    errors: Optional[Dict[str, str]] = None
+    transcript_id: Optional[int] = None  # id in the transcript store, if saved
 
 
 class ErrorResponse(BaseModel):
@@ -34,3 +46,92 @@ class HealthResponse(BaseModel):
     status: str
     app_name: str
     version: str
+
+
+class CacheStatsResponse(BaseModel):
+    """Result cache statistics response model."""
+    enabled: bool
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_entries: int = 0
+    disk_bytes: int = 0
+
+
+class TranscriptRecord(BaseModel):
+    """A stored transcription and/or translation."""
+    id: int
+    created_at: float
+    operation: str  # transcribe, translate, process, stream or record
+    filename: Optional[str] = None
+    transcription: str = ""
+    translation: str = ""
+    language: Optional[str] = None
+    duration: Optional[float] = None
+    snippet: Optional[str] = None  # search results only: matching text, hits wrapped in **
+
+
+class TranscriptListResponse(BaseModel):
+    """One page of stored transcripts."""
+    items: List[TranscriptRecord]
+    total: int
+    limit: int
+    offset: int
+
+
+class JobResponse(BaseModel):
+    """Background job status response model."""
+    job_id: str
+    status: str  # queued, running, completed or failed
+    operation: str
+    filename: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float
+    completed_at: Optional[float] = None
+    queue_depth: Optional[int] = None
+
+
+class SlideImage(BaseModel):
+    """Suggested visual for a slide."""
+    kind: str = "image"  # image, icon or diagram
+    description: str
+    query: str  # search terms for an image or icon library
+
+
+class SlideOutline(BaseModel):
+    """Outliner output for one slide, the input to the per-slide stages."""
+    title: str
+    bullets: List[str] = []
+
+
+class Slide(BaseModel):
+    """One slide of a generated deck."""
+    title: str
+    bullets: List[str] = []
+    content: List[str] = []  # full-sentence body text
+    image: Optional[SlideImage] = None
+    notes: str = ""  # speaker notes
+
+
+class DeckResponse(BaseModel):
+    """Response model for a generated slide deck."""
+    title: str
+    slides: List[Slide]
+    outline: List[SlideOutline] = []  # edit and send to /regenerate-deck
+    transcript: str
+    translated: bool = False
+    style: Optional[Dict[str, str]] = None
+    html: Optional[str] = None
+    duration: Optional[float] = None
+    timings: Optional[Dict[str, Dict[str, float]]] = None  # per-stage start/end, seconds into the run
+    elapsed: Optional[float] = None
+    memo: Optional[Dict[str, Dict[str, int]]] = None  # per-stage model calls reused (hits) and made (misses)
+
+
+class DeckRegenerateRequest(BaseModel):
+    """Request model for rebuilding a deck from an edited outline."""
+    title: str
+    transcript: str
+    slides: List[SlideOutline]
+    translated: bool = False
@@ -0,0 +1,168 @@
+"""
+Audio operations shared by the synchronous routes, the job queue and batch
+processing. Each takes an audio source (an in-memory upload, a spooled or
+saved file) and returns the response model the matching route would return,
+saving the result in the transcript store when one is given.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Union
+
+import anyio
+from pydantic import BaseModel
+
+from app.models.schemas import (
+    AudioTranscriptionResponse,
+    AudioTranslationResponse,
+    AudioProcessingResponse,
+)
+from app.services.audio_processing import AudioSource, AudioStats
+from app.services.audio_service import AudioInput, AudioService
+from app.services.transcript_store import TranscriptStore
+
+logger = logging.getLogger(__name__)
+
+TranscriptResponse = Union[AudioTranscriptionResponse, AudioTranslationResponse, AudioProcessingResponse]
+
+
+async def save_transcript(
+    store: Optional[TranscriptStore], operation: str, filename: str, response: TranscriptResponse
+) -> None:
+    """
+    Save a result in the transcript store and set its ``transcript_id``.
+
+    A failure to save is logged, not raised: the caller still gets its result.
+
+    Args:
+        store: Transcript store (None to skip saving)
+        operation: Operation that produced the result
+        filename: Original recording name
+        response: Result to save
+    """
+    if store is None:
+        return
+    try:
+        response.transcript_id = await anyio.to_thread.run_sync(
+            lambda: store.add(
+                operation,
+                filename,
+                transcription=getattr(response, "transcription", ""),
+                translation=getattr(response, "translation", ""),
+                language=getattr(response, "language", None) or getattr(response, "original_language", None),
+                duration=response.duration,
+            )
+        )
+    except Exception as e:
+        logger.warning(f"Could not save {operation} result for {filename}: {e}")
+
+
+async def transcribe_file(
+    audio_service: AudioService, source: AudioSource, display_name: str, store: Optional[TranscriptStore] = None
+) -> AudioTranscriptionResponse:
+    """
+    Transcribe an uploaded recording.
+
+    Args:
+        audio_service: Service used for the provider call
+        source: Audio bytes, or path to the spooled/saved file
+        display_name: Original upload name
+        store: Transcript store to save the result in, if any
+
+    Returns:
+        Transcription response
+    """
+    stats = AudioStats()
+    transcription = await audio_service.transcribe_audio_async(source, stats, display_name)
+    response = AudioTranscriptionResponse(
+        transcription=transcription,
+        duration=stats.duration,
+        trimmed_seconds=stats.trimmed_seconds
+    )
+    await save_transcript(store, "transcribe", display_name, response)
+    return response
+
+
+async def translate_file(
+    audio_service: AudioService, source: AudioSource, display_name: str, store: Optional[TranscriptStore] = None
+) -> AudioTranslationResponse:
+    """
+    Translate an uploaded recording to English.
+
+    Args:
+        audio_service: Service used for the provider call
+        source: Audio bytes, or path to the spooled/saved file
+        display_name: Original upload name
+        store: Transcript store to save the result in, if any
+
+    Returns:
+        Translation response
+    """
+    stats = AudioStats()
+    translation = await audio_service.translate_audio_async(source, stats, display_name)
+    response = AudioTranslationResponse(
+        translation=translation,
+        duration=stats.duration,
+        trimmed_seconds=stats.trimmed_seconds
+    )
+    await save_transcript(store, "translate", display_name, response)
+    return response
+
+
+async def process_file(
+    audio_service: AudioService, source: AudioSource, display_name: str, store: Optional[TranscriptStore] = None
+) -> AudioProcessingResponse:
+    """
+    Transcribe and translate an uploaded recording concurrently.
+
+    If one of the two calls fails the other is still returned, with the
+    failure reported in ``errors``; only if both fail is an error raised.
+
+    Args:
+        audio_service: Service used for the provider calls
+        source: Audio bytes, or path to the spooled/saved file
+        display_name: Original upload name
+        store: Transcript store to save the result in, if any
+
+    Returns:
+        Processing response
+    """
+    # Both calls share one read, split and preprocessing of the audio, so
+    # only the transcription's stats are reported
+    audio = AudioInput(source, display_name)
+    stats = AudioStats()
+    transcription, translation = await asyncio.gather(
+        audio_service.transcribe_audio_async(audio, stats),
+        audio_service.translate_audio_async(audio),
+        return_exceptions=True
+    )
+
+    if isinstance(transcription, Exception) and isinstance(translation, Exception):
+        raise transcription
+
+    errors = {}
+    if isinstance(transcription, Exception):
+        logger.error(f"Error transcribing audio: {transcription}")
+        errors["transcription"] = str(transcription)
+        transcription = ""
+    if isinstance(translation, Exception):
+        logger.error(f"Error translating audio: {translation}")
+        errors["translation"] = str(translation)
+        translation = ""
+
+    response = AudioProcessingResponse(
+        transcription=transcription,
+        translation=translation,
+        filename=display_name,
+        duration=stats.duration,
+        trimmed_seconds=stats.trimmed_seconds,
+        errors=errors or None
+    )
+    await save_transcript(store, "process", display_name, response)
+    return response
+
+
+OPERATIONS: Dict[str, Callable[[AudioService, AudioSource, str, Optional[TranscriptStore]], Awaitable[BaseModel]]] = {
+    "transcribe": transcribe_file,
+    "translate": translate_file,
+    "process": process_file,
+}
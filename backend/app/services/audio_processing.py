@@ -0,0 +1,660 @@
+"""
+NumPy helpers for decoding, analysing and slicing audio.
+
+Everything here is pure computation on sample arrays so it can run in a
+worker thread without touching the event loop or the OpenAI client.
+"""
+import io
+import os
+import math
+import wave
+import shutil
+import logging
+import subprocess
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from functools import lru_cache
+
+import numpy as np
+
+# SciPy and soundfile are imported where they are used: scipy.signal alone
+# takes longer to import than the rest of the app
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _soundfile():
+    """The soundfile module, or None without it (FLAC output needs libsndfile; WAV is used instead)."""
+    try:
+        import soundfile
+    except (ImportError, OSError):
+        return None
+    return soundfile
+
+
+# Audio input accepted by AudioService: a file path, the encoded bytes, or a
+# readable binary file-like object (read from the start)
+AudioSource = Union[str, bytes, BinaryIO]
+
+
+def source_name(source: AudioSource, name: Optional[str] = None) -> str:
+    """Filename to report for a source; the extension tells the provider the format."""
+    if name:
+        return os.path.basename(name)
+    if isinstance(source, str):
+        return os.path.basename(source)
+    file_name = getattr(source, "name", None)
+    if isinstance(file_name, str):
+        return os.path.basename(file_name)
+    return "audio.wav"
+
+
+def source_size(source: AudioSource) -> int:
+    """Size of a source in bytes."""
+    if isinstance(source, str):
+        return os.path.getsize(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return len(source)
+    position = source.tell()
+    size = source.seek(0, os.SEEK_END)
+    source.seek(position)
+    return size
+
+
+def read_source(source: AudioSource) -> bytes:
+    """
+    Read a source's encoded bytes.
+
+    Bytes are returned as they are and paths are read in one pass; file-like
+    objects are read from the start, so a single object must not be read by
+    two calls at once.
+
+    Args:
+        source: Path, bytes or binary file-like object
+
+    Returns:
+        Encoded audio bytes
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return f.read()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    source.seek(0)
+    return source.read()
+
+
+class PreparedAudio(NamedTuple):
+    """Audio ready to upload plus what preprocessing learned about it."""
+    audio_file: Tuple[str, bytes]
+    duration: Optional[float] = None  # seconds before trimming
+    trimmed_seconds: float = 0.0
+
+    @property
+    def speech_seconds(self) -> float:
+        """Seconds of audio that will be sent (estimated from size if unknown)."""
+        if self.duration is not None:
+            return max(self.duration - self.trimmed_seconds, 0.0)
+        # Unknown format: assume roughly 16 kHz 16-bit mono
+        return len(self.audio_file[1]) / 32000.0
+
+
+class AudioStats:
+    """Accumulates preprocessing metadata over one or more provider calls."""
+
+    def __init__(self):
+        self.duration: Optional[float] = None
+        self.trimmed_seconds: Optional[float] = None
+
+    def add(self, prepared: PreparedAudio) -> None:
+        self.record(prepared.duration, prepared.trimmed_seconds)
+
+    def record(self, duration: Optional[float], trimmed_seconds: float = 0.0) -> None:
+        """Add one call's duration and trimmed silence (ignored if the duration is unknown)."""
+        if duration is None:
+            return
+        self.duration = (self.duration or 0.0) + duration
+        self.trimmed_seconds = (self.trimmed_seconds or 0.0) + trimmed_seconds
+
+
+# Sample rate used when a compressed format has to be decoded through ffmpeg
+DECODE_SAMPLE_RATE = 16000
+
+
+def to_float32(data: np.ndarray) -> np.ndarray:
+    """
+    Convert integer PCM samples to float32 in [-1, 1].
+
+    Args:
+        data: Sample array as returned by ``scipy.io.wavfile.read``
+
+    Returns:
+        float32 sample array
+    """
+    # Scale in place so the conversion allocates only the float32 result
+    if data.dtype == np.int16:
+        samples = data.astype(np.float32)
+        samples /= 32767.0
+        return samples
+    if data.dtype == np.int32:
+        samples = data.astype(np.float32)
+        samples /= 2147483647.0
+        return samples
+    if data.dtype == np.uint8:
+        samples = data.astype(np.float32)
+        samples -= 128.0
+        samples /= 128.0
+        return samples
+    return data.astype(np.float32, copy=False)
+
+
+def to_mono(samples: np.ndarray) -> np.ndarray:
+    """Average all channels of a (frames, channels) array into one."""
+    if samples.ndim == 1:
+        return samples
+    return samples.mean(axis=1, dtype=np.float32)
+
+
+class WavReader:
+    """
+    A WAV file memory-mapped for block-wise reading.
+
+    The samples stay in the page cache instead of being read into memory, and
+    ``read``/``blocks`` convert only the requested frames to float32, so
+    memory use does not grow with the length of the recording. Formats SciPy
+    cannot map (24-bit PCM) are read into memory instead.
+
+    Args:
+        filename: Path to WAV file
+    """
+
+    def __init__(self, filename: str):
+        from scipy.io import wavfile
+
+        self.filename = filename
+        try:
+            self.sample_rate, self._data = wavfile.read(filename, mmap=True)
+        except ValueError:
+            logger.debug(f"Cannot memory-map {filename}, reading it into memory")
+            self.sample_rate, self._data = wavfile.read(filename)
+
+    @property
+    def frames(self) -> int:
+        return len(self._data)
+
+    @property
+    def channels(self) -> int:
+        return 1 if self._data.ndim == 1 else self._data.shape[1]
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.sample_rate if self.sample_rate else 0.0
+
+    def read(self, start: int = 0, frames: Optional[int] = None) -> np.ndarray:
+        """
+        Read frames as float32 in [-1, 1].
+
+        Args:
+            start: First frame
+            frames: Number of frames (None for the rest of the file); fewer
+                are returned at the end of the file
+
+        Returns:
+            float32 array shaped (frames,) or (frames, channels)
+        """
+        end = self.frames if frames is None else min(start + frames, self.frames)
+        data = np.asarray(self._data[start:end])
+        if data.dtype == np.float32:
+            # Copy float files too: the mapping is read-only and closes with the reader
+            return np.array(data)
+        return to_float32(data)
+
+    def blocks(self, block_frames: int, mono: bool = False) -> Iterator[np.ndarray]:
+        """
+        Iterate over the file in float32 blocks of ``block_frames`` frames.
+
+        Args:
+            block_frames: Frames per block (the last block may be shorter)
+            mono: Downmix each block to one channel
+        """
+        for start in range(0, self.frames, block_frames):
+            block = self.read(start, block_frames)
+            yield to_mono(block) if mono else block
+
+    def close(self) -> None:
+        """Release the mapping."""
+        self._data = np.empty(0, dtype=np.int16)
+
+    def __enter__(self) -> "WavReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_audio(filename: str) -> Tuple[int, np.ndarray]:
+    """
+    Decode an audio file to float32 samples.
+
+    WAV files are memory-mapped and converted straight to float32, without
+    an intermediate integer copy. Other formats are decoded to mono 16 kHz
+    PCM through ffmpeg, which must be on the PATH.
+
+    Args:
+        filename: Path to audio file
+
+    Returns:
+        Tuple of (sample_rate, samples) with samples shaped (frames,) or
+        (frames, channels)
+    """
+    if filename.lower().endswith(".wav"):
+        with WavReader(filename) as reader:
+            return reader.sample_rate, reader.read()
+    return _ffmpeg_decode(os.path.basename(filename), filename)
+
+
+def decode_audio(content: bytes, name: str) -> Tuple[int, np.ndarray]:
+    """
+    Decode in-memory audio to float32 samples.
+
+    Same as ``load_audio`` but for bytes; the format is taken from ``name``.
+
+    Args:
+        content: Encoded audio bytes
+        name: Original filename
+
+    Returns:
+        Tuple of (sample_rate, samples)
+    """
+    if name.lower().endswith(".wav"):
+        from scipy.io import wavfile
+        rate, data = wavfile.read(io.BytesIO(content))
+        return rate, to_float32(data)
+    return _ffmpeg_decode(name, "pipe:0", content)
+
+
+def probe_duration(content: bytes, name: str) -> Optional[float]:
+    """
+    Read the duration of in-memory audio from its header, without decoding.
+
+    Args:
+        content: Encoded audio bytes
+        name: Original filename
+
+    Returns:
+        Duration in seconds, or None if the format does not record it (or
+        cannot be read without ffmpeg), e.g. browser webm/opus recordings
+    """
+    soundfile = _soundfile()
+    if soundfile is not None:
+        try:
+            info = soundfile.info(io.BytesIO(content))
+            if info.samplerate > 0 and info.frames > 0:
+                return info.frames / info.samplerate
+        except Exception:
+            pass
+    if name.lower().endswith(".wav"):
+        try:
+            with wave.open(io.BytesIO(content)) as wav:
+                return wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError):
+            pass
+    return None
+
+
+def _ffmpeg_decode(name: str, source: str, content: bytes = None) -> Tuple[int, np.ndarray]:
+    """Decode ``source`` (a path, or stdin fed with ``content``) to mono PCM via ffmpeg."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise ValueError(f"Cannot decode {name}: ffmpeg is not installed")
+
+    result = subprocess.run(
+        [ffmpeg, "-nostdin", "-v", "error", "-i", source,
+         "-f", "s16le", "-ac", "1", "-ar", str(DECODE_SAMPLE_RATE), "-"],
+        input=content,
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise ValueError(f"ffmpeg failed to decode {name}: {result.stderr.decode(errors='replace').strip()}")
+
+    return DECODE_SAMPLE_RATE, to_float32(np.frombuffer(result.stdout, dtype=np.int16))
+
+
+def resample(samples: np.ndarray, sample_rate: int, target_rate: int) -> np.ndarray:
+    """
+    Resample with a polyphase FIR filter.
+
+    Args:
+        samples: float32 samples, time on axis 0
+        sample_rate: Current sample rate in Hz
+        target_rate: Desired sample rate in Hz
+
+    Returns:
+        float32 samples at ``target_rate``
+    """
+    if sample_rate == target_rate:
+        return samples
+    from scipy.signal import resample_poly
+    divisor = math.gcd(sample_rate, target_rate)
+    resampled = resample_poly(samples, target_rate // divisor, sample_rate // divisor, axis=0)
+    return resampled.astype(np.float32, copy=False)
+
+
+def to_int16(samples: np.ndarray) -> np.ndarray:
+    """Convert float32 samples in [-1, 1] to 16-bit PCM."""
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+def encode_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    """
+    Encode float32 samples as 16-bit PCM WAV bytes.
+
+    Args:
+        samples: float32 sample array
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        WAV file contents
+    """
+    from scipy.io import wavfile
+    buffer = io.BytesIO()
+    wavfile.write(buffer, sample_rate, to_int16(samples))
+    return buffer.getvalue()
+
+
+def encode_flac(samples: np.ndarray, sample_rate: int) -> bytes:
+    """
+    Encode float32 samples as 16-bit FLAC bytes.
+
+    Args:
+        samples: float32 sample array
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        FLAC file contents
+    """
+    soundfile = _soundfile()
+    if soundfile is None:
+        raise ValueError("FLAC encoding requires the soundfile package")
+    buffer = io.BytesIO()
+    soundfile.write(buffer, np.clip(samples, -1.0, 1.0), sample_rate, format="FLAC", subtype="PCM_16")
+    return buffer.getvalue()
+
+
+def encode_audio(samples: np.ndarray, sample_rate: int, name: str, audio_format: str = "flac") -> Tuple[str, bytes]:
+    """
+    Encode samples losslessly, renaming the file to match the format.
+
+    Args:
+        samples: float32 samples
+        sample_rate: Sample rate in Hz
+        name: Original filename
+        audio_format: "flac", or "wav" for 16-bit PCM (also used when
+            soundfile is not installed)
+
+    Returns:
+        Tuple of (new filename, encoded bytes)
+    """
+    base = os.path.splitext(name)[0]
+    if audio_format == "flac" and _soundfile() is not None:
+        return f"{base}.flac", encode_flac(samples, sample_rate)
+    return f"{base}.wav", encode_wav(samples, sample_rate)
+
+
+def frame_energy_db(samples: np.ndarray, sample_rate: int, frame_ms: int = 30) -> np.ndarray:
+    """
+    Compute per-frame RMS energy in dBFS.
+
+    Args:
+        samples: float32 mono samples
+        sample_rate: Sample rate in Hz
+        frame_ms: Frame length in milliseconds
+
+    Returns:
+        Array with one energy value per full frame
+    """
+    frame_len = max(int(sample_rate * frame_ms / 1000), 1)
+    n_frames = len(samples) // frame_len
+    if n_frames == 0:
+        return np.empty(0, dtype=np.float32)
+
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    return 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+
+def zero_crossing_rate(samples: np.ndarray, sample_rate: int, frame_ms: int = 30) -> np.ndarray:
+    """
+    Compute the fraction of sign changes per frame.
+
+    Args:
+        samples: float32 mono samples
+        sample_rate: Sample rate in Hz
+        frame_ms: Frame length in milliseconds
+
+    Returns:
+        Array with one rate in [0, 1] per full frame
+    """
+    frame_len = max(int(sample_rate * frame_ms / 1000), 1)
+    n_frames = len(samples) // frame_len
+    if n_frames == 0:
+        return np.empty(0, dtype=np.float32)
+
+    signs = np.signbit(samples[:n_frames * frame_len]).reshape(n_frames, frame_len)
+    return np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / float(frame_len)
+
+
+# Frames quieter than this are digital silence whatever the clip's level
+SILENCE_FLOOR_DB = -80.0
+
+
+def detect_speech(
+    samples: np.ndarray,
+    sample_rate: int,
+    frame_ms: int = 30,
+    dynamic_range_db: float = 35.0,
+    noise_margin_db: float = 10.0,
+    zcr_threshold: float = 0.25,
+    padding_ms: int = 200,
+) -> np.ndarray:
+    """
+    Classify frames as speech with an energy / zero-crossing detector.
+
+    The threshold follows the recording level: a frame is voiced if it is
+    within ``dynamic_range_db`` of the clip's loud frames (98th percentile of
+    frame energy) or ``noise_margin_db`` above its noise floor (10th
+    percentile), so quiet but clean recordings are not mistaken for
+    silence. Quieter frames (down to 10 dB below) still count when their
+    zero-crossing rate is high, which catches unvoiced consonants like "s"
+    and "f". Neither kind of frame may be within ``noise_margin_db / 2`` of
+    the noise floor, where broadband hiss would pass both tests. Detections are then widened by ``padding_ms`` on both sides so
+    word edges survive.
+
+    Args:
+        samples: float32 mono samples
+        sample_rate: Sample rate in Hz
+        frame_ms: Frame length in milliseconds
+        dynamic_range_db: How far below the clip's loud frames speech can be
+        noise_margin_db: How far above the clip's noise floor speech starts
+        zcr_threshold: Zero-crossing rate marking unvoiced speech
+        padding_ms: Hangover kept around detected speech
+
+    Returns:
+        Boolean mask with one entry per full frame
+    """
+    energy = frame_energy_db(samples, sample_rate, frame_ms)
+    zcr = zero_crossing_rate(samples, sample_rate, frame_ms)
+    if len(energy) == 0:
+        return np.zeros(0, dtype=bool)
+
+    noise_floor, loud = np.percentile(energy, [10, 98])
+    energy_threshold_db = max(min(noise_floor + noise_margin_db, loud - dynamic_range_db), SILENCE_FLOOR_DB)
+    # Hiss crosses zero as often as an "s" does, so neither branch may reach
+    # down into the noise floor itself. A clip without a quieter stretch has
+    # no floor to measure and is all signal.
+    has_floor = loud - noise_floor > noise_margin_db / 2
+    above_noise_db = max(noise_floor + noise_margin_db / 2, SILENCE_FLOOR_DB) if has_floor else SILENCE_FLOOR_DB
+    speech = (energy > max(energy_threshold_db, above_noise_db)) | (
+        (energy > max(energy_threshold_db - 10.0, above_noise_db)) & (zcr > zcr_threshold)
+    )
+
+    pad = int(padding_ms / frame_ms)
+    if pad > 0 and speech.any():
+        speech = np.convolve(speech, np.ones(2 * pad + 1), mode="same") > 0
+    return speech
+
+
+def trim_silence(
+    samples: np.ndarray,
+    sample_rate: int,
+    frame_ms: int = 30,
+    dynamic_range_db: float = 35.0,
+    noise_margin_db: float = 10.0,
+    zcr_threshold: float = 0.25,
+    padding_ms: int = 200,
+    max_silence_ms: int = 500,
+) -> np.ndarray:
+    """
+    Drop leading/trailing silence and shorten long pauses.
+
+    Args:
+        samples: float32 mono samples
+        sample_rate: Sample rate in Hz
+        frame_ms: Frame length in milliseconds
+        dynamic_range_db: See ``detect_speech``
+        noise_margin_db: See ``detect_speech``
+        zcr_threshold: See ``detect_speech``
+        padding_ms: See ``detect_speech``
+        max_silence_ms: Internal pauses longer than this are cut down to it
+
+    Returns:
+        Trimmed samples (empty if no speech was found)
+    """
+    frame_len = max(int(sample_rate * frame_ms / 1000), 1)
+    speech = detect_speech(
+        samples, sample_rate, frame_ms, dynamic_range_db, noise_margin_db, zcr_threshold, padding_ms
+    )
+    if not speech.any():
+        return samples[:0]
+
+    # Keep every speech frame plus the first max_silence frames of each pause
+    silence = ~speech
+    run_id = np.cumsum(np.concatenate(([True], silence[1:] != silence[:-1])))
+    run_start = np.flatnonzero(np.concatenate(([True], silence[1:] != silence[:-1])))
+    position_in_run = np.arange(len(silence)) - run_start[run_id - 1]
+    keep = speech | (position_in_run < int(max_silence_ms / frame_ms))
+
+    # Leading and trailing silence go entirely
+    voiced = np.flatnonzero(speech)
+    keep[:voiced[0]] = False
+    keep[voiced[-1] + 1:] = False
+
+    sample_keep = np.repeat(keep, frame_len)
+    # Samples past the last full frame follow the last frame's decision
+    tail = len(samples) - len(sample_keep)
+    if tail:
+        sample_keep = np.concatenate((sample_keep, np.full(tail, keep[-1])))
+    return samples[sample_keep]
+
+
+def find_split_points(
+    samples: np.ndarray,
+    sample_rate: int,
+    max_chunk_samples: int,
+    search_samples: int,
+    frame_ms: int = 30,
+) -> List[int]:
+    """
+    Pick chunk boundaries that fall in the quietest part of the audio.
+
+    For each chunk the cut is placed at the lowest-energy frame inside the
+    last ``search_samples`` before the hard ``max_chunk_samples`` limit, so
+    chunks never exceed the limit and usually end in a pause.
+
+    Args:
+        samples: float32 mono samples
+        sample_rate: Sample rate in Hz
+        max_chunk_samples: Upper bound on chunk length in samples
+        search_samples: How far back from the limit to look for silence
+        frame_ms: Frame length used for the energy analysis
+
+    Returns:
+        Sample offsets of each chunk start, beginning with 0
+    """
+    total = len(samples)
+    if total <= max_chunk_samples:
+        return [0]
+
+    frame_len = max(int(sample_rate * frame_ms / 1000), 1)
+    energy = frame_energy_db(samples, sample_rate, frame_ms)
+    search_frames = max(search_samples // frame_len, 1)
+
+    starts = [0]
+    start = 0
+    while total - start > max_chunk_samples:
+        limit_frame = (start + max_chunk_samples) // frame_len
+        window_start = max(limit_frame - search_frames, start // frame_len + 1)
+        window = energy[window_start:limit_frame]
+        if len(window):
+            cut = (window_start + int(np.argmin(window))) * frame_len
+        else:
+            cut = start + max_chunk_samples
+        starts.append(cut)
+        start = cut
+
+    return starts
+
+
+def split_audio(
+    samples: np.ndarray,
+    sample_rate: int,
+    max_chunk_seconds: float,
+    max_chunk_bytes: int,
+    search_seconds: float,
+    frame_ms: int = 30,
+) -> List[bytes]:
+    """
+    Split mono samples into WAV-encoded chunks bounded by duration and size.
+
+    Args:
+        samples: float32 mono samples
+        sample_rate: Sample rate in Hz
+        max_chunk_seconds: Maximum chunk duration
+        max_chunk_bytes: Maximum encoded chunk size (16-bit PCM WAV)
+        search_seconds: Window before each limit searched for silence
+        frame_ms: Frame length used for the energy analysis
+
+    Returns:
+        List of WAV-encoded chunks in order
+    """
+    max_samples = min(
+        int(max_chunk_seconds * sample_rate),
+        (max_chunk_bytes - 44) // 2,  # 16-bit mono plus WAV header
+    )
+    search_samples = min(int(search_seconds * sample_rate), max_samples // 2)
+
+    starts = find_split_points(samples, sample_rate, max_samples, search_samples, frame_ms)
+    ends = starts[1:] + [len(samples)]
+    return [encode_wav(samples[start:end], sample_rate) for start, end in zip(starts, ends)]
+
+
+def merge_transcripts(parts: List[str]) -> str:
+    """
+    Join chunk transcripts in order.
+
+    Chunks are cut back to back, without overlap, so nothing is removed at
+    the seams: a word on both sides of a cut was really said twice.
+
+    Args:
+        parts: Transcripts in chunk order
+
+    Returns:
+        Merged transcript
+    """
+    return " ".join(word for part in parts for word in part.split())
+
+
+def duration_seconds(samples: np.ndarray, sample_rate: int) -> float:
+    """Return the duration of a sample array in seconds."""
+    return len(samples) / float(sample_rate) if sample_rate else 0.0
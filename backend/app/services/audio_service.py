@@ -1,23 +1,125 @@
 import os
+import json
+import wave
+import asyncio
 import logging
-from typing import Optional, Tuple
-import sounddevice as sd
+import threading
+from typing import AsyncIterator, Awaitable, Callable, Iterator, List, NamedTuple, Optional, Tuple, Union
+import anyio
 import numpy as np
-from scipy.io.wavfile import write, read
-from openai import OpenAI
 
 from app.core.config import settings
+from app.services.cache_service import ResultCache, create_result_cache
+from app.services.audio_processing import (
+    AudioSource, AudioStats, PreparedAudio, WavReader, decode_audio, duration_seconds, encode_audio, encode_wav,
+    merge_transcripts, probe_duration, read_source, resample, source_name, split_audio, to_int16, to_mono,
+    trim_silence
+)
+from app.services.ring_buffer import RingBuffer
+from app.services.transcription_backends import TranscriptionBackend, create_transcription_backend
 
 logger = logging.getLogger(__name__)
 
+TRANSCRIPTION_PROMPT = "The following conversation is a test conversation."
+
+# Lowest bitrate assumed for uploads (8 kbit/s, below any practical speech
+# codec): smaller files cannot be longer than chunk_max_seconds, so their
+# length is not checked
+MIN_BYTES_PER_SECOND = 1000
+
+
+def _sounddevice():
+    """
+    Import sounddevice on first use.
+    
+    It loads PortAudio at import, which fails on hosts without audio
+    devices; only recording and playback need it.
+    
+    Raises:
+        RuntimeError: If PortAudio is not available
+    """
+    try:
+        import sounddevice
+    except OSError as e:
+        raise RuntimeError(f"Audio devices are not available on this host: {e}") from e
+    return sounddevice
+
+
+class CachedResult(NamedTuple):
+    """A cached provider result with the preprocessing stats of the original call."""
+    text: str
+    duration: Optional[float] = None
+    trimmed_seconds: float = 0.0
+    
+    def encode(self) -> str:
+        return json.dumps(self._asdict())
+    
+    @classmethod
+    def decode(cls, value: str) -> "CachedResult":
+        try:
+            entry = json.loads(value)
+        except ValueError:
+            entry = None
+        if isinstance(entry, dict) and isinstance(entry.get("text"), str):
+            return cls(entry["text"], entry.get("duration"), entry.get("trimmed_seconds") or 0.0)
+        # Entries written before stats were cached hold just the text
+        return cls(value)
+
+
+class AudioPart:
+    """
+    Audio sent in one provider call, preprocessed at most once.
+    
+    Transcription and translation of the same upload share their parts, so
+    decoding, resampling, the VAD and re-encoding run once for both.
+    
+    Args:
+        audio_file: Tuple of (name, audio bytes)
+        decoded: (sample_rate, mono samples) if already decoded, so
+            preprocessing does not decode again
+    """
+    
+    def __init__(self, audio_file: Tuple[str, bytes], decoded: Optional[Tuple[int, np.ndarray]] = None):
+        self.audio_file = audio_file
+        self.decoded = decoded
+        self.prepared: Optional[PreparedAudio] = None
+        self.lock = asyncio.Lock()
+
+
+class AudioInput:
+    """
+    Audio to transcribe or translate, cut into parts on first use.
+    
+    The source is read and split (one part, or chunks of long audio) once;
+    pass the same AudioInput to ``transcribe_audio_async`` and
+    ``translate_audio_async`` to share that work and the preprocessing of
+    each part, as /process does.
+    
+    Args:
+        source: Path to audio file, audio bytes or binary file object
+        name: Original filename (for the format), if source is not a path
+    """
+    
+    def __init__(self, source: AudioSource, name: Optional[str] = None):
+        self.source = source
+        self.name = source_name(source, name)
+        self.parts: Optional[List[AudioPart]] = None
+        self.lock = asyncio.Lock()
+
 
 class AudioService:
     """Service for audio recording, playback, and processing."""
     
     def __init__(self):
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        # Speech-to-text engine (OpenAI, local Whisper or both), see settings.transcription_backend
+        self.backend: TranscriptionBackend = create_transcription_backend()
         self.sample_rate = settings.audio_sample_rate
         self.channels = settings.audio_channels
+        self.cache = create_result_cache()
+    
+    async def aclose(self) -> None:
+        """Close the backend's connections (called on app shutdown)."""
+        await self.backend.aclose()
         
     def record_audio(self, filename: str = None) -> Tuple[str, float]:
         """
@@ -41,148 +143,640 @@ class AudioService:
             
         logger.info(f"Starting audio recording: {filename}")
         
-        # Record audio in chunks to allow for real-time stopping
-        recording_data = []
-        recording = False
+        # The audio callback only copies frames into a preallocated ring
+        # buffer; a writer thread drains it to the WAV file as int16, so
+        # memory stays flat however long the recording runs.
+        sd = _sounddevice()
+        buffer = RingBuffer(self.sample_rate * 2, channels=self.channels, growable=True)
+        lock = threading.Lock()
+        data_ready = threading.Event()
+        stopped = threading.Event()
+        frames_written = 0
         
         def audio_callback(indata, frames, time, status):
             if status:
                 logger.warning(f"Audio status: {status}")
-            if recording:
-                recording_data.append(indata.copy())
-        
-        # Start recording stream
-        stream = sd.InputStream(
-            samplerate=self.sample_rate, 
-            channels=self.channels, 
-            callback=audio_callback
-        )
-        stream.start()
-        recording = True
-        
-        try:
-            input("Press Enter to stop recording...")
-        except KeyboardInterrupt:
-            pass
+            with lock:
+                buffer.write(indata[:, 0] if self.channels == 1 else indata)
+            data_ready.set()
         
-        # Stop recording
-        recording = False
-        stream.stop()
-        stream.close()
-        
-        # Process recorded audio
-        if recording_data:
-            audio_data = np.concatenate(recording_data, axis=0)
-            duration = len(audio_data) / self.sample_rate
+        # wave patches the header sizes when the file is closed
+        with wave.open(filename, "wb") as wav_file:
+            wav_file.setnchannels(self.channels)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(self.sample_rate)
+            
+            def drain():
+                nonlocal frames_written
+                with lock:
+                    block = buffer.consume(len(buffer))
+                if len(block):
+                    wav_file.writeframes(to_int16(block).tobytes())
+                    frames_written += len(block)
+            
+            def writer():
+                while not stopped.is_set():
+                    data_ready.wait(timeout=0.1)
+                    data_ready.clear()
+                    drain()
+                drain()
             
-            # Convert to int16 for proper WAV format
-            audio_data = (audio_data * 32767).astype(np.int16)
+            writer_thread = threading.Thread(target=writer, name="recording-writer", daemon=True)
+            writer_thread.start()
             
-            # Save the audio file
-            write(filename, self.sample_rate, audio_data)
-            logger.info(f"Audio saved: {filename} ({duration:.2f}s)")
+            # Start recording stream
+            stream = sd.InputStream(
+                samplerate=self.sample_rate, 
+                channels=self.channels, 
+                callback=audio_callback
+            )
+            stream.start()
             
-            return filename, duration
-        else:
+            try:
+                input("Press Enter to stop recording...")
+            except KeyboardInterrupt:
+                pass
+            finally:
+                # Stop recording
+                stream.stop()
+                stream.close()
+                stopped.set()
+                writer_thread.join()
+        
+        if frames_written == 0:
+            os.remove(filename)
             raise ValueError("No audio data recorded")
+        
+        duration = frames_written / self.sample_rate
+        logger.info(f"Audio saved: {filename} ({duration:.2f}s)")
+        
+        return filename, duration
     
     def play_audio(self, filename: str) -> None:
         """
         Play audio file.
         
+        The WAV file is memory-mapped and fed to the output stream one block
+        at a time, converted to float32 in the audio callback, so playback
+        starts at once and memory use is the same for any length of file.
+        
         Args:
             filename: Path to audio file
         """
         logger.info(f"Playing audio: {filename}")
         
-        fs, data = read(filename)
+        sd = _sounddevice()
+        with WavReader(filename) as reader:
+            finished = threading.Event()
+            position = 0
+            
+            def audio_callback(outdata, frames, time, status):
+                nonlocal position
+                if status:
+                    logger.warning(f"Audio status: {status}")
+                block = reader.read(position, frames)
+                count = len(block)
+                outdata[:count] = block.reshape(count, -1)
+                position += count
+                if count < frames:
+                    outdata[count:] = 0
+                    raise sd.CallbackStop
+            
+            # High latency gives page faults on the mapping room to resolve
+            # without underruns; playback does not need low latency
+            stream = sd.OutputStream(
+                samplerate=reader.sample_rate,
+                channels=reader.channels,
+                dtype="float32",
+                latency="high",
+                callback=audio_callback,
+                finished_callback=finished.set
+            )
+            with stream:
+                finished.wait()
+        
+        logger.info("Audio playback completed")
+    
+    def transcribe_audio(self, source: AudioSource, name: Optional[str] = None) -> str:
+        """
+        Transcribe audio to text.
+        
+        Args:
+            source: Path to audio file, audio bytes or binary file object
+            name: Original filename (for the format), if source is not a path
+            
+        Returns:
+            Transcribed text
+        """
+        name = source_name(source, name)
+        logger.info(f"Transcribing audio: {name}")
         
-        # Convert to float32 for sounddevice compatibility
-        if data.dtype == np.int16:
-            data = data.astype(np.float32) / 32767.0
-        elif data.dtype == np.int32:
-            data = data.astype(np.float32) / 2147483647.0
+        content = read_source(source)
         
-        sd.play(data, fs)
-        sd.wait()
+        cache_key, cached = self._cache_lookup(
+            content, "transcribe", self.backend.model_name("transcribe"), TRANSCRIPTION_PROMPT
+        )
+        if cached is not None:
+            logger.info("Transcription served from cache")
+            return cached.text
         
-        logger.info("Audio playback completed")
+        prepared = self._preprocess_audio((name, content))
+        
+        transcription = self.backend.transcribe(prepared, TRANSCRIPTION_PROMPT)
+        self._cache_store(cache_key, transcription, prepared)
+        
+        logger.info("Transcription completed")
+        return transcription
     
-    def transcribe_audio(self, filename: str) -> str:
+    def translate_audio(self, source: AudioSource, name: Optional[str] = None) -> str:
         """
-        Transcribe audio file to text.
+        Translate audio to English.
         
         Args:
-            filename: Path to audio file
+            source: Path to audio file, audio bytes or binary file object
+            name: Original filename (for the format), if source is not a path
+            
+        Returns:
+            Translated text
+        """
+        name = source_name(source, name)
+        logger.info(f"Translating audio: {name}")
+        
+        content = read_source(source)
+        
+        cache_key, cached = self._cache_lookup(
+            content, "translate", self.backend.model_name("translate")
+        )
+        if cached is not None:
+            logger.info("Translation served from cache")
+            return cached.text
+        
+        prepared = self._preprocess_audio((name, content))
+        
+        translation = self.backend.translate(prepared)
+        self._cache_store(cache_key, translation, prepared)
+        
+        logger.info("Translation completed")
+        return translation
+    
+    def stream_transcribe_audio(self, source: AudioSource, name: Optional[str] = None) -> str:
+        """
+        Stream transcribe audio.
+        
+        Args:
+            source: Path to audio file, audio bytes or binary file object
+            name: Original filename (for the format), if source is not a path
             
         Returns:
             Transcribed text
         """
-        logger.info(f"Transcribing audio: {filename}")
+        return "".join(self.iter_stream_transcribe_audio(source, name))
+    
+    def iter_stream_transcribe_audio(self, source: AudioSource, name: Optional[str] = None) -> Iterator[str]:
+        """
+        Stream transcribe audio, yielding text as it arrives.
+        
+        Args:
+            source: Path to audio file, audio bytes or binary file object
+            name: Original filename (for the format), if source is not a path
+            
+        Yields:
+            Transcript deltas in order
+        """
+        name = source_name(source, name)
+        logger.info(f"Starting streaming transcription: {name}")
         
-        with open(filename, "rb") as audio_file:
-            transcription = self.client.audio.transcriptions.create(
-                model=settings.openai_model_transcribe,
-                file=audio_file,
-                response_format="text",
-                prompt="The following conversation is a test conversation.",
+        content = read_source(source)
+        
+        cache_key, cached = self._cache_lookup(
+            content, "transcribe", self.backend.model_name("stream"), TRANSCRIPTION_PROMPT
+        )
+        if cached is not None:
+            logger.info("Streaming transcription served from cache")
+            yield cached.text
+            return
+        
+        prepared = self._preprocess_audio((name, content))
+        
+        full_transcription = ""
+        for delta in self.backend.stream_transcribe(prepared, TRANSCRIPTION_PROMPT):
+            full_transcription += delta
+            yield delta
+        
+        self._cache_store(cache_key, full_transcription, prepared)
+        logger.info("Streaming transcription completed")
+    
+    def _cache_lookup(
+        self, content: bytes, operation: str, model: str, prompt: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[CachedResult]]:
+        """
+        Look up a cached result for an audio payload.
+        
+        Args:
+            content: Raw audio bytes
+            operation: Operation name ("transcribe" or "translate")
+            model: Model the request would be sent to
+            prompt: Prompt the request would be sent with
+            
+        Returns:
+            Tuple of (cache key, cached result); both None if caching is disabled
+        """
+        if self.cache is None:
+            return None, None
+        cache_key = ResultCache.make_key(content, operation, model, prompt)
+        value = self.cache.get(cache_key)
+        return cache_key, None if value is None else CachedResult.decode(value)
+    
+    def _cache_store(self, cache_key: Optional[str], value: str, prepared: Optional[PreparedAudio] = None) -> None:
+        """Store a result, with the stats of the audio it came from, under a key from ``_cache_lookup``."""
+        if self.cache is not None and cache_key is not None and value:
+            duration, trimmed_seconds = (prepared.duration, prepared.trimmed_seconds) if prepared else (None, 0.0)
+            self.cache.put(cache_key, CachedResult(value, duration, trimmed_seconds).encode())
+    
+    async def _cache_lookup_async(
+        self, content: bytes, operation: str, model: str, prompt: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[CachedResult]]:
+        """``_cache_lookup`` in a worker thread: hashing a large upload and the disk tier would block the loop."""
+        if self.cache is None:
+            return None, None
+        return await anyio.to_thread.run_sync(self._cache_lookup, content, operation, model, prompt)
+    
+    async def _cache_store_async(
+        self, cache_key: Optional[str], value: str, prepared: Optional[PreparedAudio] = None
+    ) -> None:
+        """``_cache_store`` in a worker thread (the disk tier writes a file)."""
+        if self.cache is not None and cache_key is not None and value:
+            await anyio.to_thread.run_sync(self._cache_store, cache_key, value, prepared)
+    
+    def _preprocess_audio(
+        self, audio_file: Tuple[str, bytes], decoded: Optional[Tuple[int, np.ndarray]] = None
+    ) -> PreparedAudio:
+        """
+        Get audio into the cheapest form the model can use before upload.
+        
+        Depending on settings this downmixes and resamples to
+        ``normalize_sample_rate`` and trims silence with the VAD. Both steps
+        are best-effort: if decoding fails or no speech is detected the
+        original is sent. The processed audio is used when it is smaller
+        than the upload, or when the VAD removed at least
+        ``vad_min_trim_seconds``: the provider bills by the second, so a
+        trimmed FLAC is worth sending even if it is larger than a compressed
+        (webm/opus) upload. Otherwise the original is kept.
+        
+        Args:
+            audio_file: Tuple of (name, audio bytes)
+            decoded: (sample_rate, mono samples) of the audio, if already decoded
+            
+        Returns:
+            PreparedAudio with the file to send
+        """
+        if not (settings.normalize_audio or settings.vad_enabled):
+            return PreparedAudio(audio_file)
+        
+        name, content = audio_file
+        if decoded is None:
+            try:
+                decoded = decode_audio(content, name)
+            except Exception as e:
+                logger.warning(f"Audio preprocessing failed for {name}, sending original: {e}")
+                return PreparedAudio(audio_file)
+        
+        sample_rate, samples = decoded
+        samples = to_mono(samples)
+        duration = duration_seconds(samples, sample_rate)
+        if settings.normalize_audio:
+            samples = resample(samples, sample_rate, settings.normalize_sample_rate)
+            sample_rate = settings.normalize_sample_rate
+        
+        trimmed_seconds = 0.0
+        if settings.vad_enabled:
+            trimmed = trim_silence(
+                samples,
+                sample_rate,
+                frame_ms=settings.silence_frame_ms,
+                dynamic_range_db=settings.vad_dynamic_range_db,
+                noise_margin_db=settings.vad_noise_margin_db,
+                zcr_threshold=settings.vad_zcr_threshold,
+                padding_ms=settings.vad_padding_ms,
+                max_silence_ms=settings.vad_max_silence_ms,
             )
+            if len(trimmed) == 0:
+                # Let the model decide; a false negative here would lose the recording
+                logger.info(f"No speech detected in {name}, sending it untrimmed")
+            else:
+                samples = trimmed
+                trimmed_seconds = duration - duration_seconds(samples, sample_rate)
+        
+        processed = encode_audio(samples, sample_rate, name, settings.normalize_format)
+        smaller = len(processed[1]) < len(content)
+        worth_trimming = trimmed_seconds >= settings.vad_min_trim_seconds and len(processed[1]) <= settings.chunk_max_bytes
+        if not (smaller or worth_trimming):
+            return PreparedAudio(audio_file, duration)
+        
+        logger.info(
+            f"Preprocessed {name}: {len(content)} -> {len(processed[1])} bytes, "
+            f"{trimmed_seconds:.2f}s of silence trimmed"
+        )
+        return PreparedAudio(processed, duration, trimmed_seconds)
+    
+    async def _prepare_part_async(self, part: AudioPart, stats: Optional[AudioStats] = None) -> PreparedAudio:
+        """Preprocess a part (in a worker thread) unless another call already did, and record its stats."""
+        async with part.lock:
+            if part.prepared is None:
+                if settings.normalize_audio or settings.vad_enabled:
+                    part.prepared = await anyio.to_thread.run_sync(self._preprocess_audio, part.audio_file, part.decoded)
+                else:
+                    part.prepared = PreparedAudio(part.audio_file)
+                part.decoded = None
+        if stats is not None:
+            stats.add(part.prepared)
+        return part.prepared
+    
+    async def _read_audio_source(self, source: AudioSource, name: Optional[str] = None) -> Tuple[str, bytes]:
+        """
+        Get the bytes of an audio source without blocking the event loop.
+        
+        In-memory uploads are used as they are; only paths and file objects
+        are read (in a worker thread).
+        
+        Args:
+            source: Path to audio file, audio bytes or binary file object
+            name: Original filename, if source is not a path
+            
+        Returns:
+            Tuple of (name, audio bytes)
+        """
+        name = source_name(source, name)
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return name, bytes(source)
+        if isinstance(source, str):
+            return name, await anyio.Path(source).read_bytes()
+        return name, await anyio.to_thread.run_sync(read_source, source)
+    
+    async def transcribe_audio_async(
+        self, source: Union[AudioSource, AudioInput], stats: Optional[AudioStats] = None, name: Optional[str] = None
+    ) -> str:
+        """
+        Transcribe audio to text without blocking the event loop.
+        
+        Audio longer than ``chunk_max_seconds`` (or larger than
+        ``chunk_threshold_bytes``) is split on silence and the chunks are
+        sent concurrently.
+        
+        Args:
+            source: Path to audio file, audio bytes, binary file object, or
+                an AudioInput shared with other calls on the same audio
+            stats: Collects duration and trimmed silence, if given
+            name: Original filename (for the format), if source is not a path
+            
+        Returns:
+            Transcribed text
+        """
+        audio = source if isinstance(source, AudioInput) else AudioInput(source, name)
+        parts = await self._audio_parts_async(audio)
+        logger.info(f"Transcribing audio: {audio.name}" + (f" in {len(parts)} chunks" if len(parts) > 1 else ""))
+        
+        transcription = await self._run_parts_async(parts, self._transcribe_part_async, stats)
         
         logger.info("Transcription completed")
         return transcription
     
-    def translate_audio(self, filename: str) -> str:
+    async def _transcribe_part_async(self, part: AudioPart, stats: Optional[AudioStats] = None) -> str:
         """
-        Translate audio file to English.
+        Transcribe one part, going through the result cache.
         
         Args:
-            filename: Path to audio file
+            part: Audio for one provider call
+            stats: Collects duration and trimmed silence, if given
+            
+        Returns:
+            Transcribed text
+        """
+        cache_key, cached = await self._cache_lookup_async(
+            part.audio_file[1], "transcribe", self.backend.model_name("transcribe"), TRANSCRIPTION_PROMPT
+        )
+        if cached is not None:
+            logger.info("Transcription served from cache")
+            if stats is not None:
+                stats.record(cached.duration, cached.trimmed_seconds)
+            return cached.text
+        
+        prepared = await self._prepare_part_async(part, stats)
+        
+        transcription = await self.backend.transcribe_async(prepared, TRANSCRIPTION_PROMPT)
+        await self._cache_store_async(cache_key, transcription, prepared)
+        return transcription
+    
+    async def transcribe_samples_async(self, samples: np.ndarray, sample_rate: int, name: str = "live.wav") -> str:
+        """
+        Transcribe an in-memory block of samples.
+        
+        Args:
+            samples: float32 mono samples
+            sample_rate: Sample rate in Hz
+            name: Filename reported to the provider
+            
+        Returns:
+            Transcribed text
+        """
+        return await self._transcribe_part_async(AudioPart((name, encode_wav(samples, sample_rate)), (sample_rate, samples)))
+    
+    async def translate_audio_async(
+        self, source: Union[AudioSource, AudioInput], stats: Optional[AudioStats] = None, name: Optional[str] = None
+    ) -> str:
+        """
+        Translate audio to English without blocking the event loop.
+        
+        Audio longer than ``chunk_max_seconds`` (or larger than
+        ``chunk_threshold_bytes``) is split on silence and the chunks are
+        sent concurrently.
+        
+        Args:
+            source: Path to audio file, audio bytes, binary file object, or
+                an AudioInput shared with other calls on the same audio
+            stats: Collects duration and trimmed silence, if given
+            name: Original filename (for the format), if source is not a path
             
         Returns:
             Translated text
         """
-        logger.info(f"Translating audio: {filename}")
+        audio = source if isinstance(source, AudioInput) else AudioInput(source, name)
+        parts = await self._audio_parts_async(audio)
+        logger.info(f"Translating audio: {audio.name}" + (f" in {len(parts)} chunks" if len(parts) > 1 else ""))
         
-        with open(filename, "rb") as audio_file:
-            translation = self.client.audio.translations.create(
-                model=settings.openai_model_transcribe,
-                file=audio_file,
-            )
+        translation = await self._run_parts_async(parts, self._translate_part_async, stats)
         
         logger.info("Translation completed")
-        return translation.text
+        return translation
     
-    def stream_transcribe_audio(self, filename: str) -> str:
+    async def _translate_part_async(self, part: AudioPart, stats: Optional[AudioStats] = None) -> str:
         """
-        Stream transcribe audio file.
+        Translate one part to English, going through the result cache.
         
         Args:
-            filename: Path to audio file
+            part: Audio for one provider call
+            stats: Collects duration and trimmed silence, if given
+            
+        Returns:
+            Translated text
+        """
+        cache_key, cached = await self._cache_lookup_async(
+            part.audio_file[1], "translate", self.backend.model_name("translate")
+        )
+        if cached is not None:
+            logger.info("Translation served from cache")
+            if stats is not None:
+                stats.record(cached.duration, cached.trimmed_seconds)
+            return cached.text
+        
+        prepared = await self._prepare_part_async(part, stats)
+        
+        translation = await self.backend.translate_async(prepared)
+        await self._cache_store_async(cache_key, translation, prepared)
+        return translation
+    
+    async def _audio_parts_async(self, audio: AudioInput) -> List[AudioPart]:
+        """The parts of an input, read and split (in a worker thread) by the first call that needs them."""
+        async with audio.lock:
+            if audio.parts is None:
+                audio.parts = await anyio.to_thread.run_sync(self._split_audio, audio.source, audio.name)
+        return audio.parts
+    
+    def _split_audio(self, source: AudioSource, name: str) -> List[AudioPart]:
+        """
+        Read a source and cut it into the parts sent to the provider.
+        
+        Audio longer than ``chunk_max_seconds`` or larger than
+        ``chunk_threshold_bytes`` is split into WAV chunks at silent points.
+        The length is read from the file header when the format records it;
+        otherwise (browser webm, say) the audio is decoded to measure it, and
+        the samples are handed on to preprocessing rather than decoded again.
+        Audio that cannot be decoded (no ffmpeg for a compressed upload) is
+        sent whole, as the provider may still accept it.
+        
+        Args:
+            source: Path to audio file, audio bytes or binary file object
+            name: Filename (for the format)
+            
+        Returns:
+            Parts in order
+        """
+        content = read_source(source)
+        too_large = len(content) > settings.chunk_threshold_bytes
+        if not too_large and len(content) < settings.chunk_max_seconds * MIN_BYTES_PER_SECOND:
+            return [AudioPart((name, content))]
+        
+        duration = None if too_large else probe_duration(content, name)
+        if duration is not None and duration <= settings.chunk_max_seconds:
+            return [AudioPart((name, content))]
+        
+        try:
+            sample_rate, samples = decode_audio(content, name)
+        except Exception as e:
+            logger.warning(f"Cannot decode {name} to split it, sending it in one request: {e}")
+            return [AudioPart((name, content))]
+        
+        samples = to_mono(samples)
+        if not too_large and duration_seconds(samples, sample_rate) <= settings.chunk_max_seconds:
+            return [AudioPart((name, content), (sample_rate, samples))]
+        
+        chunks = self._split_samples(samples, sample_rate)
+        logger.info(f"Split {name} into {len(chunks)} chunks")
+        base = os.path.splitext(name)[0]
+        return [AudioPart((f"{base}_{index:03d}.wav", chunk)) for index, chunk in enumerate(chunks)]
+    
+    @staticmethod
+    def _split_samples(samples: np.ndarray, sample_rate: int) -> List[bytes]:
+        """Cut mono samples into WAV chunks at silent points."""
+        if settings.normalize_audio:
+            samples = resample(samples, sample_rate, settings.normalize_sample_rate)
+            sample_rate = settings.normalize_sample_rate
+        return split_audio(
+            samples,
+            sample_rate,
+            max_chunk_seconds=settings.chunk_max_seconds,
+            max_chunk_bytes=settings.chunk_max_bytes,
+            search_seconds=settings.chunk_search_seconds,
+            frame_ms=settings.silence_frame_ms,
+        )
+    
+    async def _run_parts_async(
+        self,
+        parts: List[AudioPart],
+        worker: Callable[[AudioPart, Optional[AudioStats]], Awaitable[str]],
+        stats: Optional[AudioStats] = None,
+    ) -> str:
+        """
+        Run ``worker`` on the parts of an input concurrently and merge the results.
+        
+        Args:
+            parts: Parts in order
+            worker: Coroutine function taking a part and stats
+            stats: Collects duration and trimmed silence, if given
+            
+        Returns:
+            Merged text of all parts
+        """
+        if len(parts) == 1:
+            return await worker(parts[0], stats)
+        
+        semaphore = asyncio.Semaphore(max(settings.chunk_workers, 1))
+        
+        async def run(part: AudioPart) -> str:
+            async with semaphore:
+                return await worker(part, stats)
+        
+        return merge_transcripts(await asyncio.gather(*(run(part) for part in parts)))
+    
+    async def stream_transcribe_audio_async(
+        self, source: AudioSource, stats: Optional[AudioStats] = None, name: Optional[str] = None
+    ) -> str:
+        """
+        Stream transcribe audio without blocking the event loop.
+        
+        Args:
+            source: Path to audio file, audio bytes or binary file object
+            stats: Collects duration and trimmed silence, if given
+            name: Original filename (for the format), if source is not a path
             
         Returns:
             Transcribed text
         """
-        logger.info(f"Starting streaming transcription: {filename}")
+        return "".join([delta async for delta in self.iter_stream_transcribe_audio_async(source, stats, name)])
+    
+    async def iter_stream_transcribe_audio_async(
+        self, source: AudioSource, stats: Optional[AudioStats] = None, name: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream transcribe audio, yielding text as it arrives.
         
-        with open(filename, "rb") as audio_file:
-            stream = self.client.audio.transcriptions.create(
-                model=settings.openai_model_stream,
-                file=audio_file,
-                response_format="text",
-                prompt="The following conversation is a test conversation.",
-                stream=True,
-            )
+        Args:
+            source: Path to audio file, audio bytes or binary file object
+            stats: Collects duration and trimmed silence, if given
+            name: Original filename (for the format), if source is not a path
+            
+        Yields:
+            Transcript deltas in order
+        """
+        audio_file = await self._read_audio_source(source, name)
+        logger.info(f"Starting streaming transcription: {audio_file[0]}")
+        
+        cache_key, cached = await self._cache_lookup_async(
+            audio_file[1], "transcribe", self.backend.model_name("stream"), TRANSCRIPTION_PROMPT
+        )
+        if cached is not None:
+            logger.info("Streaming transcription served from cache")
+            if stats is not None:
+                stats.record(cached.duration, cached.trimmed_seconds)
+            yield cached.text
+            return
+        
+        prepared = await self._prepare_part_async(AudioPart(audio_file), stats)
         
         full_transcription = ""
-        for event in stream:
-            if hasattr(event, 'delta') and event.delta:
-                print(event.delta, end="", flush=True)
-                full_transcription += event.delta
-            elif hasattr(event, 'text') and event.text:
-                if event.text not in full_transcription:
-                    print(event.text, end="", flush=True)
-                    full_transcription = event.text
-        
-        print()  # New line after streaming
+        async for delta in self.backend.stream_transcribe_async(prepared, TRANSCRIPTION_PROMPT):
+            full_transcription += delta
+            yield delta
+        
+        await self._cache_store_async(cache_key, full_transcription, prepared)
         logger.info("Streaming transcription completed")
-        return full_transcription
@@ -0,0 +1,240 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """
+    Content-addressed cache for transcription/translation results.
+
+    Results are keyed on a hash of the audio bytes plus the operation, model
+    and prompt. Lookups go to an in-memory LRU tier first and then to an
+    optional on-disk tier; both tiers expire entries after ``ttl_seconds``.
+    The disk tier is additionally bounded by ``disk_max_bytes`` and evicts
+    least recently used files first.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 0,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 0,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    @staticmethod
+    def make_key(content: bytes, operation: str, model: str, prompt: Optional[str] = None) -> str:
+        """
+        Build a cache key for an audio payload.
+
+        Args:
+            content: Raw audio bytes
+            operation: Operation name, e.g. "transcribe" or "translate"
+            model: Model name used for the request
+            prompt: Prompt sent with the request, if any
+
+        Returns:
+            Hex digest identifying the request
+        """
+        digest = hashlib.sha256()
+        for part in (operation, model, prompt or ""):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            Cached text, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created = entry
+                if not self._expired(created, now):
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return value
+                del self._memory[key]
+
+        value = self._disk_get(key, now)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._memory_put(key, value, now)
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        """
+        Store a result in every enabled tier.
+
+        Args:
+            key: Cache key from ``make_key``
+            value: Result text
+        """
+        now = time.time()
+        with self._lock:
+            self._memory_put(key, value, now)
+        self._disk_put(key, value, now)
+
+    def clear(self) -> None:
+        """Drop all cached entries from every tier."""
+        with self._lock:
+            self._memory.clear()
+        for path, _, _ in self._disk_entries():
+            self._remove(path)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and tier sizes."""
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created > self.ttl_seconds
+
+    def _memory_put(self, key: str, value: str, now: float) -> None:
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = (value, now)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _disk_entries(self):
+        """Yield (path, size, mtime) for every file in the disk tier."""
+        if not self.disk_dir:
+            return
+        with os.scandir(self.disk_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    def _disk_get(self, key: str, now: float) -> Optional[str]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self._expired(entry.get("created", 0), now):
+            self._remove(path)
+            return None
+
+        # Touch the file so size-based eviction is least recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("value")
+
+    def _disk_put(self, key: str, value: str, now: float) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            if os.path.exists(path):
+                self._remove(path)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"value": value, "created": now}, f)
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._disk_bytes += os.path.getsize(path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {key}: {e}")
+            return
+
+        if self.disk_max_bytes > 0 and self._disk_bytes > self.disk_max_bytes:
+            self._evict_disk(now)
+
+    def _evict_disk(self, now: float) -> None:
+        """Drop expired files, then least recently used ones until under the size limit."""
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, mtime in entries:
+            if total <= self.disk_max_bytes and not self._expired(mtime, now):
+                continue
+            self._remove(path)
+            total -= size
+        with self._lock:
+            self._disk_bytes = max(total, 0)
+
+    def _remove(self, path: str) -> None:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            self._disk_bytes = max(self._disk_bytes - size, 0)
+
+
+def create_result_cache() -> Optional[ResultCache]:
+    """Build the result cache from settings, or None if caching is disabled."""
+    if not settings.cache_enabled:
+        return None
+    return ResultCache(
+        max_entries=settings.cache_max_entries,
+        ttl_seconds=settings.cache_ttl_seconds,
+        disk_dir=settings.cache_disk_dir,
+        disk_max_bytes=settings.cache_disk_max_bytes,
+    )
+
+
+def create_deck_memo() -> Optional[ResultCache]:
+    """Build the deck pipeline's stage memo from settings, or None if disabled."""
+    if not settings.deck_memo_enabled:
+        return None
+    return ResultCache(
+        max_entries=settings.deck_memo_max_entries,
+        ttl_seconds=settings.deck_memo_ttl_seconds,
+        disk_dir=settings.deck_memo_dir,
+        disk_max_bytes=settings.deck_memo_max_bytes,
+    )
@@ -0,0 +1,307 @@
+"""
+Slide deck generation, the pipeline described in ``design.md``:
+
+    Transcriber ─┐
+    Translator ──┴─> Researcher -> Outliner ─┬─> Content Expander ─┬─> Formatter -> Speaker Notes -> Renderer
+                                             └─> Image Finder ─────┘
+
+Transcription and (optional) translation both work from the audio, so they
+run side by side; the expander and image finder only need the outline, so
+they run side by side too, and the per-slide stages work on all slides
+concurrently. Total latency is roughly the critical path.
+
+Every model call is memoized on a hash of its stage, prompt, model and
+input, and the per-slide stages make one call per slide, so regenerating a
+deck only recomputes what changed: editing one slide's outline re-expands,
+re-formats and re-notes that slide alone.
+"""
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+import anyio
+
+from app.core.config import settings
+from app.core.metrics import stage as metrics_stage
+from app.models.schemas import DeckRegenerateRequest, DeckResponse, Slide, SlideImage
+from app.services.audio_processing import AudioSource, AudioStats
+from app.services.audio_service import AudioInput, AudioService
+from app.services.cache_service import ResultCache
+from app.services.llm_service import LLMService
+from app.services.pipeline import Pipeline, Stage, StageContext, map_concurrently
+from app.services.renderer import DeckRenderer
+
+logger = logging.getLogger(__name__)
+
+RESEARCH_PROMPT = """You prepare material for a slide presentation from a spoken prompt.
+Return JSON: {"title": str, "summary": str, "key_points": [str], "facts": [str]}.
+"key_points" are the ideas the speaker wants to get across; "facts" are relevant
+facts, examples and context that would strengthen the presentation."""
+
+OUTLINE_PROMPT = """You outline slide presentations.
+Return JSON: {"title": str, "slides": [{"title": str, "bullets": [str]}]}.
+Write between {min_slides} and {max_slides} slides with 3-5 short bullet points each,
+starting with a title slide and ending with a summary slide."""
+
+EXPAND_PROMPT = """You write slide body text.
+Given the deck title and one slide's outline, return JSON: {"content": [str]}
+with 2-4 polished, full sentences expanding the bullets. Stay on the slide's topic."""
+
+IMAGE_PROMPT = """You pick visuals for slides.
+Given one slide, return JSON: {"kind": "image" | "icon" | "diagram",
+"description": str, "query": str} where "query" is a short search query
+for an image or icon library."""
+
+STYLE_PROMPT = """You are the editor of a slide deck.
+Given the deck title and slide titles, write a short style guide every slide will follow.
+Return JSON: {"tone": str, "tense": str, "length": str, "palette": str, "font": str}
+where "length" describes how long bullets and sentences should be."""
+
+FORMAT_PROMPT = """You edit one slide of a deck to follow the deck's style guide.
+Given the style guide and the slide, make its tone, tense and length match the guide
+without changing its meaning. Return JSON: {"title": str, "bullets": [str], "content": [str]}."""
+
+NOTES_PROMPT = """You write speaker notes.
+Given the deck title and one slide, return JSON: {"notes": str} with 80-150 words
+the presenter can say while the slide is shown, explaining it in more detail."""
+
+
+class DeckGenerator:
+    """
+    Runs the design.md pipeline for an audio file and returns the deck.
+
+    Args:
+        audio_service: Transcribes and translates the recording
+        llm: Chat model used by the text stages
+        renderer: Renders the finished deck to HTML
+        memo: Store for model outputs keyed on their inputs (None disables)
+    """
+
+    def __init__(
+        self,
+        audio_service: AudioService,
+        llm: LLMService,
+        renderer: DeckRenderer,
+        memo: Optional[ResultCache] = None,
+    ):
+        self.audio_service = audio_service
+        self.llm = llm
+        self.renderer = renderer
+        self.memo = memo
+        self.pipeline = self._build_pipeline()
+
+    def _build_pipeline(self) -> Pipeline:
+        audio_timeout = settings.deck_transcribe_timeout_seconds
+        timeout = settings.deck_stage_timeout_seconds
+        return Pipeline([
+            Stage("transcribe", self._timed("transcribe", self._transcribe), timeout=audio_timeout),
+            Stage("translate", self._timed("translate", self._translate), timeout=audio_timeout,
+                  when=lambda context: context["need_translation"]),
+            Stage("research", self._timed("research", self._research), after=["transcribe", "translate"], timeout=timeout),
+            Stage("outline", self._timed("outline", self._outline), after=["research"], timeout=timeout),
+            Stage("expand", self._timed("expand", self._expand), after=["outline"], timeout=timeout),
+            Stage("images", self._timed("images", self._find_images), after=["outline"], timeout=timeout),
+            Stage("style", self._timed("style", self._style), after=["outline"], timeout=timeout),
+            Stage("format", self._timed("format", self._format), after=["expand", "images", "style"], timeout=timeout),
+            Stage("notes", self._timed("notes", self._notes), after=["format"], timeout=timeout),
+            Stage("render", self._timed("render", self._render), after=["notes"], timeout=timeout),
+        ])
+
+    @staticmethod
+    def _timed(name: str, run):
+        """Report a stage's latency to the request metrics as ``deck_<name>``."""
+        async def timed(context: StageContext):
+            with metrics_stage(f"deck_{name}"):
+                return await run(context)
+        return timed
+
+    async def generate(self, source: AudioSource, translate: bool = False, name: Optional[str] = None) -> DeckResponse:
+        """
+        Generate a slide deck from a recording.
+
+        Args:
+            source: Audio bytes or path to audio file
+            translate: Build the deck from an English translation of the audio
+            name: Original filename (for the format), if source is not a path
+
+        Returns:
+            The deck, including rendered HTML and per-stage timings
+        """
+        return await self._run({"audio": AudioInput(source, name), "need_translation": translate})
+
+    async def regenerate(self, request: DeckRegenerateRequest) -> DeckResponse:
+        """
+        Rebuild a deck from an edited outline.
+
+        Starts after the outliner, using the given deck title, transcript and
+        slide outlines (a previous response's ``outline``, edited). Slides whose outline is unchanged come from the
+        memo, so only edited slides cost model calls.
+
+        Args:
+            request: Deck title, transcript and (edited) slides
+
+        Returns:
+            The regenerated deck
+        """
+        outline = {
+            "title": request.title,
+            "slides": [Slide(title=slide.title, bullets=slide.bullets) for slide in request.slides],
+        }
+        # Upstream stages are given, so only the outline's dependents run
+        return await self._run({
+            "transcribe": request.transcript,
+            "translate": None,
+            "research": None,
+            "outline": outline,
+            "need_translation": request.translated,
+        })
+
+    async def _run(self, inputs: Dict[str, Any]) -> DeckResponse:
+        memo_counts: Dict[str, Dict[str, int]] = {}
+        result = await self.pipeline.run({**inputs, "stats": AudioStats(), "memo": memo_counts})
+        deck: DeckResponse = result["render"]
+        deck.duration = result["stats"].duration
+        deck.timings = result.timings
+        deck.elapsed = result.elapsed
+        deck.memo = memo_counts
+        reused = sum(counts["hits"] for counts in memo_counts.values())
+        total = reused + sum(counts["misses"] for counts in memo_counts.values())
+        logger.info(f"Generated {len(deck.slides)}-slide deck in {result.elapsed:.2f}s ({reused}/{total} model calls reused)")
+        return deck
+
+    async def _complete(self, context: StageContext, stage: str, system: str, payload: Any) -> Dict[str, Any]:
+        """
+        Ask the chat model for JSON, memoized on the stage, prompt, model and input.
+
+        Args:
+            context: Pipeline context (collects per-stage hit/miss counts)
+            stage: Stage name, part of the memo key
+            system: System prompt
+            payload: User message text, or data sent as JSON
+
+        Returns:
+            Parsed JSON object
+        """
+        prompt = payload if isinstance(payload, str) else json.dumps(payload, sort_keys=True)
+        counts = context["memo"].setdefault(stage, {"hits": 0, "misses": 0})
+        if self.memo is None:
+            counts["misses"] += 1
+            return await self.llm.complete_json(system, prompt)
+
+        key = ResultCache.make_key(prompt.encode("utf-8"), f"deck_{stage}", self.llm.model, system)
+        cached = await anyio.to_thread.run_sync(self.memo.get, key)
+        if cached is not None:
+            counts["hits"] += 1
+            return json.loads(cached)
+
+        counts["misses"] += 1
+        result = await self.llm.complete_json(system, prompt)
+        await anyio.to_thread.run_sync(self.memo.put, key, json.dumps(result))
+        return result
+
+    # Stages
+
+    async def _transcribe(self, context: StageContext) -> str:
+        return await self.audio_service.transcribe_audio_async(context["audio"], context["stats"])
+
+    async def _translate(self, context: StageContext) -> str:
+        return await self.audio_service.translate_audio_async(context["audio"])
+
+    @staticmethod
+    def _transcript(context: StageContext) -> str:
+        return context["translate"] or context["transcribe"] or ""
+
+    async def _research(self, context: StageContext) -> Dict[str, Any]:
+        transcript = self._transcript(context)
+        if not transcript.strip():
+            raise ValueError("No speech found in the recording")
+        return await self._complete(context, "research", RESEARCH_PROMPT, transcript)
+
+    async def _outline(self, context: StageContext) -> Dict[str, Any]:
+        system = (
+            OUTLINE_PROMPT
+            .replace("{min_slides}", str(settings.deck_min_slides))
+            .replace("{max_slides}", str(settings.deck_max_slides))
+        )
+        outline = await self._complete(
+            context, "outline", system, {"transcript": self._transcript(context), "research": context["research"]}
+        )
+
+        slides = [
+            Slide(title=str(slide.get("title", "")), bullets=[str(b) for b in slide.get("bullets", [])])
+            for slide in outline.get("slides", []) if isinstance(slide, dict)
+        ][:settings.deck_max_slides]
+        if len(slides) < settings.deck_min_slides:
+            logger.warning(f"Outline has {len(slides)} slides, fewer than {settings.deck_min_slides}")
+        title = str(outline.get("title") or context["research"].get("title") or "Presentation")
+        return {"title": title, "slides": slides}
+
+    async def _expand(self, context: StageContext) -> List[List[str]]:
+        title = context["outline"]["title"]
+
+        async def expand(index: int, slide: Slide) -> List[str]:
+            payload = {"deck_title": title, "slide": slide.model_dump(include={"title", "bullets"})}
+            result = await self._complete(context, "expand", EXPAND_PROMPT, payload)
+            return [str(sentence) for sentence in result.get("content", [])]
+
+        return await map_concurrently(context["outline"]["slides"], expand, settings.deck_slide_parallelism)
+
+    async def _find_images(self, context: StageContext) -> List[Optional[SlideImage]]:
+        async def find(index: int, slide: Slide) -> Optional[SlideImage]:
+            payload = slide.model_dump(include={"title", "bullets"})
+            result = await self._complete(context, "images", IMAGE_PROMPT, payload)
+            if not result.get("description"):
+                return None
+            return SlideImage(
+                kind=str(result.get("kind") or "image"),
+                description=str(result["description"]),
+                query=str(result.get("query") or result["description"]),
+            )
+
+        return await map_concurrently(context["outline"]["slides"], find, settings.deck_slide_parallelism)
+
+    async def _style(self, context: StageContext) -> Dict[str, str]:
+        # Only the deck and slide titles shape the style guide, so editing a
+        # slide's bullets does not restyle (and re-format) every other slide
+        outline = context["outline"]
+        payload = {"title": outline["title"], "slides": [slide.title for slide in outline["slides"]]}
+        result = await self._complete(context, "style", STYLE_PROMPT, payload)
+        return {key: str(value) for key, value in result.items()}
+
+    async def _format(self, context: StageContext) -> List[Slide]:
+        style = context["style"]
+
+        async def format_slide(index: int, slide: Slide) -> Slide:
+            slide = slide.model_copy(update={"content": context["expand"][index], "image": context["images"][index]})
+            payload = {"style": style, "slide": slide.model_dump(include={"title", "bullets", "content"})}
+            edit = await self._complete(context, "format", FORMAT_PROMPT, payload)
+            return slide.model_copy(update={
+                "title": str(edit.get("title") or slide.title),
+                "bullets": [str(b) for b in edit.get("bullets", slide.bullets)],
+                "content": [str(c) for c in edit.get("content", slide.content)],
+            })
+
+        return await map_concurrently(context["outline"]["slides"], format_slide, settings.deck_slide_parallelism)
+
+    async def _notes(self, context: StageContext) -> List[Slide]:
+        title = context["outline"]["title"]
+
+        async def write_notes(index: int, slide: Slide) -> Slide:
+            payload = {"deck_title": title, "slide": slide.model_dump(include={"title", "bullets", "content"})}
+            result = await self._complete(context, "notes", NOTES_PROMPT, payload)
+            return slide.model_copy(update={"notes": str(result.get("notes", ""))})
+
+        return await map_concurrently(context["format"], write_notes, settings.deck_slide_parallelism)
+
+    async def _render(self, context: StageContext) -> DeckResponse:
+        deck = DeckResponse(
+            title=context["outline"]["title"],
+            slides=context["notes"],
+            outline=[slide.model_dump(include={"title", "bullets"}) for slide in context["outline"]["slides"]],
+            transcript=self._transcript(context),
+            translated=context["need_translation"],
+            style=context["style"],
+        )
+        deck.html = self.renderer.render_html(deck)
+        return deck
+
@@ -0,0 +1,93 @@
+import logging
+from typing import Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:  # HTTP/2 needs the h2 package (httpx[http2]); fall back to HTTP/1.1
+    HTTP2_AVAILABLE = False
+
+
+def http_timeout() -> httpx.Timeout:
+    """Connect/read/write/pool timeouts from settings."""
+    return httpx.Timeout(
+        connect=settings.http_connect_timeout,
+        read=settings.http_read_timeout,
+        write=settings.http_write_timeout,
+        pool=settings.http_pool_timeout,
+    )
+
+
+def http_limits() -> httpx.Limits:
+    """Connection pool size and keep-alive expiry from settings."""
+    return httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+
+
+def http2_enabled() -> bool:
+    if settings.http2 and not HTTP2_AVAILABLE:
+        logger.warning("HTTP2 is enabled but the h2 package is not installed; using HTTP/1.1")
+    return settings.http2 and HTTP2_AVAILABLE
+
+
+def create_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    Build the pooled HTTP clients used for provider calls.
+
+    One sync and one async client are created per process and shared by
+    every request, so warm requests reuse an open (TLS) connection instead
+    of paying for a new handshake.
+
+    Returns:
+        Tuple of (sync client, async client)
+    """
+    http2 = http2_enabled()
+    timeout = http_timeout()
+    limits = http_limits()
+    logger.info(
+        f"HTTP pool: {settings.http_max_connections} connections, "
+        f"keep-alive {settings.http_keepalive_expiry}s, http2={http2}"
+    )
+    return (
+        httpx.Client(http2=http2, timeout=timeout, limits=limits),
+        httpx.AsyncClient(http2=http2, timeout=timeout, limits=limits),
+    )
+
+
+_shared_clients: Optional[Tuple[httpx.Client, httpx.AsyncClient]] = None
+
+
+def shared_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    The process-wide pooled clients, created on first use.
+
+    Every provider caller (transcription backends, the deck chat model)
+    shares them, so all calls draw on one pool of warm connections.
+
+    Returns:
+        Tuple of (sync client, async client)
+    """
+    global _shared_clients
+    if _shared_clients is None or _shared_clients[1].is_closed:
+        _shared_clients = create_http_clients()
+    return _shared_clients
+
+
+async def close_http_clients() -> None:
+    """Close the shared clients (app shutdown); safe to call more than once."""
+    global _shared_clients
+    if _shared_clients is None:
+        return
+    sync_client, async_client = _shared_clients
+    _shared_clients = None
+    await async_client.aclose()
+    sync_client.close()
@@ -0,0 +1,164 @@
+import os
+import time
+import uuid
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.services.audio_operations import OPERATIONS
+from app.services.audio_service import AudioService
+from app.services.transcript_store import TranscriptStore
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class Job:
+    """A queued audio operation and, once finished, its result."""
+
+    def __init__(self, operation: str, filename: str, display_name: str):
+        self.id = uuid.uuid4().hex
+        self.operation = operation
+        self.filename = filename
+        self.display_name = display_name
+        self.status = "queued"
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.completed_at: Optional[float] = None
+
+
+class JobManager:
+    """
+    Bounded worker pool running audio operations in the background.
+
+    Submissions go into a queue of at most ``queue_size`` jobs and are picked
+    up by ``workers`` worker tasks, so at most that many provider calls run
+    at once regardless of how many clients are submitting. Finished jobs are
+    kept for ``result_ttl_seconds`` for clients to poll.
+    """
+
+    def __init__(
+        self,
+        audio_service: AudioService,
+        store: Optional[TranscriptStore] = None,
+        workers: int = None,
+        queue_size: int = None,
+        result_ttl_seconds: int = None,
+    ):
+        self.audio_service = audio_service
+        self.store = store
+        self.workers = workers or settings.job_workers
+        self.queue_size = queue_size or settings.job_queue_size
+        self.result_ttl_seconds = result_ttl_seconds if result_ttl_seconds is not None else settings.job_result_ttl_seconds
+
+        self.jobs: Dict[str, Job] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        """Start the worker tasks."""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Started {self.workers} job workers (queue size {self.queue_size})")
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks; queued jobs are abandoned and their files removed."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        
+        while self._queue is not None and not self._queue.empty():
+            self._remove_file(self._queue.get_nowait())
+
+    def submit(self, operation: str, filename: str, display_name: str) -> Job:
+        """
+        Queue an operation on a saved audio file.
+
+        Args:
+            operation: One of ``OPERATIONS``
+            filename: Path to the saved upload; removed once the job finishes
+            display_name: Original upload name
+
+        Returns:
+            The queued job
+
+        Raises:
+            QueueFullError: If the queue is at capacity
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation}")
+        if self._queue is None:
+            raise RuntimeError("JobManager has not been started")
+
+        self._purge_expired()
+        job = Job(operation, filename, display_name)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFullError(f"Job queue is full ({self.queue_size} jobs)")
+
+        self.jobs[job.id] = job
+        logger.info(f"Queued {operation} job {job.id} for {display_name}")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id."""
+        self._purge_expired()
+        return self.jobs.get(job_id)
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            response = await OPERATIONS[job.operation](self.audio_service, job.filename, job.display_name, self.store)
+            job.result = response.model_dump()
+            job.status = "completed"
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            job.completed_at = time.time()
+            self._remove_file(job)
+
+    @staticmethod
+    def _remove_file(job: Job) -> None:
+        try:
+            os.remove(job.filename)
+        except FileNotFoundError:
+            pass
+
+    def _purge_expired(self) -> None:
+        if self.result_ttl_seconds <= 0:
+            return
+        cutoff = time.time() - self.result_ttl_seconds
+        expired = [
+            job_id for job_id, job in self.jobs.items()
+            if job.completed_at is not None and job.completed_at < cutoff
+        ]
+        for job_id in expired:
+            del self.jobs[job_id]
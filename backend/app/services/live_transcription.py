@@ -0,0 +1,153 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.audio_processing import find_split_points, merge_transcripts, to_float32
+from app.services.ring_buffer import RingBuffer
+
+logger = logging.getLogger(__name__)
+
+# Sample rates a client may request: enough bandwidth for speech, and a
+# ring buffer of bounded size
+MIN_SAMPLE_RATE = 8000
+MAX_SAMPLE_RATE = 48000
+
+
+def parse_sample_rate(value: Any) -> int:
+    """
+    Validate a sample rate sent by a client.
+
+    Args:
+        value: ``sample_rate`` from the client's control message
+
+    Returns:
+        The sample rate in Hz
+
+    Raises:
+        ValueError: If it is not an integer between MIN_SAMPLE_RATE and
+            MAX_SAMPLE_RATE
+    """
+    if isinstance(value, bool) or not isinstance(value, int) or not MIN_SAMPLE_RATE <= value <= MAX_SAMPLE_RATE:
+        raise ValueError(
+            f"sample_rate must be an integer between {MIN_SAMPLE_RATE} and {MAX_SAMPLE_RATE}, got {value!r}"
+        )
+    return value
+
+
+class LiveTranscriptionSession:
+    """
+    Incremental transcription of a live PCM stream.
+
+    Incoming audio goes into a bounded ring buffer. Every ``step_seconds`` of
+    new audio the pending segment is transcribed and reported as a partial
+    result; once the segment reaches ``window_seconds`` it is cut at its
+    quietest point, transcribed one last time and committed. When the stream
+    stops only the uncommitted tail (at most one window) is left to process.
+
+    Args:
+        transcribe: Coroutine function taking (samples, sample_rate) and
+            returning text
+        on_partial: Coroutine function called with the transcript so far
+        sample_rate: Sample rate of the incoming PCM
+    """
+
+    def __init__(
+        self,
+        transcribe: Callable[[np.ndarray, int], Awaitable[str]],
+        on_partial: Callable[[str], Awaitable[None]],
+        sample_rate: int = None,
+    ):
+        self.transcribe = transcribe
+        self.on_partial = on_partial
+        self.sample_rate = sample_rate or settings.live_sample_rate
+
+        self.window_samples = int(settings.live_window_seconds * self.sample_rate)
+        self.step_samples = int(settings.live_step_seconds * self.sample_rate)
+        capacity = max(int(settings.live_buffer_seconds * self.sample_rate), self.window_samples)
+        self.buffer = RingBuffer(capacity)
+
+        self.committed: List[str] = []
+        self._pending_text = ""
+        self._since_partial = 0
+        self._task: Optional[asyncio.Task] = None
+        self._finishing = False
+
+    @property
+    def text(self) -> str:
+        """Committed transcript plus the latest partial for the pending segment."""
+        return merge_transcripts(self.committed + [self._pending_text])
+
+    def feed(self, pcm: bytes) -> None:
+        """
+        Add 16-bit little-endian mono PCM and schedule transcription if due.
+
+        Args:
+            pcm: Raw PCM bytes
+        """
+        samples = to_float32(np.frombuffer(pcm[:len(pcm) - len(pcm) % 2], dtype="<i2"))
+        dropped = self.buffer.dropped
+        self.buffer.write(samples)
+        if self.buffer.dropped > dropped:
+            logger.warning(f"Live transcription falling behind, dropped {self.buffer.dropped - dropped} samples")
+        self._since_partial += len(samples)
+        self._schedule()
+
+    async def finish(self) -> str:
+        """
+        Transcribe whatever is still buffered and return the full transcript.
+
+        Returns:
+            Final transcript
+        """
+        self._finishing = True
+        while self._task is not None and not self._task.done():
+            await self._task
+        if len(self.buffer):
+            segment = self.buffer.consume(len(self.buffer))
+            self.committed.append(await self.transcribe(segment, self.sample_rate))
+        self._pending_text = ""
+        return self.text
+
+    def cancel(self) -> None:
+        """Abort any in-flight transcription."""
+        if self._task is not None:
+            self._task.cancel()
+
+    def _schedule(self) -> None:
+        if self._finishing or (self._task is not None and not self._task.done()):
+            return
+
+        if len(self.buffer) >= self.window_samples:
+            pending = self.buffer.peek()
+            starts = find_split_points(
+                pending, self.sample_rate, self.window_samples, self.step_samples,
+                frame_ms=settings.silence_frame_ms
+            )
+            segment = self.buffer.consume(starts[1] if len(starts) > 1 else self.window_samples)
+            self._since_partial = len(self.buffer)
+            self._task = asyncio.create_task(self._commit(segment))
+        elif self._since_partial >= self.step_samples:
+            self._since_partial = 0
+            self._task = asyncio.create_task(self._partial(self.buffer.peek()))
+
+    async def _commit(self, segment: np.ndarray) -> None:
+        try:
+            self.committed.append(await self.transcribe(segment, self.sample_rate))
+            self._pending_text = ""
+            await self.on_partial(self.text)
+        except Exception as e:
+            logger.error(f"Error transcribing live segment: {e}")
+        self._task = None
+        self._schedule()
+
+    async def _partial(self, segment: np.ndarray) -> None:
+        try:
+            self._pending_text = await self.transcribe(segment, self.sample_rate)
+            await self.on_partial(self.text)
+        except Exception as e:
+            logger.error(f"Error transcribing live audio: {e}")
+        self._task = None
+        self._schedule()
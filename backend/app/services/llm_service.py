@@ -0,0 +1,80 @@
+import json
+import logging
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict
+
+from app.core.config import settings
+from app.services.http_client import close_http_clients, http_timeout, shared_http_clients
+from app.services.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+
+class LLMService:
+    """Chat model calls for the deck pipeline, returning parsed JSON."""
+
+    def __init__(self, client: "AsyncOpenAI" = None):
+        if client is not None:
+            self.client = client
+        # Chat quotas are separate from the audio API's, so the deck pipeline
+        # gets its own limiter (off unless chat_rate_limit_requests_per_minute is set)
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=settings.chat_rate_limit_requests_per_minute,
+            audio_seconds_per_minute=0,
+        )
+        self.model = settings.openai_model_chat
+
+    @cached_property
+    def client(self) -> "AsyncOpenAI":
+        """The SDK client, created (and the SDK imported) on first use."""
+        from openai import AsyncOpenAI
+        # Retries are handled by the rate limiter, not the SDK; connections
+        # come from the pool shared with the transcription backend
+        return AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=shared_http_clients()[1],
+            timeout=http_timeout(),
+            max_retries=0
+        )
+
+    async def complete_json(self, system: str, prompt: str, temperature: float = 0.4) -> Dict[str, Any]:
+        """
+        Ask the chat model for a JSON object.
+
+        Args:
+            system: System message describing the task and the JSON shape
+            prompt: User message with the input data
+            temperature: Sampling temperature
+
+        Returns:
+            Parsed JSON object
+
+        Raises:
+            ValueError: If the model did not return a JSON object
+        """
+        response = await self.rate_limiter.call(
+            lambda: self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system},
+                    {"role": "user", "content": prompt},
+                ],
+                response_format={"type": "json_object"},
+                temperature=temperature,
+            )
+        )
+        content = response.choices[0].message.content or ""
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Model returned invalid JSON: {e}")
+        if not isinstance(data, dict):
+            raise ValueError("Model returned JSON that is not an object")
+        return data
+
+    async def aclose(self) -> None:
+        # The shared pool is closed with the transcription backend
+        await close_http_clients()
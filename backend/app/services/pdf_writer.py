@@ -0,0 +1,187 @@
+"""
+Minimal PDF writer for slide decks.
+
+Pages are laid out with the standard Helvetica fonts (no embedding), so a
+page is just a text content stream. ``render_slide_page`` and
+``render_notes_page`` are pure functions of the slide data and return that
+stream as an ASCII string, which makes them cheap to send to a worker
+process and to cache; ``assemble_pdf`` merges the streams into one document.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+PAGE_WIDTH = 960  # 16:9 at 72 dpi (13.33 x 7.5 in)
+PAGE_HEIGHT = 540
+MARGIN = 60
+
+# Approximate Helvetica advance widths (fraction of the font size)
+_NARROW = set("iljtfI.,;:!|'`()[] ")
+_WIDE = set("mwMW@%")
+_SPACE = 0.28
+
+
+def _char_width(char: str) -> float:
+    if char in _NARROW:
+        return 0.28
+    if char in _WIDE:
+        return 0.83
+    if char.isupper() or char.isdigit():
+        return 0.64
+    return 0.52
+
+
+def wrap(text: str, size: float, max_width: float) -> List[str]:
+    """Greedy word wrap using approximate glyph widths."""
+    limit = max_width / size
+    lines: List[str] = []
+    line: List[str] = []
+    width = 0.0
+    for word in text.split():
+        word_width = sum(_char_width(char) for char in word)
+        if line and width + _SPACE + word_width > limit:
+            lines.append(" ".join(line))
+            line, width = [word], word_width
+        else:
+            width += word_width + (_SPACE if line else 0)
+            line.append(word)
+    if line:
+        lines.append(" ".join(line))
+    return lines
+
+
+def _escape(text: str) -> str:
+    """Encode text as a PDF string literal body (WinAnsi, ASCII-safe)."""
+    out = []
+    for byte in text.encode("cp1252", errors="replace"):
+        char = chr(byte)
+        if char in "\\()":
+            out.append("\\" + char)
+        elif 32 <= byte < 127:
+            out.append(char)
+        else:
+            out.append(f"\\{byte:03o}")
+    return "".join(out)
+
+
+class _Page:
+    """Accumulates positioned text lines for one page, top to bottom."""
+
+    def __init__(self):
+        self.ops: List[str] = []
+        self.y = PAGE_HEIGHT - MARGIN
+
+    def fill(self, rgb: Tuple[float, float, float]) -> None:
+        self.ops.append(f"{rgb[0]:.2f} {rgb[1]:.2f} {rgb[2]:.2f} rg")
+
+    def text(self, text: str, font: str, size: float, indent: float = 0, gap: float = 0.35) -> bool:
+        """Write wrapped text; returns False once the page is full."""
+        x = MARGIN + indent
+        for line in wrap(text, size, PAGE_WIDTH - MARGIN - x):
+            if self.y - size < MARGIN:
+                return False
+            self.y -= size
+            self.ops.append(f"BT /{font} {size} Tf {x:.1f} {self.y:.1f} Td ({_escape(line)}) Tj ET")
+            self.y -= size * gap
+        return True
+
+    def space(self, points: float) -> None:
+        self.y -= points
+
+    def stream(self) -> str:
+        return "\n".join(self.ops)
+
+
+def render_slide_page(slide: Dict, style: Optional[Dict[str, str]] = None) -> str:
+    """
+    Lay out one slide: title, bullets, body text and the suggested visual.
+
+    Args:
+        slide: Slide fields (title, bullets, content, image)
+        style: Deck style guide (unused by the layout, part of the cache key)
+
+    Returns:
+        PDF content stream for the page
+    """
+    page = _Page()
+    page.fill((0.1, 0.1, 0.2))
+    page.text(slide.get("title", ""), "F2", 32)
+    page.space(12)
+
+    page.fill((0.15, 0.15, 0.15))
+    for bullet in slide.get("bullets", []):
+        if not page.text(f"\u2022 {bullet}", "F1", 20, indent=10):
+            return page.stream()
+    page.space(8)
+    for sentence in slide.get("content", []):
+        if not page.text(sentence, "F1", 14):
+            return page.stream()
+
+    image = slide.get("image")
+    if image:
+        page.space(8)
+        page.fill((0.4, 0.4, 0.45))
+        page.text(f"[{image.get('kind', 'image')}] {image.get('description', '')}", "F1", 12)
+    return page.stream()
+
+
+def render_notes_page(slide: Dict) -> str:
+    """
+    Lay out the speaker notes for one slide.
+
+    Args:
+        slide: Slide fields (title, notes)
+
+    Returns:
+        PDF content stream for the page
+    """
+    page = _Page()
+    page.fill((0.4, 0.4, 0.45))
+    page.text(f"Notes: {slide.get('title', '')}", "F2", 18)
+    page.space(10)
+    page.fill((0.15, 0.15, 0.15))
+    for paragraph in (slide.get("notes") or "").split("\n"):
+        if not page.text(paragraph, "F1", 14, gap=0.45):
+            break
+    return page.stream()
+
+
+def assemble_pdf(pages: Sequence[str], title: str = "") -> bytes:
+    """
+    Merge page content streams into a PDF document.
+
+    Args:
+        pages: Content streams from ``render_slide_page``/``render_notes_page``
+        title: Document title for the info dictionary
+
+    Returns:
+        PDF file bytes
+    """
+    font_count = 2
+    first_page = 3 + font_count + 1  # catalog, pages, fonts, info
+    page_ids = [first_page + 2 * i for i in range(len(pages))]
+
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(pages)} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+        f"<< /Title ({_escape(title)}) /Producer (Voice-to-Slide Generator) >>".encode(),
+    ]
+    for page_id, stream in zip(page_ids, pages):
+        content = stream.encode("ascii")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents {page_id + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R /Info 5 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
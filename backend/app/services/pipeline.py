@@ -0,0 +1,188 @@
+"""
+Concurrent stage-graph executor.
+
+A ``Pipeline`` is a DAG of named ``Stage``s. Every stage starts as soon as
+the stages it depends on have finished, so independent branches run
+concurrently and the total latency tracks the critical path rather than
+the sum of all stages. Each stage gets its own timeout.
+"""
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+StageContext = Dict[str, Any]
+
+
+class StageError(Exception):
+    """Raised when a pipeline stage fails."""
+
+    def __init__(self, stage: str, message: str):
+        super().__init__(f"Stage '{stage}' failed: {message}")
+        self.stage = stage
+
+
+class StageTimeoutError(StageError):
+    """Raised when a pipeline stage exceeds its timeout."""
+
+    def __init__(self, stage: str, timeout: float):
+        super().__init__(stage, f"timed out after {timeout:g}s")
+        self.timeout = timeout
+
+
+class Stage:
+    """
+    One node of a pipeline.
+
+    Args:
+        name: Unique stage name; its output is stored under this key
+        run: Coroutine function taking the context (pipeline inputs plus
+            the outputs of all finished stages) and returning the output
+        after: Names of the stages that must finish first
+        timeout: Seconds before the stage is cancelled (None for no limit)
+        when: Predicate on the context; if it returns False the stage is
+            skipped and its output is None
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[StageContext], Awaitable[Any]],
+        after: Sequence[str] = (),
+        timeout: Optional[float] = None,
+        when: Optional[Callable[[StageContext], bool]] = None,
+    ):
+        self.name = name
+        self.run = run
+        self.after = tuple(after)
+        self.timeout = timeout
+        self.when = when
+
+
+class PipelineResult:
+    """Stage outputs plus when each stage started and finished."""
+
+    def __init__(self, outputs: StageContext, timings: Dict[str, Dict[str, float]], elapsed: float):
+        self.outputs = outputs
+        self.timings = timings  # stage -> {"start", "end"} seconds since the run started
+        self.elapsed = elapsed
+
+    def __getitem__(self, stage: str) -> Any:
+        return self.outputs[stage]
+
+
+class Pipeline:
+    """DAG of stages executed with maximum concurrency."""
+
+    def __init__(self, stages: Iterable[Stage]):
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage: {stage.name}")
+            self.stages[stage.name] = stage
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        order: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(name: str, path: List[str]) -> None:
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Stage cycle: {' -> '.join(path + [name])}")
+            if name not in self.stages:
+                raise ValueError(f"Stage '{path[-1]}' depends on unknown stage '{name}'")
+            state[name] = "visiting"
+            for dependency in self.stages[name].after:
+                visit(dependency, path + [name])
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, [])
+        return order
+
+    async def run(self, inputs: Optional[StageContext] = None) -> PipelineResult:
+        """
+        Run every stage, each as soon as its dependencies are done.
+
+        If a stage fails or times out the remaining stages are cancelled and
+        the error is raised (timeouts as ``StageTimeoutError``). A stage whose
+        name is already in ``inputs`` is not run; the given value is used as
+        its output, e.g. to restart from an edited intermediate result.
+
+        Args:
+            inputs: Initial context values available to every stage
+
+        Returns:
+            PipelineResult with every stage's output
+        """
+        context: StageContext = dict(inputs or {})
+        provided = set(context)
+        timings: Dict[str, Dict[str, float]] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        started = time.perf_counter()
+
+        async def execute(stage: Stage) -> None:
+            if stage.after:
+                await asyncio.gather(*(tasks[name] for name in stage.after))
+            if stage.name in provided:
+                return
+            if stage.when is not None and not stage.when(context):
+                context[stage.name] = None
+                return
+
+            start = time.perf_counter()
+            try:
+                context[stage.name] = await asyncio.wait_for(stage.run(context), stage.timeout)
+            except asyncio.TimeoutError:
+                raise StageTimeoutError(stage.name, stage.timeout)
+            finally:
+                end = time.perf_counter()
+                timings[stage.name] = {"start": start - started, "end": end - started}
+            logger.info(f"Stage {stage.name} finished in {end - start:.2f}s")
+
+        # Dependencies come first in topological order, so their tasks exist
+        for name in self.order:
+            tasks[name] = asyncio.create_task(execute(self.stages[name]), name=f"stage-{name}")
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        return PipelineResult(context, timings, time.perf_counter() - started)
+
+
+async def map_concurrently(
+    items: Sequence[T],
+    fn: Callable[[int, T], Awaitable[R]],
+    limit: int,
+) -> List[R]:
+    """
+    Apply ``fn(index, item)`` to every item with at most ``limit`` in flight.
+
+    Args:
+        items: Inputs, e.g. the slides of a deck
+        fn: Coroutine function called with each index and item
+        limit: Maximum concurrent calls
+
+    Returns:
+        Results in input order
+    """
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def run(index: int, item: T) -> R:
+        async with semaphore:
+            return await fn(index, item)
+
+    return list(await asyncio.gather(*(run(i, item) for i, item in enumerate(items))))
@@ -0,0 +1,238 @@
+import time
+import random
+import asyncio
+import logging
+import threading
+from functools import lru_cache
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import PROVIDER_CALL_SECONDS, PROVIDER_CALLS_IN_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def retryable_errors() -> Tuple[Type[Exception], ...]:
+    """Provider errors worth retrying (the SDK is imported here, on first use, as it is slow to import)."""
+    import openai
+    return (
+        openai.RateLimitError,
+        openai.APIConnectionError,
+        openai.APITimeoutError,
+        openai.InternalServerError,
+    )
+
+
+def is_rate_limit(error: Exception) -> bool:
+    import openai
+    return isinstance(error, openai.RateLimitError)
+
+
+class ProviderRateLimitError(Exception):
+    """Raised when the provider keeps rate limiting us after all retries."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``rate`` tokens per second.
+
+    Shared by every request in the process (sync callers in threads and async
+    callers on the event loop), so the combined send rate stays under the
+    provider quota instead of bursting past it.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self, amount: float) -> float:
+        """Take ``amount`` tokens (possibly going negative) and return the wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # A single request larger than the bucket still goes through, it just waits longer
+            self._tokens -= min(amount, self.capacity)
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller back for ``seconds`` (after a 429 with Retry-After)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        wait = self._reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, amount: float = 1.0) -> None:
+        wait = self._reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Client-side limiter and retry scheduler for provider calls.
+
+    Each call takes one token from the request bucket and ``audio_seconds``
+    tokens from the audio bucket (either bucket is disabled when its per-minute
+    limit is 0). Retryable failures are retried with exponential backoff and
+    full jitter; a ``Retry-After`` from the provider is honored and pauses the
+    shared buckets so other requests back off too.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = None,
+        audio_seconds_per_minute: float = None,
+        max_attempts: int = None,
+        base_delay: float = None,
+        max_delay: float = None,
+    ):
+        requests_per_minute = settings.rate_limit_requests_per_minute if requests_per_minute is None else requests_per_minute
+        audio_seconds_per_minute = settings.rate_limit_audio_seconds_per_minute if audio_seconds_per_minute is None else audio_seconds_per_minute
+        self.requests = TokenBucket(requests_per_minute / 60.0, max(requests_per_minute / 6.0, 1.0)) if requests_per_minute > 0 else None
+        self.audio = TokenBucket(audio_seconds_per_minute / 60.0, audio_seconds_per_minute) if audio_seconds_per_minute > 0 else None
+        self.max_attempts = max(max_attempts or settings.retry_max_attempts, 1)
+        self.base_delay = settings.retry_base_delay if base_delay is None else base_delay
+        self.max_delay = settings.retry_max_delay if max_delay is None else max_delay
+
+        self.retries = 0
+        self.rate_limited = 0
+
+    async def call(self, fn: Callable[[], Awaitable[T]], audio_seconds: float = 0.0) -> T:
+        """
+        Run an async provider call under the limiter with retries.
+
+        Args:
+            fn: Zero-argument coroutine function making the call
+            audio_seconds: Audio duration the call consumes
+
+        Returns:
+            The call's result
+        """
+        for attempt in range(self.max_attempts):
+            if self.requests is not None:
+                await self.requests.acquire()
+            if self.audio is not None and audio_seconds:
+                await self.audio.acquire(audio_seconds)
+            PROVIDER_CALLS_IN_FLIGHT.inc()
+            start = time.perf_counter()
+            error: Optional[BaseException] = None
+            try:
+                return await fn()
+            except asyncio.CancelledError as e:
+                # Client disconnects and stage timeouts cancel calls in flight
+                error = e
+                raise
+            except Exception as e:
+                error = e
+                if not isinstance(e, retryable_errors()):
+                    raise
+                delay = self._on_error(e, attempt)
+            finally:
+                self._observe(start, error)
+            await asyncio.sleep(delay)
+
+    def call_sync(self, fn: Callable[[], T], audio_seconds: float = 0.0) -> T:
+        """Blocking counterpart of ``call`` for the sync client."""
+        for attempt in range(self.max_attempts):
+            if self.requests is not None:
+                self.requests.acquire_sync()
+            if self.audio is not None and audio_seconds:
+                self.audio.acquire_sync(audio_seconds)
+            PROVIDER_CALLS_IN_FLIGHT.inc()
+            start = time.perf_counter()
+            error: Optional[BaseException] = None
+            try:
+                return fn()
+            except Exception as e:
+                error = e
+                if not isinstance(e, retryable_errors()):
+                    raise
+                delay = self._on_error(e, attempt)
+            finally:
+                self._observe(start, error)
+            time.sleep(delay)
+
+    def stats(self) -> dict:
+        return {"retries": self.retries, "rate_limited": self.rate_limited}
+
+    @staticmethod
+    def _observe(start: float, error: Optional[BaseException] = None) -> None:
+        """Count the call as finished, however it ended (called from ``finally``)."""
+        PROVIDER_CALLS_IN_FLIGHT.dec()
+        outcome = "ok" if error is None else type(error).__name__
+        PROVIDER_CALL_SECONDS.labels(outcome).observe(time.perf_counter() - start)
+
+    def _on_error(self, error: Exception, attempt: int) -> float:
+        """Decide how long to wait before retrying, or re-raise."""
+        retry_after = retry_after_seconds(error)
+        if is_rate_limit(error):
+            self.rate_limited += 1
+            if retry_after:
+                for bucket in (self.requests, self.audio):
+                    if bucket is not None:
+                        bucket.pause(min(retry_after, self.max_delay))
+
+        last_attempt = attempt + 1 >= self.max_attempts
+        if last_attempt or (retry_after is not None and retry_after > self.max_delay):
+            if is_rate_limit(error):
+                raise ProviderRateLimitError(f"Provider rate limit exceeded: {error}", retry_after) from error
+            raise error
+
+        delay = retry_after if retry_after is not None else random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** attempt)
+        )
+        self.retries += 1
+        logger.warning(f"Provider call failed ({type(error).__name__}), retry {attempt + 1} in {delay:.2f}s")
+        return delay
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Read the provider's Retry-After hint from an API error.
+
+    Args:
+        error: Exception raised by the OpenAI client
+
+    Returns:
+        Seconds to wait, or None if the response carried no hint
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,187 @@
+"""
+Slide renderer, the last stage of the design.md pipeline.
+
+HTML templates are compiled once when the renderer is created; a deck is
+rendered as a stream of per-slide fragments so the response can start
+before the whole deck is rendered. PDF pages are laid out per slide in a
+process pool and merged. Laid-out PDF pages are cached on a hash of the
+slide and deck style, so re-exporting a deck after editing one slide only
+lays out that slide again. (HTML fragments are not cached: a compiled
+template renders a slide faster than the slide can be hashed.)
+"""
+import os
+import re
+import json
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from app.core.config import settings
+from app.models.schemas import DeckResponse
+from app.services.cache_service import ResultCache
+from app.services.pdf_writer import assemble_pdf, render_notes_page, render_slide_page
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates", "deck")
+TEMPLATES = ("deck_start.html", "slide.html", "deck_end.html")
+
+DEFAULT_FONT = "system-ui, -apple-system, 'Segoe UI', Helvetica, Arial, sans-serif"
+_SAFE_FONT = re.compile(r"^[\w\s,-]{1,80}$")
+
+LAYOUT_VERSION = "pdf-1"  # bump when the PDF layout changes, to invalidate cached pages
+
+
+def _pdf_page(kind: str, slide: Dict, style: Optional[Dict[str, str]]) -> str:
+    if kind == "notes":
+        return render_notes_page(slide)
+    return render_slide_page(slide, style)
+
+
+def _pdf_pages(jobs: List[Tuple[str, Dict]], style: Optional[Dict[str, str]]) -> List[str]:
+    """Process pool entry point: lay out a batch of PDF pages."""
+    return [_pdf_page(kind, slide, style) for kind, slide in jobs]
+
+
+class DeckRenderer:
+    """
+    Renders decks to HTML and PDF.
+
+    Args:
+        cache: Store for laid-out PDF pages (None disables caching)
+        pdf_workers: Processes used to lay out PDF pages (0 for one per CPU)
+    """
+
+    def __init__(self, cache: Optional[ResultCache] = None, pdf_workers: int = 0):
+        self.cache = cache
+        self.pdf_workers = pdf_workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        env = Environment(
+            loader=FileSystemLoader(TEMPLATE_DIR),
+            autoescape=select_autoescape(["html"]),
+            auto_reload=False,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        self._start, self._slide, self._end = (env.get_template(name) for name in TEMPLATES)
+
+    async def stream_html(self, deck: DeckResponse) -> AsyncIterator[str]:
+        """
+        Render a deck as HTML, one chunk per slide.
+
+        Args:
+            deck: Deck to render
+
+        Yields:
+            HTML chunks: the document head, each slide, the document end
+        """
+        yield self._start.render(deck=deck, font=self._font(deck))
+        for number, slide in enumerate(deck.slides, start=1):
+            yield self._slide.render(slide=slide, number=number)
+            # Let other requests run between slides of a large deck
+            await asyncio.sleep(0)
+        yield self._end.render(deck=deck)
+
+    def render_html(self, deck: DeckResponse) -> str:
+        """Render a whole deck as one HTML document."""
+        parts = [self._start.render(deck=deck, font=self._font(deck))]
+        parts.extend(self._slide.render(slide=slide, number=number) for number, slide in enumerate(deck.slides, start=1))
+        parts.append(self._end.render(deck=deck))
+        return "".join(parts)
+
+    async def render_pdf(self, deck: DeckResponse, notes: bool = False) -> bytes:
+        """
+        Render a deck as a PDF, one page per slide.
+
+        Pages missing from the cache are laid out in the process pool, in one
+        batch per worker, when there are at least
+        ``render_pdf_parallel_min_pages`` of them; below that the round trip
+        to the workers costs more than it saves.
+
+        Args:
+            deck: Deck to render
+            notes: Add a speaker notes page after each slide
+
+        Returns:
+            PDF file bytes
+        """
+        jobs = []
+        for slide in deck.slides:
+            data = slide.model_dump()
+            jobs.append(("slide", data))
+            if notes:
+                jobs.append(("notes", data))
+
+        pages: List[Optional[str]] = []
+        keys: List[Optional[str]] = []
+        for kind, data in jobs:
+            key, cached = self._cache_lookup(f"pdf_{kind}", data, deck.style)
+            keys.append(key)
+            pages.append(cached)
+
+        missing = [i for i, page in enumerate(pages) if page is None]
+        if len(missing) >= max(settings.render_pdf_parallel_min_pages, 1) and self.pdf_workers > 1:
+            loop = asyncio.get_running_loop()
+            pool = self._get_pool()
+            size = -(-len(missing) // self.pdf_workers)
+            batches = [missing[start:start + size] for start in range(0, len(missing), size)]
+            results = await asyncio.gather(*(
+                loop.run_in_executor(pool, _pdf_pages, [jobs[i] for i in batch], deck.style) for batch in batches
+            ))
+            rendered = [page for result in results for page in result]
+        else:
+            rendered = [_pdf_page(jobs[i][0], jobs[i][1], deck.style) for i in missing]
+
+        for i, page in zip(missing, rendered):
+            pages[i] = page
+            self._cache_store(keys[i], page)
+
+        logger.info(f"Rendered {len(pages)}-page PDF ({len(missing)} pages laid out, {len(pages) - len(missing)} cached)")
+        return assemble_pdf(pages, deck.title)
+
+    def close(self) -> None:
+        """Shut down the PDF worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawned, not forked: forking this multithreaded server can copy a
+            # lock held by another thread into the child and deadlock it
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.pdf_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    @staticmethod
+    def _font(deck: DeckResponse) -> str:
+        font = (deck.style or {}).get("font", "")
+        # The style guide is model output; only plain family names reach the CSS
+        if font and _SAFE_FONT.match(font):
+            return f"{font.strip()}, {DEFAULT_FONT}"
+        return DEFAULT_FONT
+
+    def _cache_lookup(self, kind: str, data: Dict, style: Optional[Dict[str, str]]):
+        if self.cache is None:
+            return None, None
+        content = json.dumps(data, sort_keys=True).encode("utf-8")
+        key = ResultCache.make_key(content, kind, LAYOUT_VERSION, json.dumps(style or {}, sort_keys=True))
+        return key, self.cache.get(key)
+
+    def _cache_store(self, key: Optional[str], value: str) -> None:
+        if self.cache is not None and key is not None:
+            self.cache.put(key, value)
+
+
+def create_renderer() -> DeckRenderer:
+    """Build the deck renderer (and its page cache) from settings."""
+    cache = None
+    if settings.render_cache_entries > 0:
+        cache = ResultCache(max_entries=settings.render_cache_entries)
+    return DeckRenderer(cache=cache, pdf_workers=settings.render_pdf_workers)
@@ -0,0 +1,102 @@
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Fixed-capacity FIFO of audio samples backed by one preallocated array.
+
+    Writes never allocate; once the buffer is full the oldest samples are
+    overwritten (and counted in ``dropped``) so memory stays bounded no
+    matter how much audio is pushed through it. A ``growable`` buffer instead
+    doubles its capacity when a write would overflow, for producers that must
+    not lose audio while a consumer briefly falls behind.
+    """
+
+    def __init__(self, capacity: int, channels: int = 1, dtype=np.float32, growable: bool = False):
+        if capacity <= 0:
+            raise ValueError("RingBuffer capacity must be positive")
+        shape = (capacity,) if channels == 1 else (capacity, channels)
+        self._data = np.zeros(shape, dtype=dtype)
+        self.capacity = capacity
+        self.growable = growable
+        self._start = 0
+        self._size = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def write(self, samples: np.ndarray) -> None:
+        """
+        Append samples, overwriting the oldest ones if the buffer is full.
+
+        Args:
+            samples: Samples shaped like the buffer's frames
+        """
+        n = len(samples)
+        if n == 0:
+            return
+        if self.growable and self._size + n > self.capacity:
+            self._grow(self._size + n)
+        if n >= self.capacity:
+            self.dropped += self._size + n - self.capacity
+            self._data[:] = samples[-self.capacity:]
+            self._start = 0
+            self._size = self.capacity
+            return
+
+        overflow = max(self._size + n - self.capacity, 0)
+        if overflow:
+            self.dropped += overflow
+            self._start = (self._start + overflow) % self.capacity
+            self._size -= overflow
+
+        end = (self._start + self._size) % self.capacity
+        first = min(n, self.capacity - end)
+        self._data[end:end + first] = samples[:first]
+        self._data[:n - first] = samples[first:]
+        self._size += n
+
+    def peek(self, n: int = None) -> np.ndarray:
+        """
+        Copy the oldest ``n`` samples (all of them by default) without consuming.
+
+        Args:
+            n: Number of samples to copy
+
+        Returns:
+            Contiguous copy of the samples in order
+        """
+        n = self._size if n is None else min(n, self._size)
+        end = self._start + n
+        if end <= self.capacity:
+            return self._data[self._start:end].copy()
+        return np.concatenate((self._data[self._start:], self._data[:end - self.capacity]))
+
+    def consume(self, n: int) -> np.ndarray:
+        """
+        Remove and return the oldest ``n`` samples.
+
+        Args:
+            n: Number of samples to take
+
+        Returns:
+            Contiguous copy of the samples in order
+        """
+        samples = self.peek(n)
+        self._start = (self._start + len(samples)) % self.capacity
+        self._size -= len(samples)
+        return samples
+
+    def _grow(self, required: int) -> None:
+        capacity = max(self.capacity * 2, required)
+        data = np.zeros((capacity,) + self._data.shape[1:], dtype=self._data.dtype)
+        data[:self._size] = self.peek()
+        self._data = data
+        self.capacity = capacity
+        self._start = 0
+
+    def clear(self) -> None:
+        """Drop all buffered samples."""
+        self._start = 0
+        self._size = 0
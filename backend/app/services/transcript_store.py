@@ -0,0 +1,195 @@
+"""
+Persistent store of transcription and translation results.
+
+Results are kept in an embedded SQLite database with an FTS5 index over the
+filename, transcription and translation, so finding an earlier recording is
+an indexed query instead of processing the audio again. The index is an
+external-content table kept in sync by triggers, so the text is stored once.
+"""
+import os
+import re
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    operation TEXT NOT NULL,
+    filename TEXT,
+    transcription TEXT NOT NULL DEFAULT '',
+    translation TEXT NOT NULL DEFAULT '',
+    language TEXT,
+    duration REAL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS transcripts_fts USING fts5(
+    filename, transcription, translation,
+    content='transcripts', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS transcripts_ai AFTER INSERT ON transcripts BEGIN
+    INSERT INTO transcripts_fts(rowid, filename, transcription, translation)
+    VALUES (new.id, new.filename, new.transcription, new.translation);
+END;
+
+CREATE TRIGGER IF NOT EXISTS transcripts_ad AFTER DELETE ON transcripts BEGIN
+    INSERT INTO transcripts_fts(transcripts_fts, rowid, filename, transcription, translation)
+    VALUES ('delete', old.id, old.filename, old.transcription, old.translation);
+END;
+
+CREATE TRIGGER IF NOT EXISTS transcripts_au AFTER UPDATE ON transcripts BEGIN
+    INSERT INTO transcripts_fts(transcripts_fts, rowid, filename, transcription, translation)
+    VALUES ('delete', old.id, old.filename, old.transcription, old.translation);
+    INSERT INTO transcripts_fts(rowid, filename, transcription, translation)
+    VALUES (new.id, new.filename, new.transcription, new.translation);
+END;
+"""
+
+COLUMNS = "id, created_at, operation, filename, transcription, translation, language, duration"
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 query that cannot be a syntax error.
+
+    Every word must match, as a prefix ("meet" finds "meeting"); FTS5
+    operators and punctuation in the input are ignored.
+
+    Args:
+        text: Search text as typed by the user
+
+    Returns:
+        FTS5 MATCH expression, or an empty string if there are no words
+    """
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+
+class TranscriptStore:
+    """
+    SQLite-backed transcript store with full-text search.
+
+    One connection is shared by all threads behind a lock; calls are short
+    indexed queries and should be run in a worker thread from async code.
+
+    Args:
+        path: Database file (created if missing), or ":memory:"
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # WAL lets readers run while a result is being written
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def add(
+        self,
+        operation: str,
+        filename: Optional[str],
+        transcription: str = "",
+        translation: str = "",
+        language: Optional[str] = None,
+        duration: Optional[float] = None,
+    ) -> int:
+        """
+        Save a result.
+
+        Args:
+            operation: Operation that produced it (transcribe, translate, ...)
+            filename: Original recording name
+            transcription: Transcribed text, if any
+            translation: English translation, if any
+            language: Spoken language, if known
+            duration: Recording length in seconds, if known
+
+        Returns:
+            The new transcript's id
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO transcripts (created_at, operation, filename, transcription, translation, language, duration) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), operation, filename, transcription or "", translation or "", language, duration),
+            )
+            return cursor.lastrowid
+
+    def get(self, transcript_id: int) -> Optional[Dict[str, Any]]:
+        """Fetch one transcript by id."""
+        with self._lock:
+            row = self._conn.execute(f"SELECT {COLUMNS} FROM transcripts WHERE id = ?", (transcript_id,)).fetchone()
+        return dict(row) if row else None
+
+    def list(self, limit: int = 20, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Page through transcripts, newest first.
+
+        Args:
+            limit: Page size
+            offset: Transcripts to skip
+
+        Returns:
+            Tuple of (transcripts on the page, total number of transcripts)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {COLUMNS} FROM transcripts ORDER BY id DESC LIMIT ? OFFSET ?", (limit, offset)
+            ).fetchall()
+            total = self._conn.execute("SELECT count(*) FROM transcripts").fetchone()[0]
+        return [dict(row) for row in rows], total
+
+    def search(self, text: str, limit: int = 20, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Full-text search, best matches first (BM25).
+
+        Args:
+            text: Search text; see ``fts_query``
+            limit: Page size
+            offset: Matches to skip
+
+        Returns:
+            Tuple of (matching transcripts with a ``snippet``, total matches)
+        """
+        query = fts_query(text)
+        if not query:
+            return [], 0
+
+        columns = ", ".join(f"t.{column.strip()}" for column in COLUMNS.split(","))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {columns}, snippet(transcripts_fts, -1, '**', '**', '...', 16) AS snippet "
+                "FROM transcripts_fts JOIN transcripts t ON t.id = transcripts_fts.rowid "
+                "WHERE transcripts_fts MATCH ? ORDER BY rank LIMIT ? OFFSET ?",
+                (query, limit, offset),
+            ).fetchall()
+            total = self._conn.execute(
+                "SELECT count(*) FROM transcripts_fts WHERE transcripts_fts MATCH ?", (query,)
+            ).fetchone()[0]
+        return [dict(row) for row in rows], total
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_transcript_store() -> Optional[TranscriptStore]:
+    """Open the transcript store from settings (None if disabled)."""
+    if not settings.transcript_store_enabled:
+        return None
+    logger.info(f"Transcript store: {settings.transcript_db_path}")
+    return TranscriptStore(settings.transcript_db_path)
@@ -0,0 +1,534 @@
+"""
+Transcription backends behind ``AudioService``.
+
+``AudioService`` handles caching, preprocessing and chunking, then hands the
+prepared audio to a backend selected by ``settings.transcription_backend``:
+
+- ``openai``: the OpenAI audio API (pooled HTTP client, rate limited)
+- ``local``: a quantized Whisper model running in-process on the CPU via
+  faster-whisper, batching concurrent short clips into one forward pass
+- ``auto``: local for clips up to ``settings.local_max_seconds``, OpenAI for
+  longer ones or when the local engine fails
+"""
+import asyncio
+import logging
+import threading
+import importlib.util
+from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+
+import anyio
+import numpy as np
+
+from app.core.config import settings
+from app.services.audio_processing import PreparedAudio, decode_audio, resample, to_mono
+from app.services.http_client import close_http_clients, http_timeout, shared_http_clients
+from app.services.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+    from openai import AsyncOpenAI, OpenAI
+
+# The SDKs are imported on first use: the OpenAI SDK and faster-whisper
+# (CTranslate2, tokenizers) dominate import time, and the local engine is optional
+FASTER_WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
+
+logger = logging.getLogger(__name__)
+
+# Whisper works on 30 s windows of 16 kHz audio
+WHISPER_SAMPLE_RATE = 16000
+WHISPER_WINDOW_SECONDS = 30
+
+
+class TranscriptionBackend(ABC):
+    """
+    Interface for speech-to-text engines.
+
+    Backends receive audio that has already been preprocessed (resampled and
+    trimmed of silence, as configured). The async methods default to running
+    the sync ones in a worker thread. Subclasses must implement
+    ``model_name``, ``transcribe`` and ``translate``; one missing a method
+    cannot be instantiated.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def model_name(self, operation: str) -> str:
+        """
+        Identify the model serving an operation, for result cache keys.
+
+        Args:
+            operation: "transcribe", "translate" or "stream"
+        """
+
+    @abstractmethod
+    def transcribe(self, prepared: PreparedAudio, prompt: str) -> str:
+        """Transcribe prepared audio in its spoken language."""
+
+    @abstractmethod
+    def translate(self, prepared: PreparedAudio) -> str:
+        """Translate prepared audio to English text."""
+
+    def stream_transcribe(self, prepared: PreparedAudio, prompt: str) -> Iterator[str]:
+        """Yield transcript deltas in order (one piece by default)."""
+        yield self.transcribe(prepared, prompt)
+
+    async def transcribe_async(self, prepared: PreparedAudio, prompt: str) -> str:
+        return await anyio.to_thread.run_sync(self.transcribe, prepared, prompt)
+
+    async def translate_async(self, prepared: PreparedAudio) -> str:
+        return await anyio.to_thread.run_sync(self.translate, prepared)
+
+    async def stream_transcribe_async(self, prepared: PreparedAudio, prompt: str) -> AsyncIterator[str]:
+        yield await self.transcribe_async(prepared, prompt)
+
+    def retry_stats(self) -> Dict[str, int]:
+        """Provider retry counters (empty for backends that don't retry)."""
+        return {}
+
+    async def aclose(self) -> None:
+        """Release connections or models (called on app shutdown)."""
+
+
+class OpenAIBackend(TranscriptionBackend):
+    """OpenAI audio API through a shared, rate limited connection pool."""
+
+    name = "openai"
+
+    def __init__(self):
+        # One pooled connection per host, shared with the chat model until aclose()
+        self.http_client, self.async_http_client = shared_http_clients()
+        self.rate_limiter = RateLimiter()
+
+    # The SDK clients are created on first use, so startup does not import
+    # the SDK and a missing API key only fails the calls that need it.
+    # Retries are handled by the shared rate limiter, not the SDK.
+    @cached_property
+    def client(self) -> "OpenAI":
+        from openai import OpenAI
+        return OpenAI(
+            api_key=settings.openai_api_key,
+            http_client=self.http_client,
+            timeout=http_timeout(),
+            max_retries=0
+        )
+
+    @cached_property
+    def async_client(self) -> "AsyncOpenAI":
+        from openai import AsyncOpenAI
+        return AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=self.async_http_client,
+            timeout=http_timeout(),
+            max_retries=0
+        )
+
+    def model_name(self, operation: str) -> str:
+        if operation == "stream":
+            return settings.openai_model_stream
+        return settings.openai_model_transcribe
+
+    def transcribe(self, prepared: PreparedAudio, prompt: str) -> str:
+        return self.rate_limiter.call_sync(
+            lambda: self.client.audio.transcriptions.create(
+                model=settings.openai_model_transcribe,
+                file=prepared.audio_file,
+                response_format="text",
+                prompt=prompt,
+            ),
+            audio_seconds=prepared.speech_seconds,
+        )
+
+    def translate(self, prepared: PreparedAudio) -> str:
+        translation = self.rate_limiter.call_sync(
+            lambda: self.client.audio.translations.create(
+                model=settings.openai_model_transcribe,
+                file=prepared.audio_file,
+            ),
+            audio_seconds=prepared.speech_seconds,
+        )
+        return translation.text
+
+    def stream_transcribe(self, prepared: PreparedAudio, prompt: str) -> Iterator[str]:
+        stream = self.rate_limiter.call_sync(
+            lambda: self.client.audio.transcriptions.create(
+                model=settings.openai_model_stream,
+                file=prepared.audio_file,
+                response_format="text",
+                prompt=prompt,
+                stream=True,
+            ),
+            audio_seconds=prepared.speech_seconds,
+        )
+        full_transcription = ""
+        for event in stream:
+            delta = self._stream_event_delta(event, full_transcription)
+            if delta:
+                full_transcription += delta
+                yield delta
+
+    async def transcribe_async(self, prepared: PreparedAudio, prompt: str) -> str:
+        return await self.rate_limiter.call(
+            lambda: self.async_client.audio.transcriptions.create(
+                model=settings.openai_model_transcribe,
+                file=prepared.audio_file,
+                response_format="text",
+                prompt=prompt,
+            ),
+            audio_seconds=prepared.speech_seconds,
+        )
+
+    async def translate_async(self, prepared: PreparedAudio) -> str:
+        translation = await self.rate_limiter.call(
+            lambda: self.async_client.audio.translations.create(
+                model=settings.openai_model_transcribe,
+                file=prepared.audio_file,
+            ),
+            audio_seconds=prepared.speech_seconds,
+        )
+        return translation.text
+
+    async def stream_transcribe_async(self, prepared: PreparedAudio, prompt: str) -> AsyncIterator[str]:
+        stream = await self.rate_limiter.call(
+            lambda: self.async_client.audio.transcriptions.create(
+                model=settings.openai_model_stream,
+                file=prepared.audio_file,
+                response_format="text",
+                prompt=prompt,
+                stream=True,
+            ),
+            audio_seconds=prepared.speech_seconds,
+        )
+        full_transcription = ""
+        async for event in stream:
+            delta = self._stream_event_delta(event, full_transcription)
+            if delta:
+                full_transcription += delta
+                yield delta
+
+    @staticmethod
+    def _stream_event_delta(event, full_transcription: str) -> str:
+        """
+        Extract the new text carried by a streaming transcription event.
+
+        Args:
+            event: Event from the OpenAI transcription stream
+            full_transcription: Text received so far
+
+        Returns:
+            Text to append, or an empty string
+        """
+        if hasattr(event, 'delta') and event.delta:
+            return event.delta
+        if hasattr(event, 'text') and event.text:
+            # The final event repeats the whole transcript; only emit what's missing
+            if event.text.startswith(full_transcription):
+                return event.text[len(full_transcription):]
+        return ""
+
+    def retry_stats(self) -> Dict[str, int]:
+        return self.rate_limiter.stats()
+
+    async def aclose(self) -> None:
+        await close_http_clients()
+
+
+class LocalWhisperBackend(TranscriptionBackend):
+    """
+    Whisper running in-process on the CPU (faster-whisper / CTranslate2).
+
+    The model is loaded on first use from ``settings.local_model_path`` (a
+    converted model directory or a faster-whisper model size) with
+    ``settings.local_compute_type`` quantization. Async requests for clips
+    that fit one 30 s window are queued for up to
+    ``settings.local_batch_window_ms`` and decoded together, up to
+    ``settings.local_batch_size`` at a time, which keeps the CPU busy with
+    one large forward pass instead of many small ones. Longer clips go
+    through faster-whisper's sequential long-form decoding.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        model_path: str = None,
+        batch_size: int = None,
+        batch_window_ms: int = None,
+    ):
+        if not FASTER_WHISPER_AVAILABLE:
+            raise RuntimeError("The local transcription backend requires the faster-whisper package")
+        self.model_path = model_path or settings.local_model_path
+        self.batch_size = max(batch_size or settings.local_batch_size, 1)
+        self.batch_window = (batch_window_ms if batch_window_ms is not None else settings.local_batch_window_ms) / 1000.0
+        self.language = settings.local_language
+        self.beam_size = settings.local_beam_size
+
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._pending: List[Tuple[np.ndarray, str, Optional[str], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()
+
+    def model_name(self, operation: str) -> str:
+        return f"local:{self.model_path}:{settings.local_compute_type}"
+
+    def _load_model(self) -> "WhisperModel":
+        with self._model_lock:
+            if self._model is None:
+                from faster_whisper import WhisperModel
+                logger.info(f"Loading local Whisper model {self.model_path} ({settings.local_compute_type})")
+                self._model = WhisperModel(
+                    self.model_path,
+                    device="cpu",
+                    compute_type=settings.local_compute_type,
+                    cpu_threads=settings.local_cpu_threads,
+                    num_workers=settings.local_workers,
+                )
+            return self._model
+
+    @staticmethod
+    def _samples(prepared: PreparedAudio) -> np.ndarray:
+        """Decode prepared audio to 16 kHz mono float32, as Whisper expects."""
+        name, content = prepared.audio_file
+        sample_rate, samples = decode_audio(content, name)
+        samples = resample(to_mono(samples), sample_rate, WHISPER_SAMPLE_RATE)
+        return samples.astype(np.float32, copy=False)
+
+    @staticmethod
+    def _fits_window(samples: np.ndarray) -> bool:
+        return len(samples) <= WHISPER_WINDOW_SECONDS * WHISPER_SAMPLE_RATE
+
+    def _decode_batch(self, clips: List[np.ndarray], task: str, prompt: Optional[str]) -> List[str]:
+        """
+        Decode several clips of at most 30 s in one encoder/decoder pass.
+
+        Args:
+            clips: 16 kHz mono float32 clips
+            task: "transcribe" or "translate"
+            prompt: Text to condition the decoder on, if any
+
+        Returns:
+            Text for each clip, in order
+        """
+        from faster_whisper.audio import pad_or_trim
+        from faster_whisper.tokenizer import Tokenizer
+
+        model = self._load_model()
+        features = np.stack([pad_or_trim(model.feature_extractor(clip)[..., :-1]) for clip in clips])
+        encoder_output = model.encode(features)
+
+        multilingual = model.model.is_multilingual
+        if not multilingual:
+            languages = ["en"] * len(clips)
+        elif self.language:
+            languages = [self.language] * len(clips)
+        else:
+            # Best guess per clip, e.g. "<|de|>" -> "de"
+            languages = [
+                candidates[0][0][2:-2] for candidates in model.model.detect_language(encoder_output)
+            ]
+
+        tokenizers = [Tokenizer(model.hf_tokenizer, multilingual, task=task, language=language) for language in languages]
+        prompts = [
+            model.get_prompt(
+                tokenizer,
+                previous_tokens=tokenizer.encode(" " + prompt.strip()) if prompt else [],
+                without_timestamps=True,
+            )
+            for tokenizer in tokenizers
+        ]
+        results = model.model.generate(
+            encoder_output,
+            prompts,
+            beam_size=self.beam_size,
+            max_length=model.max_length,
+            suppress_blank=True,
+        )
+        return [
+            tokenizer.decode(result.sequences_ids[0]).strip()
+            for tokenizer, result in zip(tokenizers, results)
+        ]
+
+    def _segments(self, samples: np.ndarray, task: str, prompt: Optional[str]):
+        """Lazily decode a clip of any length window by window."""
+        segments, _ = self._load_model().transcribe(
+            samples,
+            task=task,
+            language=self.language,
+            initial_prompt=prompt,
+            beam_size=self.beam_size,
+        )
+        return segments
+
+    def _run(self, samples: np.ndarray, task: str, prompt: Optional[str]) -> str:
+        if self._fits_window(samples):
+            return self._decode_batch([samples], task, prompt)[0]
+        return "".join(segment.text for segment in self._segments(samples, task, prompt)).strip()
+
+    def transcribe(self, prepared: PreparedAudio, prompt: str) -> str:
+        return self._run(self._samples(prepared), "transcribe", prompt)
+
+    def translate(self, prepared: PreparedAudio) -> str:
+        return self._run(self._samples(prepared), "translate", None)
+
+    def stream_transcribe(self, prepared: PreparedAudio, prompt: str) -> Iterator[str]:
+        first = True
+        for segment in self._segments(self._samples(prepared), "transcribe", prompt):
+            text = segment.text.lstrip() if first else segment.text
+            if text:
+                first = False
+                yield text
+
+    async def _run_async(self, prepared: PreparedAudio, task: str, prompt: Optional[str]) -> str:
+        samples = await anyio.to_thread.run_sync(self._samples, prepared)
+        if not self._fits_window(samples):
+            return await anyio.to_thread.run_sync(self._run, samples, task, prompt)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((samples, task, prompt, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Start decoding everything queued, one batch per (task, prompt)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+
+        groups: Dict[Tuple[str, Optional[str]], list] = {}
+        for item in pending:
+            groups.setdefault((item[1], item[2]), []).append(item)
+        for (task, prompt), items in groups.items():
+            batch = asyncio.ensure_future(self._run_batch(items, task, prompt))
+            self._batches.add(batch)
+            batch.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, items: list, task: str, prompt: Optional[str]) -> None:
+        futures = [item[3] for item in items]
+        try:
+            texts = await anyio.to_thread.run_sync(self._decode_batch, [item[0] for item in items], task, prompt)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        logger.info(f"Local {task} batch of {len(items)} clips done")
+        for future, text in zip(futures, texts):
+            # Requests may have been cancelled while the batch ran
+            if not future.done():
+                future.set_result(text)
+
+    async def transcribe_async(self, prepared: PreparedAudio, prompt: str) -> str:
+        return await self._run_async(prepared, "transcribe", prompt)
+
+    async def translate_async(self, prepared: PreparedAudio) -> str:
+        return await self._run_async(prepared, "translate", None)
+
+    async def stream_transcribe_async(self, prepared: PreparedAudio, prompt: str) -> AsyncIterator[str]:
+        samples = await anyio.to_thread.run_sync(self._samples, prepared)
+        segments = await anyio.to_thread.run_sync(self._segments, samples, "transcribe", prompt)
+        first = True
+        while True:
+            # Each segment is decoded on demand, so step the generator off the event loop
+            segment = await anyio.to_thread.run_sync(next, segments, None)
+            if segment is None:
+                break
+            text = segment.text.lstrip() if first else segment.text
+            if text:
+                first = False
+                yield text
+
+    async def aclose(self) -> None:
+        await asyncio.gather(*self._batches, return_exceptions=True)
+
+
+class AutoBackend(TranscriptionBackend):
+    """
+    Route short clips to the local engine and everything else to OpenAI.
+
+    Clips with at most ``settings.local_max_seconds`` of speech are decoded
+    locally, saving the provider round trip and cost; longer clips, and any
+    clip the local engine fails on, go to OpenAI.
+    """
+
+    name = "auto"
+
+    def __init__(self, local: TranscriptionBackend, remote: TranscriptionBackend, max_local_seconds: float = None):
+        self.local = local
+        self.remote = remote
+        self.max_local_seconds = settings.local_max_seconds if max_local_seconds is None else max_local_seconds
+
+    def model_name(self, operation: str) -> str:
+        return f"auto:{self.local.model_name(operation)}:{self.remote.model_name(operation)}"
+
+    def _use_local(self, prepared: PreparedAudio) -> bool:
+        return prepared.speech_seconds <= self.max_local_seconds
+
+    def transcribe(self, prepared: PreparedAudio, prompt: str) -> str:
+        if self._use_local(prepared):
+            try:
+                return self.local.transcribe(prepared, prompt)
+            except Exception as e:
+                logger.warning(f"Local transcription failed, falling back to {self.remote.name}: {e}")
+        return self.remote.transcribe(prepared, prompt)
+
+    def translate(self, prepared: PreparedAudio) -> str:
+        if self._use_local(prepared):
+            try:
+                return self.local.translate(prepared)
+            except Exception as e:
+                logger.warning(f"Local translation failed, falling back to {self.remote.name}: {e}")
+        return self.remote.translate(prepared)
+
+    def stream_transcribe(self, prepared: PreparedAudio, prompt: str) -> Iterator[str]:
+        backend = self.local if self._use_local(prepared) else self.remote
+        return backend.stream_transcribe(prepared, prompt)
+
+    async def transcribe_async(self, prepared: PreparedAudio, prompt: str) -> str:
+        if self._use_local(prepared):
+            try:
+                return await self.local.transcribe_async(prepared, prompt)
+            except Exception as e:
+                logger.warning(f"Local transcription failed, falling back to {self.remote.name}: {e}")
+        return await self.remote.transcribe_async(prepared, prompt)
+
+    async def translate_async(self, prepared: PreparedAudio) -> str:
+        if self._use_local(prepared):
+            try:
+                return await self.local.translate_async(prepared)
+            except Exception as e:
+                logger.warning(f"Local translation failed, falling back to {self.remote.name}: {e}")
+        return await self.remote.translate_async(prepared)
+
+    async def stream_transcribe_async(self, prepared: PreparedAudio, prompt: str) -> AsyncIterator[str]:
+        backend = self.local if self._use_local(prepared) else self.remote
+        async for delta in backend.stream_transcribe_async(prepared, prompt):
+            yield delta
+
+    def retry_stats(self) -> Dict[str, int]:
+        return self.remote.retry_stats()
+
+    async def aclose(self) -> None:
+        await self.local.aclose()
+        await self.remote.aclose()
+
+
+def create_transcription_backend() -> TranscriptionBackend:
+    """Build the backend selected by ``settings.transcription_backend``."""
+    choice = settings.transcription_backend.lower()
+    if choice == "openai":
+        return OpenAIBackend()
+    if choice == "local":
+        return LocalWhisperBackend()
+    if choice == "auto":
+        if not FASTER_WHISPER_AVAILABLE:
+            logger.warning("faster-whisper is not installed; transcribing everything with OpenAI")
+            return OpenAIBackend()
+        return AutoBackend(LocalWhisperBackend(), OpenAIBackend())
+    raise ValueError(f"Unknown transcription backend: {settings.transcription_backend}")
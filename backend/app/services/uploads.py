@@ -0,0 +1,124 @@
+"""
+Receiving audio uploads without a round trip through the disk.
+
+An upload is read into memory and handed to ``AudioService`` as bytes. Only
+uploads larger than ``settings.upload_spool_max_bytes`` are spooled to a
+temp file, under a unique name so concurrent uploads with the same filename
+cannot collide, and that file is always removed when the upload is closed.
+"""
+import os
+import uuid
+import logging
+from typing import List, Optional
+
+import anyio
+from fastapi import HTTPException, UploadFile
+
+from app.core.config import settings
+from app.services.audio_processing import AudioSource
+
+logger = logging.getLogger(__name__)
+
+
+def upload_too_large() -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File exceeds maximum size of {settings.max_file_size} bytes")
+
+
+class AudioUpload:
+    """
+    An uploaded recording, held in memory or spooled to a temp file.
+
+    Use as an async context manager (or call ``close``) so a spooled file is
+    removed however the request ends.
+
+    Args:
+        name: Original filename, passed on to the provider for the format
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.size = 0
+        self.content: Optional[bytes] = None
+        self.path: Optional[str] = None
+
+    @property
+    def source(self) -> AudioSource:
+        """The bytes, or the spooled file's path; safe to read concurrently."""
+        return self.path if self.path is not None else self.content
+
+    @property
+    def spooled(self) -> bool:
+        return self.path is not None
+
+    @classmethod
+    async def receive(cls, file: UploadFile) -> "AudioUpload":
+        """
+        Read an upload in chunks, enforcing ``settings.max_file_size``.
+
+        Chunks are collected in memory until the upload crosses
+        ``settings.upload_spool_max_bytes``; from then on they go to a uniquely
+        named temp file in the upload directory.
+
+        Args:
+            file: Uploaded file
+
+        Returns:
+            The received upload
+
+        Raises:
+            HTTPException: 413 as soon as the upload exceeds the size limit
+        """
+        if file.size is not None and file.size > settings.max_file_size:
+            raise upload_too_large()
+
+        upload = cls(os.path.basename(file.filename or "audio.wav"))
+        chunks: List[bytes] = []
+        spool = None
+        try:
+            while chunk := await file.read(settings.upload_chunk_size):
+                upload.size += len(chunk)
+                if upload.size > settings.max_file_size:
+                    raise upload_too_large()
+                if spool is None and upload.size > settings.upload_spool_max_bytes:
+                    spool = await upload._open_spool()
+                    for buffered in chunks:
+                        await spool.write(buffered)
+                    chunks.clear()
+                if spool is not None:
+                    await spool.write(chunk)
+                else:
+                    chunks.append(chunk)
+        except BaseException:
+            if spool is not None:
+                await spool.aclose()
+            upload.close()
+            raise
+
+        if spool is not None:
+            await spool.aclose()
+            logger.info(f"Spooled {upload.size}-byte upload {upload.name} to {upload.path}")
+        else:
+            upload.content = b"".join(chunks)
+        return upload
+
+    async def _open_spool(self):
+        os.makedirs(settings.upload_dir, exist_ok=True)
+        _, extension = os.path.splitext(self.name)
+        self.path = os.path.join(settings.upload_dir, f"spool_{uuid.uuid4().hex}{extension}")
+        return await anyio.open_file(self.path, "wb")
+
+    def close(self) -> None:
+        """Drop the content and remove the spooled file, if any."""
+        self.content = None
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
+
+    async def __aenter__(self) -> "AudioUpload":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,107 @@
+"""
+Concurrency benchmark for the upload routes.
+
+Fires N concurrent uploads at /api/v1/transcribe with the OpenAI client
+replaced by a fake that sleeps for a fixed latency, and compares the wall
+clock time against the blocking (sync client) path.
+
+Usage (from the backend directory):
+    python -m benchmarks.concurrency --requests 10 --latency 0.5
+"""
+import argparse
+import asyncio
+import io
+import os
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ["TRANSCRIPTION_BACKEND"] = "openai"  # the fake provider replaces the OpenAI clients
+# Both paths would share one token bucket; measure concurrency, not the limiter
+os.environ["RATE_LIMIT_REQUESTS_PER_MINUTE"] = "0"
+
+import httpx
+
+from app.main import app
+from app.api import routes
+
+
+def _fake_clients(latency: float):
+    """Build sync and async stand-ins for the OpenAI audio endpoints."""
+
+    def create_sync(**kwargs):
+        time.sleep(latency)
+        return "benchmark transcription"
+
+    async def create_async(**kwargs):
+        await asyncio.sleep(latency)
+        return "benchmark transcription"
+
+    sync_client = SimpleNamespace(
+        audio=SimpleNamespace(transcriptions=SimpleNamespace(create=create_sync))
+    )
+    async_client = SimpleNamespace(
+        audio=SimpleNamespace(transcriptions=SimpleNamespace(create=create_async))
+    )
+    return sync_client, async_client
+
+
+async def _upload(client: httpx.AsyncClient, index: int) -> float:
+    start = time.perf_counter()
+    files = {"file": (f"bench_{index}.wav", io.BytesIO(b"\0" * 1024), "audio/wav")}
+    response = await client.post("/api/v1/transcribe", files=files)
+    response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def run_async_path(requests: int) -> float:
+    """Time N concurrent uploads through the async routes."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(_upload(client, i) for i in range(requests)))
+        return time.perf_counter() - start
+
+
+async def run_blocking_path(requests: int, filename: str) -> float:
+    """Time N concurrent calls to the blocking sync service method."""
+
+    async def call():
+        routes.audio_service.transcribe_audio(filename)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    # httpx's ASGI transport does not run the lifespan, so build the services here
+    routes.init_services()
+    audio_service = routes.audio_service
+    audio_service.backend.client, audio_service.backend.async_client = _fake_clients(args.latency)
+    audio_service.cache = None  # every upload is identical; measure the provider path
+
+    os.makedirs("uploads", exist_ok=True)
+    sample = os.path.join("uploads", "bench_sample.wav")
+    with open(sample, "wb") as f:
+        f.write(b"\0" * 1024)
+
+    try:
+        blocking = asyncio.run(run_blocking_path(args.requests, sample))
+        concurrent = asyncio.run(run_async_path(args.requests))
+    finally:
+        os.remove(sample)
+
+    print(f"requests:          {args.requests}")
+    print(f"provider latency:  {args.latency:.2f}s")
+    print(f"blocking client:   {blocking:.2f}s ({blocking / args.latency:.1f}x one call)")
+    print(f"async client:      {concurrent:.2f}s ({concurrent / args.latency:.1f}x one call)")
+
+
+if __name__ == "__main__":
+    main()
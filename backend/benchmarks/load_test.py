@@ -0,0 +1,262 @@
+"""
+Load test for the API against a local stand-in for the OpenAI audio endpoints.
+
+Starts a stub provider (configurable latency, jitter and error rate) in this
+process and the real app from ``app/main.py`` under uvicorn in a child
+process pointed at it, then drives /transcribe, /process and
+/stream-transcribe at increasing concurrency. Reports throughput, p50/p95/p99
+latency, error rate and the server's peak RSS for each level. No API credits
+are spent.
+
+Usage (from the backend directory):
+    python -m benchmarks.load_test --concurrency 1 4 16 64 --requests 200 --latency 0.3 --jitter 0.1
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import httpx
+import numpy as np
+import uvicorn
+from scipy.io import wavfile
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+ENDPOINTS = {
+    "transcribe": "/api/v1/transcribe",
+    "process": "/api/v1/process",
+    "stream-transcribe": "/api/v1/stream-transcribe",
+}
+
+STUB_TEXT = "this is a benchmark transcription from the stub provider"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_recording(seconds: float, sample_rate: int = 16000) -> bytes:
+    """Speech-like mono test signal (modulated tones plus noise) as WAV bytes."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 3 * t))
+    voice = envelope * (0.3 * np.sin(2 * np.pi * 180 * t) + 0.1 * np.sin(2 * np.pi * 720 * t))
+    voice += 0.01 * rng.standard_normal(len(t))
+    buffer = io.BytesIO()
+    wavfile.write(buffer, sample_rate, (voice * 32767).astype(np.int16))
+    return buffer.getvalue()
+
+
+def stub_provider(latency: float, jitter: float, error_rate: float, error_status: int) -> Starlette:
+    """
+    Minimal stand-in for POST /v1/audio/{transcriptions,translations}.
+
+    Each request waits ``latency`` +/- ``jitter`` seconds, then fails with
+    ``error_status`` with probability ``error_rate``. Streaming requests get
+    the text as ``transcript.text.delta`` events spread over the wait.
+    """
+
+    async def audio(request: Request):
+        form = await request.form()
+        delay = max(latency + random.uniform(-jitter, jitter), 0.0)
+        if random.random() < error_rate:
+            await asyncio.sleep(delay)
+            return JSONResponse(
+                {"error": {"message": "stub provider error", "type": "server_error"}},
+                status_code=error_status,
+                headers={"retry-after-ms": "100"},
+            )
+
+        if form.get("stream") != "true":
+            await asyncio.sleep(delay)
+            return PlainTextResponse(STUB_TEXT)
+
+        async def events():
+            words = STUB_TEXT.split(" ")
+            for i, word in enumerate(words):
+                await asyncio.sleep(delay / len(words))
+                delta = word if i == 0 else " " + word
+                yield f"data: {json.dumps({'type': 'transcript.text.delta', 'delta': delta})}\n\n"
+            yield f"data: {json.dumps({'type': 'transcript.text.done', 'text': STUB_TEXT})}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return Starlette(routes=[
+        Route("/v1/audio/transcriptions", audio, methods=["POST"]),
+        Route("/v1/audio/translations", audio, methods=["POST"]),
+    ])
+
+
+def start_stub(app: Starlette, port: int) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def start_app(port: int, stub_port: int, upload_dir: str, verbose: bool = False) -> subprocess.Popen:
+    """Run app.main:app under uvicorn in a child process, pointed at the stub."""
+    env = dict(
+        os.environ,
+        OPENAI_API_KEY="benchmark",
+        OPENAI_BASE_URL=f"http://127.0.0.1:{stub_port}/v1",
+        UPLOAD_DIR=upload_dir,
+        # Every request uploads the same audio; measure the full path, not the cache
+        CACHE_ENABLED="false",
+        RATE_LIMIT_REQUESTS_PER_MINUTE="0",
+        RETRY_BASE_DELAY="0.1",
+        METRICS_ENABLED=os.environ.get("METRICS_ENABLED", "true"),
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        env=env,
+        stdout=None if verbose else subprocess.DEVNULL,
+        stderr=None if verbose else subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/api/v1/health", timeout=1).raise_for_status()
+            return process
+        except httpx.HTTPError:
+            if process.poll() is not None:
+                raise RuntimeError("App server exited during startup")
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("App server did not start")
+
+
+def peak_rss_mb(pid: int) -> Optional[float]:
+    """Peak resident set size of a running process (Linux only)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+async def one_request(client: httpx.AsyncClient, path: str, audio: bytes) -> float:
+    # Distinct names, as from real clients (the routes name temp files after the upload)
+    files = {"file": (f"bench_{uuid.uuid4().hex}.wav", audio, "audio/wav")}
+    start = time.perf_counter()
+    if path.endswith("stream-transcribe"):
+        async with client.stream("POST", path, files=files) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line == "event: error":
+                    raise RuntimeError("stream reported an error")
+    else:
+        response = await client.post(path, files=files)
+        response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def run_level(base_url: str, path: str, audio: bytes, concurrency: int, requests: int) -> Dict:
+    """Send ``requests`` uploads with at most ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker(client: httpx.AsyncClient):
+        nonlocal errors
+        async with semaphore:
+            try:
+                latencies.append(await one_request(client, path, audio))
+            except Exception:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=300, limits=limits) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(requests)))
+        elapsed = time.perf_counter() - start
+
+    percentiles = np.percentile(latencies, [50, 95, 99]) if latencies else [float("nan")] * 3
+    return {
+        "throughput": len(latencies) / elapsed,
+        "p50": percentiles[0],
+        "p95": percentiles[1],
+        "p99": percentiles[2],
+        "error_rate": errors / requests,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--endpoints", nargs="+", choices=list(ENDPOINTS), default=list(ENDPOINTS))
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4, 16, 64])
+    parser.add_argument("--requests", type=int, default=100, help="requests per concurrency level")
+    parser.add_argument("--seconds", type=float, default=10, help="length of the test recording")
+    parser.add_argument("--latency", type=float, default=0.3, help="stub provider latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.1, help="uniform +/- jitter on the latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of provider calls that fail")
+    parser.add_argument("--error-status", type=int, default=500, help="status for failed provider calls")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="show the app server's logs")
+    parser.add_argument("--output", help="also write the results as JSON, for comparing runs")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    audio = make_recording(args.seconds)
+    stub_port, app_port = free_port(), free_port()
+    results = []
+    stub = start_stub(stub_provider(args.latency, args.jitter, args.error_rate, args.error_status), stub_port)
+
+    with tempfile.TemporaryDirectory() as upload_dir:
+        app = start_app(app_port, stub_port, upload_dir, args.verbose)
+        try:
+            print(f"provider: {args.latency:.2f}s +/- {args.jitter:.2f}s, error rate {args.error_rate:.0%}; "
+                  f"{args.seconds:.0f}s recording ({len(audio) / 1024:.0f} KiB)")
+            print(f"{'endpoint':<18} {'conc':>5} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'errors':>7} {'peak RSS':>9}")
+            for name in args.endpoints:
+                for concurrency in args.concurrency:
+                    result = asyncio.run(run_level(
+                        f"http://127.0.0.1:{app_port}", ENDPOINTS[name], audio, concurrency, args.requests
+                    ))
+                    rss = peak_rss_mb(app.pid)
+                    results.append(dict(result, endpoint=name, concurrency=concurrency, peak_rss_mb=rss))
+                    print(
+                        f"{name:<18} {concurrency:>5} {result['throughput']:>8.1f} "
+                        f"{result['p50']:>7.3f}s {result['p95']:>7.3f}s {result['p99']:>7.3f}s "
+                        f"{result['error_rate']:>7.1%} {f'{rss:.0f} MiB' if rss else 'n/a':>9}"
+                    )
+        finally:
+            app.terminate()
+            app.wait()
+            stub.should_exit = True
+
+    # Fallback where /proc isn't available: peak RSS of the (now exited) server
+    if peak_rss_mb(os.getpid()) is None:
+        maxrss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+        print(f"server peak RSS: {maxrss / scale:.0f} MiB")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
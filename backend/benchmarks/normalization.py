@@ -0,0 +1,95 @@
+"""
+Upload normalization benchmark.
+
+Transcribes a synthetic 44.1 kHz stereo WAV with preprocessing off (the raw
+upload is sent) and on (16 kHz mono normalization, plus silence trimming if
+VAD_ENABLED), against a fake provider whose latency is a fixed round trip plus upload
+time at a given bandwidth, and reports bytes sent and end-to-end latency.
+
+Usage (from the backend directory):
+    python -m benchmarks.normalization --seconds 180 --bandwidth-mbps 20
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ["TRANSCRIPTION_BACKEND"] = "openai"  # the fake provider replaces the OpenAI clients
+
+import numpy as np
+from scipy.io import wavfile
+
+from app.core.config import settings
+from app.services.audio_service import AudioService
+
+
+def make_recording(path: str, seconds: float, sample_rate: int = 44100) -> None:
+    """Write a speech-like stereo test signal (modulated tones plus noise)."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 3 * t))
+    voice = envelope * (0.3 * np.sin(2 * np.pi * 180 * t) + 0.1 * np.sin(2 * np.pi * 720 * t))
+    left = voice + 0.01 * rng.standard_normal(len(t))
+    right = voice + 0.01 * rng.standard_normal(len(t))
+    stereo = np.stack([left, right], axis=1)
+    wavfile.write(path, sample_rate, (stereo * 32767).astype(np.int16))
+
+
+def fake_client(round_trip: float, bandwidth_mbps: float, sent: list):
+    async def create(**kwargs):
+        name, content = kwargs["file"]
+        sent.append(len(content))
+        await asyncio.sleep(round_trip + len(content) * 8 / (bandwidth_mbps * 1e6))
+        return "benchmark transcription"
+
+    return SimpleNamespace(audio=SimpleNamespace(transcriptions=SimpleNamespace(create=create)))
+
+
+async def run(service: AudioService, path: str, normalize: bool, vad: bool):
+    # With both off nothing is decoded or re-encoded: the raw WAV goes out
+    settings.normalize_audio = normalize
+    settings.vad_enabled = normalize and vad
+    start = time.perf_counter()
+    await service.transcribe_audio_async(path)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=180)
+    parser.add_argument("--bandwidth-mbps", type=float, default=20)
+    parser.add_argument("--round-trip", type=float, default=0.3)
+    args = parser.parse_args()
+
+    # Keep the whole file in one request
+    settings.chunk_threshold_bytes = 1 << 40
+    settings.chunk_max_seconds = float("inf")
+    vad = settings.vad_enabled
+    service = AudioService()
+    service.cache = None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "recording.wav")
+        make_recording(path, args.seconds)
+
+        results = {}
+        for normalize in (False, True):
+            sent = []
+            service.backend.async_client = fake_client(args.round_trip, args.bandwidth_mbps, sent)
+            elapsed = asyncio.run(run(service, path, normalize, vad))
+            results[normalize] = (sent[0], elapsed)
+
+    print(f"recording:        {args.seconds:.0f}s, 44.1 kHz stereo WAV")
+    print(f"uplink:           {args.bandwidth_mbps:.0f} Mbit/s, {args.round_trip:.2f}s round trip")
+    for normalize, label in ((False, "original"), (True, "preprocessed")):
+        size, elapsed = results[normalize]
+        print(f"{label + ':':<17} {size / 1e6:7.2f} MB sent, {elapsed:.2f}s end to end")
+    ratio = results[False][0] / results[True][0]
+    print(f"bytes reduction:  {ratio:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
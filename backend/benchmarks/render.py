@@ -0,0 +1,104 @@
+"""
+Deck rendering benchmark.
+
+Renders synthetic decks (N slides with body text, an image suggestion and
+speaker notes) to HTML and PDF and reports decks per second. PDF export is
+measured with pages laid out in-process and in the process pool, and with
+a cold page cache, a warm one and one slide edited between exports.
+
+Usage (from the backend directory):
+    python -m benchmarks.render --slides 12 --decks 200 --workers 4
+"""
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from app.core.config import settings
+from app.models.schemas import DeckResponse, Slide, SlideImage
+from app.services.cache_service import ResultCache
+from app.services.renderer import DeckRenderer
+
+
+def make_deck(index: int, slides: int) -> DeckResponse:
+    """A deck with realistic amounts of text per slide, unique per index."""
+    return DeckResponse(
+        title=f"Quarterly review {index}",
+        transcript="",
+        style={"tone": "confident", "font": "Inter"},
+        slides=[
+            Slide(
+                title=f"Deck {index}, topic {number}: growth across regions",
+                bullets=[f"Point {i} about regional growth and what drives it" for i in range(4)],
+                content=[
+                    "Revenue grew steadily across every region this quarter, led by new customers in the west.",
+                    "Retention improved as onboarding got shorter and support response times fell by half.",
+                    "We expect the trend to continue as the new pricing rolls out next quarter.",
+                ],
+                image=SlideImage(kind="diagram", description="Bar chart of revenue by region", query="revenue chart"),
+                notes=" ".join(["Walk through the numbers region by region and call out the outliers."] * 8),
+            )
+            for number in range(slides)
+        ],
+    )
+
+
+def edit_one_slide(deck: DeckResponse) -> DeckResponse:
+    slides = list(deck.slides)
+    slides[len(slides) // 2] = slides[len(slides) // 2].model_copy(update={"bullets": ["Edited point"]})
+    return deck.model_copy(update={"slides": slides})
+
+
+async def collect(stream) -> int:
+    size = 0
+    async for chunk in stream:
+        size += len(chunk)
+    return size
+
+
+async def bench(name: str, decks, render) -> None:
+    start = time.perf_counter()
+    size = 0
+    for deck in decks:
+        size += await render(deck)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40} {len(decks) / elapsed:>10.1f} decks/s  {size / len(decks) / 1024:>8.1f} KB/deck")
+
+
+async def run(args) -> None:
+    decks = [make_deck(i, args.slides) for i in range(args.decks)]
+    edited = [edit_one_slide(deck) for deck in decks]
+    print(f"{args.decks} decks x {args.slides} slides, notes pages included in PDF\n")
+
+    uncached = DeckRenderer(cache=None, pdf_workers=args.workers)
+    cached = DeckRenderer(cache=ResultCache(max_entries=args.decks * args.slides * 4), pdf_workers=args.workers)
+
+    await bench("html (streamed)", decks, lambda d: collect(uncached.stream_html(d)))
+
+    async def pdf(renderer, deck):
+        return len(await renderer.render_pdf(deck, notes=True))
+
+    settings.render_pdf_parallel_min_pages = 10 ** 9
+    await bench("pdf, in-process, no cache", decks, lambda d: pdf(uncached, d))
+    settings.render_pdf_parallel_min_pages = 1
+    await bench(f"pdf, {uncached.pdf_workers} workers, no cache", decks, lambda d: pdf(uncached, d))
+    await bench(f"pdf, {cached.pdf_workers} workers, cold cache", decks, lambda d: pdf(cached, d))
+    await bench("pdf, warm cache", decks, lambda d: pdf(cached, d))
+    await bench("pdf, one slide edited", edited, lambda d: pdf(cached, d))
+
+    uncached.close()
+    cached.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--slides", type=int, default=12)
+    parser.add_argument("--decks", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=0, help="PDF worker processes (0 for one per CPU)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
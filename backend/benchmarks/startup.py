@@ -0,0 +1,90 @@
+"""
+Cold start benchmark.
+
+Starts the API in fresh interpreters and times importing ``app.main``,
+running the lifespan startup (building the services, starting the job
+workers) and serving the first request, then lists which heavy modules had
+been loaded by then. With ``--top`` it also reports the slowest imports
+from ``python -X importtime``.
+
+Usage (from the backend directory):
+    python -m benchmarks.startup --runs 5 --top 10
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("openai", "scipy.signal", "scipy.io", "sounddevice", "soundfile", "faster_whisper")
+
+CHILD = """
+import asyncio, json, sys, time
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+import httpx
+
+async def main():
+    async with app.router.lifespan_context(app):
+        ready = time.perf_counter()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            (await client.get("/api/v1/health")).raise_for_status()
+        return ready, time.perf_counter()
+
+ready, served = asyncio.run(main())
+print(json.dumps({
+    "import": imported - start,
+    "startup": ready - imported,
+    "first_request": served - ready,
+    "total": served - start,
+    "loaded": [name for name in %r if name in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def run_child(args) -> str:
+    result = subprocess.run([sys.executable, *args], capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        raise SystemExit(f"Benchmark child failed:\n{result.stderr}")
+    return result.stdout if args[0] == "-c" else result.stderr
+
+
+def slowest_imports(top: int):
+    """Third-party packages by cumulative import time (microseconds)."""
+    totals = {}
+    for line in run_child(["-X", "importtime", "-c", "import app.main"]).splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            package = name.strip().split(".")[0]
+            if package == "app" or package in sys.stdlib_module_names:
+                continue
+            totals[package] = max(totals.get(package, 0), int(cumulative))
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=0, help="Also list the N slowest top-level imports")
+    args = parser.parse_args()
+
+    runs = [json.loads(run_child(["-c", CHILD]).strip().splitlines()[-1]) for _ in range(args.runs)]
+
+    print(f"{args.runs} cold starts (median / min, seconds)\n")
+    for phase in ("import", "startup", "first_request", "total"):
+        values = [run[phase] for run in runs]
+        print(f"{phase:<15} {statistics.median(values):>8.3f} {min(values):>8.3f}")
+    print(f"\nheavy modules loaded at first request: {', '.join(runs[-1]['loaded']) or 'none'}")
+
+    if args.top:
+        print("\nslowest imports of app.main:")
+        for package, microseconds in slowest_imports(args.top):
+            print(f"  {package:<24} {microseconds / 1e6:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
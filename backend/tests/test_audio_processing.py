@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from app.services.audio_processing import encode_audio, encode_wav, probe_duration, trim_silence
+
+SAMPLE_RATE = 16000
+
+
+def speech_like(seconds: float, amplitude: float = 0.05) -> np.ndarray:
+    """Voiced 150 Hz harmonics in 4 Hz syllables, with a short pause every 2 s."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    envelope = np.abs(np.sin(2 * np.pi * 2 * t)) * ((t % 2) < 1.7)
+    voice = sum(np.sin(2 * np.pi * 150 * k * t) / k for k in range(1, 6))
+    return amplitude * envelope * voice
+
+
+def with_noise(samples: np.ndarray, noise: float, pad_seconds: float = 15.0) -> np.ndarray:
+    pad = np.zeros(int(pad_seconds * SAMPLE_RATE))
+    clip = np.concatenate([pad, samples, pad])
+    rng = np.random.default_rng(0)
+    return (clip + noise * rng.standard_normal(len(clip))).astype(np.float32)
+
+
+@pytest.mark.parametrize("noise", [0.0, 1e-4, 1e-3, 5e-3])
+def test_trim_silence_removes_noise_around_speech(noise):
+    clip = with_noise(speech_like(30), noise)
+
+    trimmed = len(clip) - len(trim_silence(clip, SAMPLE_RATE))
+
+    # 30 s of padding; the VAD keeps a little around the speech
+    assert trimmed / SAMPLE_RATE > 29
+
+
+@pytest.mark.parametrize("amplitude", [0.004, 0.008, 0.3])
+def test_trim_silence_keeps_quiet_recordings(amplitude):
+    t = np.arange(5 * SAMPLE_RATE) / SAMPLE_RATE
+    clip = (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+    assert len(trim_silence(clip, SAMPLE_RATE)) == len(clip)
+
+
+def test_trim_silence_finds_nothing_in_digital_silence():
+    assert len(trim_silence(np.zeros(3 * SAMPLE_RATE, dtype=np.float32), SAMPLE_RATE)) == 0
+
+
+def test_probe_duration_reads_the_header():
+    samples = np.zeros(7 * SAMPLE_RATE, dtype=np.float32)
+
+    assert probe_duration(encode_wav(samples, SAMPLE_RATE), "clip.wav") == 7.0
+    assert probe_duration(encode_audio(samples, SAMPLE_RATE, "clip.wav")[1], "clip.flac") == 7.0
+    assert probe_duration(b"not audio", "clip.webm") is None
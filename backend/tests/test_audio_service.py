@@ -0,0 +1,75 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.services import audio_service
+from app.services.audio_operations import process_file
+from app.services.audio_processing import encode_wav
+from app.services.audio_service import AudioService
+
+SAMPLE_RATE = 16000
+
+
+@pytest.fixture
+def service():
+    # Preprocessing needs no backend, cache or devices
+    return AudioService.__new__(AudioService)
+
+
+def speech_with_pauses(speech_seconds: float, pause_seconds: float) -> np.ndarray:
+    t = np.arange(int(speech_seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    speech = 0.1 * np.abs(np.sin(2 * np.pi * 2 * t)) * np.sin(2 * np.pi * 150 * t)
+    pause = np.zeros(int(pause_seconds * SAMPLE_RATE))
+    return np.concatenate([pause, speech, pause]).astype(np.float32)
+
+
+def fake_decoder(samples: np.ndarray):
+    return lambda content, name: (SAMPLE_RATE, samples)
+
+
+def test_trim_is_sent_even_if_larger_than_a_compressed_upload(service, monkeypatch):
+    # A webm/opus upload is far smaller than the FLAC it re-encodes to
+    monkeypatch.setattr(audio_service, "decode_audio", fake_decoder(speech_with_pauses(5, 5)))
+
+    prepared = service._preprocess_audio(("clip.webm", b"\0" * 1000))
+
+    assert prepared.audio_file[0] == "clip.flac"
+    assert prepared.trimmed_seconds > 9
+
+
+def test_short_trim_keeps_a_smaller_upload(service, monkeypatch):
+    monkeypatch.setattr(audio_service, "decode_audio", fake_decoder(speech_with_pauses(5, 0.1)))
+    monkeypatch.setattr(settings, "vad_min_trim_seconds", 1.0)
+
+    prepared = service._preprocess_audio(("clip.webm", b"\0" * 1000))
+
+    assert prepared.audio_file == ("clip.webm", b"\0" * 1000)
+    assert prepared.trimmed_seconds == 0.0
+
+
+class EchoBackend:
+    def model_name(self, operation):
+        return "model"
+
+    async def transcribe_async(self, prepared, prompt=None):
+        return "transcription"
+
+    async def translate_async(self, prepared):
+        return "translation"
+
+
+def test_process_decodes_and_preprocesses_once(service, monkeypatch):
+    service.backend = EchoBackend()
+    service.cache = None
+    decodes = []
+    decode = audio_service.decode_audio
+    monkeypatch.setattr(audio_service, "decode_audio", lambda *args: decodes.append(args) or decode(*args))
+    # Over chunk_max_seconds * MIN_BYTES_PER_SECOND, so its length is checked
+    content = encode_wav(speech_with_pauses(60, 1), SAMPLE_RATE)
+
+    response = asyncio.run(process_file(service, content, "clip.wav"))
+
+    assert (response.transcription, response.translation) == ("transcription", "translation")
+    assert len(decodes) == 1
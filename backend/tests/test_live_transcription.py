@@ -0,0 +1,38 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import routes
+from app.services.audio_service import AudioService
+from app.services.live_transcription import parse_sample_rate
+
+
+@pytest.mark.parametrize("value", [8000, 16000, 44100, 48000])
+def test_parse_sample_rate_accepts_supported_rates(value):
+    assert parse_sample_rate(value) == value
+
+
+@pytest.mark.parametrize("value", [1, -16000, 0, 7999, 48001, 10**9, 16000.5, "16000", True, None])
+def test_parse_sample_rate_rejects_other_values(value):
+    with pytest.raises(ValueError):
+        parse_sample_rate(value)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # The rejected session never reaches the provider
+    monkeypatch.setattr(routes, "audio_service", AudioService.__new__(AudioService))
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/api/v1")
+    with TestClient(app) as client:
+        yield client
+
+
+def test_invalid_sample_rate_gets_an_error(client):
+    with client.websocket_connect("/api/v1/ws/transcribe") as websocket:
+        websocket.send_json({"sample_rate": 1})
+
+        message = websocket.receive_json()
+
+    assert message["type"] == "error"
+    assert "sample_rate" in message["detail"]
@@ -0,0 +1,83 @@
+import time
+from email.utils import formatdate
+
+import pytest
+from starlette.datastructures import Headers
+
+from app.core.responses import is_not_modified, parse_range
+
+ETAG = '"1f-2a-400"'
+MTIME = 1_700_000_000.5
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=900-5000", (900, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=-5000", (0, 999)),
+        ("bytes=999-999", (999, 999)),
+        ("BYTES = 0-0", (0, 0)),
+    ],
+)
+def test_parse_range(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", ["items=0-99", "bytes=0-99,200-299", "bytes=abc", "bytes=-", "bytes=1-x", ""])
+def test_parse_range_falls_back_to_the_whole_file(header):
+    assert parse_range(header, 1000) is None
+
+
+@pytest.mark.parametrize(
+    "header, size",
+    [
+        ("bytes=1000-", 1000),
+        ("bytes=500-100", 1000),
+        ("bytes=-0", 1000),
+        ("bytes=-5", 0),
+        ("bytes=0-", 0),
+    ],
+)
+def test_parse_range_rejects_unsatisfiable_ranges(header, size):
+    with pytest.raises(ValueError):
+        parse_range(header, size)
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        (ETAG, True),
+        (f"W/{ETAG}", True),
+        (f'"other", {ETAG}', True),
+        ("*", True),
+        ('"other"', False),
+    ],
+)
+def test_is_not_modified_by_etag(if_none_match, expected):
+    assert is_not_modified(Headers({"if-none-match": if_none_match}), ETAG, MTIME) is expected
+
+
+@pytest.mark.parametrize(
+    "if_modified_since, expected",
+    [
+        (formatdate(MTIME, usegmt=True), True),
+        (formatdate(MTIME + 60, usegmt=True), True),
+        (formatdate(MTIME - 60, usegmt=True), False),
+        ("not a date", False),
+    ],
+)
+def test_is_not_modified_by_date(if_modified_since, expected):
+    assert is_not_modified(Headers({"if-modified-since": if_modified_since}), ETAG, MTIME) is expected
+
+
+def test_if_none_match_takes_precedence():
+    headers = Headers({"if-none-match": '"other"', "if-modified-since": formatdate(time.time(), usegmt=True)})
+
+    assert is_not_modified(headers, ETAG, MTIME) is False
+
+
+def test_no_validators_means_modified():
+    assert is_not_modified(Headers({}), ETAG, MTIME) is False
@@ -6,7 +6,7 @@ import AudioRecorder from '@/components/AudioRecorder';
 import AudioPlayer from '@/components/AudioPlayer';
 import TranscriptionDisplay from '@/components/TranscriptionDisplay';
 import FileUpload from '@/components/FileUpload';
-import { audioAPI } from '@/services/api';
+import { audioAPI, ProcessingResponse, TranscriptionResponse, TranslationResponse } from '@/services/api';
 
 // Helper function to create a proper file for API upload
 const createAudioFile = (blob: Blob): File => {
@@ -59,8 +59,9 @@ export default function Home() {
     
     try {
       const file = createAudioFile(audioBlob);
-      const result = await audioAPI.transcribeAudio(file);
-      setTranscription(result.transcription);
+      // Background job: long recordings are polled instead of hitting the request timeout
+      const { result } = await audioAPI.runJob<TranscriptionResponse>(file, 'transcribe');
+      setTranscription(result?.transcription ?? '');
     } catch (error) {
       setError('Failed to transcribe audio. Please try again.');
       console.error('Transcription error:', error);
@@ -77,8 +78,8 @@ export default function Home() {
     
     try {
       const file = createAudioFile(audioBlob);
-      const result = await audioAPI.translateAudio(file);
-      setTranslation(result.translation);
+      const { result } = await audioAPI.runJob<TranslationResponse>(file, 'translate');
+      setTranslation(result?.translation ?? '');
     } catch (error) {
       setError('Failed to translate audio. Please try again.');
       console.error('Translation error:', error);
@@ -95,9 +96,9 @@ export default function Home() {
     
     try {
       const file = createAudioFile(audioBlob);
-      const result = await audioAPI.processAudio(file);
-      setTranscription(result.transcription);
-      setTranslation(result.translation);
+      const { result } = await audioAPI.runJob<ProcessingResponse>(file, 'process');
+      setTranscription(result?.transcription ?? '');
+      setTranslation(result?.translation ?? '');
     } catch (error) {
       setError('Failed to process audio. Please try again.');
       console.error('Processing error:', error);
@@ -4,11 +4,14 @@ import { useState, useRef, useEffect } from 'react';
 import { Play, Pause, Volume2 } from 'lucide-react';
 
 interface AudioPlayerProps {
-  audioBlob: Blob;
+  // Local audio (a fresh recording or upload), or
+  audioBlob?: Blob;
+  // a server URL (audioAPI.audioUrl), streamed with range requests
+  src?: string;
   onError: (error: string) => void;
 }
 
-export default function AudioPlayer({ audioBlob, onError }: AudioPlayerProps) {
+export default function AudioPlayer({ audioBlob, src, onError }: AudioPlayerProps) {
   const [isPlaying, setIsPlaying] = useState(false);
   const [duration, setDuration] = useState(0);
   const [currentTime, setCurrentTime] = useState(0);
@@ -42,7 +45,7 @@ export default function AudioPlayer({ audioBlob, onError }: AudioPlayerProps) {
         audio.removeEventListener('ended', handleEnded);
       };
     }
-  }, [audioBlob]);
+  }, [audioBlob, src]);
 
   useEffect(() => {
     if (audioRef.current) {
@@ -80,6 +83,9 @@ export default function AudioPlayer({ audioBlob, onError }: AudioPlayerProps) {
 
   // Create blob URL with error handling
   const createBlobURL = () => {
+    if (src) {
+      return '';
+    }
     try {
       if (!audioBlob || audioBlob.size === 0) {
         console.error('Invalid audio blob:', audioBlob);
@@ -109,10 +115,10 @@ export default function AudioPlayer({ audioBlob, onError }: AudioPlayerProps) {
 
   return (
     <div className="space-y-4">
-      {blobURL && (
+      {(src || blobURL) && (
         <audio
           ref={audioRef}
-          src={blobURL}
+          src={src || blobURL}
           preload="metadata"
           onError={(e) => {
             console.error('Audio element error:', e);
@@ -7,6 +7,13 @@ const api = axios.create({
   timeout: 30000, // 30 seconds timeout for audio processing
 });
 
+// Deck generation can take as long as the backend's stage timeouts allow:
+// transcription (DECK_TRANSCRIBE_TIMEOUT_SECONDS, 300 s) then six dependent
+// text stages (DECK_STAGE_TIMEOUT_SECONDS, 60 s each), plus a minute for the
+// upload. Regenerating skips transcription, research and the outline.
+const DECK_TIMEOUT_MS = (300 + 6 * 60 + 60) * 1000;
+const REGENERATE_DECK_TIMEOUT_MS = (4 * 60 + 60) * 1000;
+
 // Request interceptor for logging
 api.interceptors.request.use(
   (config) => {
@@ -43,18 +50,97 @@ export interface TranscriptionResponse {
   transcription: string;
   duration?: number;
   language?: string;
+  trimmed_seconds?: number;
+  transcript_id?: number;
 }
 
 export interface TranslationResponse {
   translation: string;
   original_language?: string;
+  duration?: number;
+  trimmed_seconds?: number;
+  transcript_id?: number;
 }
 
 export interface ProcessingResponse {
   transcription: string;
   translation: string;
   duration?: number;
+  trimmed_seconds?: number;
   filename: string;
+  errors?: Record<string, string>;
+  transcript_id?: number;
+}
+
+export interface JobResponse<T = ProcessingResponse | TranscriptionResponse | TranslationResponse> {
+  job_id: string;
+  status: 'queued' | 'running' | 'completed' | 'failed';
+  operation: 'transcribe' | 'translate' | 'process';
+  filename?: string;
+  result?: T;
+  error?: string;
+  created_at: number;
+  completed_at?: number;
+  queue_depth?: number;
+}
+
+export interface TranscriptRecord {
+  id: number;
+  created_at: number;
+  operation: 'transcribe' | 'translate' | 'process' | 'stream' | 'record';
+  filename?: string;
+  transcription: string;
+  translation: string;
+  language?: string;
+  duration?: number;
+  // Search results only: matching text with the hits wrapped in **
+  snippet?: string;
+}
+
+export interface TranscriptListResponse {
+  items: TranscriptRecord[];
+  total: number;
+  limit: number;
+  offset: number;
+}
+
+export interface SlideImage {
+  kind: 'image' | 'icon' | 'diagram' | string;
+  description: string;
+  query: string;
+}
+
+export interface SlideOutline {
+  title: string;
+  bullets: string[];
+}
+
+export interface Slide {
+  title: string;
+  bullets: string[];
+  content: string[];
+  image?: SlideImage;
+  notes: string;
+}
+
+export interface DeckResponse {
+  title: string;
+  slides: Slide[];
+  outline: SlideOutline[];
+  transcript: string;
+  translated: boolean;
+  style?: Record<string, string>;
+  html?: string;
+  duration?: number;
+  timings?: Record<string, { start: number; end: number }>;
+  elapsed?: number;
+  memo?: Record<string, { hits: number; misses: number }>;
+}
+
+export interface LiveTranscriptionMessage {
+  type: 'partial' | 'final' | 'error';
+  text?: string;
+  detail?: string;
 }
 
 export const audioAPI = {
@@ -104,13 +190,155 @@ export const audioAPI = {
     return response.data as ProcessingResponse;
   },
 
-  // Stream transcribe audio
-  async streamTranscribeAudio(file: File) {
+  // Generate a slide deck from a spoken prompt
+  async generateDeck(file: File, translate: boolean = false) {
     const formData = new FormData();
     formData.append('file', file);
+    formData.append('translate', String(translate));
 
-    const response = await api.post('/api/v1/stream-transcribe', formData);
-    return response.data as TranscriptionResponse;
+    const response = await api.post('/api/v1/generate-deck', formData, { timeout: DECK_TIMEOUT_MS });
+    return response.data as DeckResponse;
+  },
+
+  // Render a deck as a standalone HTML presentation
+  async renderDeckHtml(deck: DeckResponse) {
+    const response = await api.post('/api/v1/render-deck', deck, { responseType: 'text' });
+    return response.data as string;
+  },
+
+  // Export a deck as PDF (optionally with a speaker notes page per slide)
+  async renderDeckPdf(deck: DeckResponse, notes: boolean = false) {
+    const response = await api.post('/api/v1/render-deck/pdf', deck, {
+      params: { notes },
+      responseType: 'blob',
+    });
+    return response.data as Blob;
+  },
+
+  // Rebuild a deck from its edited outline; unchanged slides are reused
+  async regenerateDeck(deck: DeckResponse, outline: SlideOutline[] = deck.outline) {
+    const response = await api.post('/api/v1/regenerate-deck', {
+      title: deck.title,
+      transcript: deck.transcript,
+      slides: outline,
+      translated: deck.translated,
+    }, { timeout: REGENERATE_DECK_TIMEOUT_MS });
+    return response.data as DeckResponse;
+  },
+
+  // Saved transcripts, newest first
+  async listTranscripts(limit = 20, offset = 0) {
+    const response = await api.get('/api/v1/transcripts', { params: { limit, offset } });
+    return response.data as TranscriptListResponse;
+  },
+
+  // Full-text search over saved transcripts, best matches first
+  async searchTranscripts(query: string, limit = 20, offset = 0) {
+    const response = await api.get('/api/v1/transcripts/search', { params: { q: query, limit, offset } });
+    return response.data as TranscriptListResponse;
+  },
+
+  async getTranscript(id: number) {
+    const response = await api.get(`/api/v1/transcripts/${id}`);
+    return response.data as TranscriptRecord;
+  },
+
+  // Stream transcribe audio (Server-Sent Events); onDelta receives text as it arrives
+  async streamTranscribeAudio(file: File, onDelta?: (delta: string) => void) {
+    const formData = new FormData();
+    formData.append('file', file);
+
+    const response = await fetch(`${API_BASE_URL}/api/v1/stream-transcribe`, {
+      method: 'POST',
+      body: formData,
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Stream transcription failed: ${response.status} ${response.statusText}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let transcription = '';
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const message = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+
+        const event = message.match(/^event: (.*)$/m)?.[1];
+        const data = JSON.parse(message.match(/^data: (.*)$/m)?.[1] ?? '{}');
+        if (event === 'delta') {
+          transcription += data.delta;
+          onDelta?.(data.delta);
+        } else if (event === 'done') {
+          return data as TranscriptionResponse;
+        } else if (event === 'error') {
+          throw new Error(data.detail);
+        }
+      }
+    }
+
+    return { transcription } as TranscriptionResponse;
+  },
+
+  // Submit a background job; returns immediately with a job id
+  async submitJob(file: File, operation: JobResponse['operation'] = 'process') {
+    const formData = new FormData();
+    formData.append('file', file);
+    formData.append('operation', operation);
+
+    const response = await api.post('/api/v1/jobs', formData);
+    return response.data as JobResponse;
+  },
+
+  // Get job status and result
+  async getJob(jobId: string) {
+    const response = await api.get(`/api/v1/jobs/${jobId}`);
+    return response.data as JobResponse;
+  },
+
+  // Submit a job and poll until it finishes (no single long-running request)
+  async runJob<T = ProcessingResponse>(
+    file: File,
+    operation: JobResponse['operation'] = 'process',
+    pollIntervalMs = 1000,
+  ): Promise<JobResponse<T>> {
+    let job = await audioAPI.submitJob(file, operation);
+    while (job.status === 'queued' || job.status === 'running') {
+      await new Promise((resolve) => setTimeout(resolve, pollIntervalMs));
+      job = await audioAPI.getJob(job.job_id);
+    }
+    if (job.status === 'failed') {
+      throw new Error(job.error || 'Job failed');
+    }
+    return job as JobResponse<T>;
+  },
+
+  // Live transcription over WebSocket: send 16-bit mono PCM with sendPcm, then stop()
+  openLiveTranscription(
+    onMessage: (message: LiveTranscriptionMessage) => void,
+    sampleRate = 16000,
+  ) {
+    const socket = new WebSocket(`${API_BASE_URL.replace(/^http/, 'ws')}/api/v1/ws/transcribe`);
+    socket.binaryType = 'arraybuffer';
+    socket.onopen = () => socket.send(JSON.stringify({ sample_rate: sampleRate }));
+    socket.onmessage = (event) => onMessage(JSON.parse(event.data) as LiveTranscriptionMessage);
+
+    return {
+      socket,
+      sendPcm(pcm: Int16Array) {
+        if (socket.readyState === WebSocket.OPEN) socket.send(pcm.buffer);
+      },
+      stop() {
+        if (socket.readyState === WebSocket.OPEN) socket.send(JSON.stringify({ type: 'stop' }));
+      },
+    };
   },
 
   // Play audio file
@@ -119,6 +347,13 @@ export const audioAPI = {
     return response.data;
   },
 
+  // URL for streaming a recording straight into an <audio> element. The
+  // browser fetches byte ranges as it plays and seeks, and revalidates
+  // replays with the ETag instead of downloading the file again.
+  audioUrl(filename: string) {
+    return `${API_BASE_URL}/api/v1/download/${encodeURIComponent(filename)}?inline=true`;
+  },
+
   // Download audio file
   async downloadAudio(filename: string) {
     const response = await api.get(`/api/v1/download/${filename}`, {